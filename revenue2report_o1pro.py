@@ -4,32 +4,27 @@ import datetime
 import re
 import time
 import io
+import os
+import posixpath
+import random
+import sys
 import zipfile
-import requests as req
 import unicodedata
 import pandas as pd
 import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import gspread
 from google.oauth2.service_account import Credentials
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
-
-# gspread-formatting
-from gspread_formatting import (
-    format_cell_range,
-    CellFormat,
-    Color,
-    TextFormat,
-    set_column_width,
-    set_row_height
-)
+import google_auth_httplib2
+import httplib2
 
 from collections import defaultdict
-
-# (신규) openpyxl
-import openpyxl
-from openpyxl import Workbook
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
 
 # ========== [1] 인증/초기설정 =============
@@ -38,10 +33,12 @@ SCOPES = [
     "https://www.googleapis.com/auth/spreadsheets",
 ]
 
+@st.cache_resource
 def get_credentials_from_secrets(which: str = "A") -> Credentials:
     """
     which="A"  -> st.secrets["google_service_account_a"] 사용
     which="B"  -> st.secrets["google_service_account_b"] 사용
+    (st.cache_resource: 세션/재실행마다 다시 파싱하지 않고 토큰도 재사용)
     """
     if which.upper() == "A":
         service_account_info = st.secrets["google_service_account_a"]
@@ -55,70 +52,134 @@ def get_credentials_from_secrets(which: str = "A") -> Credentials:
     return credentials
 
 
+def build_service(name: str, version: str, credentials: Credentials):
+    """
+    googleapiclient 서비스 생성
+    - discovery 문서는 패키지 내장본 사용 (static_discovery, 네트워크 조회 없음)
+    - discovery 파일 캐시 조회/경고 생략 (cache_discovery=False)
+    """
+    return build(name, version, credentials=credentials,
+                 cache_discovery=False, static_discovery=True)
+
+
+@st.cache_resource
+def get_clients(which: str = "A"):
+    """
+    (gspread 클라이언트, drive 서비스, sheets 서비스)를 한 번만 만들어 재사용
+    - 섹션/재실행마다 authorize·build 를 반복하지 않음 (HTTP 연결도 재사용)
+    """
+    creds = get_credentials_from_secrets(which)
+    return (gspread.authorize(creds),
+            build_service("drive", "v3", creds),
+            build_service("sheets", "v4", creds))
+
+
 # ----------------------------------------------------------------
 # 검증(비교) 및 기타 헬퍼
 # ----------------------------------------------------------------
 
-def open_sheet_with_retry(gc, sheet_name: str, max_attempts=3):
-    for attempt in range(1, max_attempts+1):
+# 이름으로 한 번 연 구글시트의 파일 ID 캐시 {파일 이름: ID} (세션 내 재실행 시 Drive 이름 검색 생략)
+SHEET_ID_CACHE_KEY = "sheet_ids"
+
+
+def open_cached(gc, sheet_name: str, sheet_id: Optional[str] = None, max_attempts: int = 5):
+    """
+    sheet_id(이전에 연 파일 ID)가 있으면 open_by_key(직접 조회), 없으면 gc.open(이름 검색 = Drive files.list 1회 추가)
+    - 캐시된 ID의 파일이 지워졌으면(SpreadsheetNotFound) 이름 검색으로 다시 찾음
+    """
+    if sheet_id:
         try:
-            sh = gc.open(sheet_name)
-            return sh  # 성공시 반환
-        except gspread.exceptions.APIError as e:
-            # 만약 500 Internal Error라면 잠시 쉬고 재시도
-            # (HTTP 500 말고 다른 에러는 그대로 raise)
-            if "500" in str(e):
-                print(f"[WARN] 구글 스프레드시트 500에러 - {sheet_name} / 재시도 {attempt}회")
-                time.sleep(2)
-                continue
-            else:
-                # 500 외 API 에러는 재시도해봤자 의미 없을 가능성이 크므로 즉시 중단
-                raise e
-    # 여기까지 왔다는 것은 max_attempts번 시도해도 실패
-    raise RuntimeError(f"구글시트 열기 실패: {sheet_name} (500 에러 {max_attempts}회)")
+            return call_with_backoff(gc.open_by_key, sheet_id, max_attempts=max_attempts)
+        except gspread.exceptions.SpreadsheetNotFound:
+            pass
+    return call_with_backoff(gc.open, sheet_name, max_attempts=max_attempts)
+
+
+def open_sheet_with_retry(gc, sheet_name: str, max_attempts=3):
+    """
+    gc.open(sheet_name) - 429/5xx 등 일시적 오류일 때만 지수 백오프 후 재시도 (그 외 에러는 즉시 raise)
+    - 세션에 캐시된 파일 ID가 있으면 open_by_key 사용 (SHEET_ID_CACHE_KEY)
+    """
+    sheet_ids = st.session_state.setdefault(SHEET_ID_CACHE_KEY, {})
+    sh = open_cached(gc, sheet_name, sheet_ids.get(sheet_name), max_attempts=max_attempts)
+    sheet_ids[sheet_name] = sh.id
+    return sh
 
 
 def debug_hex(s: str) -> str:
     """문자열 s의 각 문자를 유니코드 코드포인트(\\uXXXX) 형태로 변환."""
-    return " ".join(f"\\u{ord(ch):04X}" for ch in s)
+    return " ".join(map("\\u{:04X}".format, map(ord, s)))
+
+
+@st.cache_resource
+def _unicode_category_re(major: str) -> "re.Pattern":
+    """
+    유니코드 대분류(major, 예: "C", "Z")에 속하는 모든 코드포인트의 문자 클래스 정규식
+    - 실행 중인 파이썬의 unicodedata 버전 기준으로 0..sys.maxunicode 전체를 1회 스캔 (미할당 Cn 포함)
+    - 스캔 비용(~0.5초)이 있어 cache_resource로 서버 프로세스당 1회만 생성
+    """
+    code_points = [cp for cp in range(sys.maxunicode + 1) if unicodedata.category(chr(cp))[0] == major]
+    ranges = []
+    for _, run in itertools.groupby(enumerate(code_points), lambda p: p[1] - p[0]):
+        run = list(run)
+        first, last = run[0][1], run[-1][1]
+        ranges.append(f"\\U{first:08x}" if first == last else f"\\U{first:08x}-\\U{last:08x}")
+    return re.compile("[" + "".join(ranges) + "]")
+
+
+# 유니코드 제어문자(Category=C: Cc, Cf, Cs, Co, Cn) / 공백문자(Category=Z)를 한 번의 C 레벨 스캔으로 처리
+_CTRL_CHARS_RE = _unicode_category_re("C")
+_SPACE_CHARS_RE = _unicode_category_re("Z")
+
+# 숫자 문자열의 천 단위 콤마 제거용 변환표 ("1,234" -> "1234", str.translate 1회)
+_NO_COMMA = str.maketrans("", "", ",")
+
+# 소속 구분자(, & /)를 ','로 통일하는 변환표 (re.split 대신 translate + split)
+_SOSOK_SEP = str.maketrans("&/", ",,")
+
 
+def split_affiliations(sosok_str: str) -> List[str]:
+    """소속 문자열 -> 소속 코드 리스트 ("umag / fluxus" -> ["UMAG", "FLUXUS"])"""
+    parts = sosok_str.upper().translate(_SOSOK_SEP).split(",")
+    return [code for x in parts if (code := x.strip())]
 
+
+@lru_cache(maxsize=16384)
 def clean_artist_name(raw_name: str) -> str:
     """
     1) 유니코드 정규화(NFKC)
     2) 모든 제어문자(Category=C) 제거
-    3) \xa0, \u3000 같은 특수 공백 치환
+    3) \xa0, \u3000 같은 특수 공백(Category=Z) → ' ' 치환
     4) strip()
     """
-    import unicodedata
-    import re
-
     if not raw_name:
         return ""
+    # 이미 NFKC이고 제어문자/특수공백(isprintable()=False인 C/Z 범주)이 없으면 아래 처리가 모두 no-op -> strip만
+    #  (is_normalized는 Quick Check로 대부분 정규화 없이 판정, ASCII/완성형 한글 이름이 여기서 끝남)
+    if raw_name.isprintable() and unicodedata.is_normalized("NFKC", raw_name):
+        return raw_name.strip()
 
-    # 1) 유니코드 정규화
     normalized = unicodedata.normalize('NFKC', raw_name)
+    no_ctrl = _CTRL_CHARS_RE.sub("", normalized)
+    return _SPACE_CHARS_RE.sub(" ", no_ctrl).strip()
+
+def highlight_boolean(val):
+    """검증표 match_ 칼럼 하이라이트 (True=초록, False=빨강)"""
+    if val is True:
+        return "background-color: #AAFFAA"
+    elif val is False:
+        return "background-color: #FFAAAA"
+    else:
+        return ""
 
-    # 2) "모든 제어문자" 제거 (제어문자: Cc, Cf, Cs, Co, Cn 등)
-    no_ctrl = "".join(ch for ch in normalized if not unicodedata.category(ch).startswith("C"))
-
-    # 3) 특수공백 치환 + strip
-    replaced = []
-    for ch in no_ctrl:
-        # ch가 Category=Z 공백인지
-        if unicodedata.category(ch).startswith("Z"):
-            replaced.append(" ")  # 전부 ' '로 치환
-        else:
-            replaced.append(ch)
-    no_ctrl = "".join(replaced)
-
-    # 4) 특수공백 치환
-    no_ctrl = no_ctrl.replace('\xa0',' ').replace('\u3000',' ')
 
-    # 5) strip
-    cleaned = no_ctrl.strip()
+def round_int_columns(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    """금액/율 칼럼을 정수(Int64)로 한 번에 변환 (Styler.format 셀 단위 포맷 콜백 대신)"""
+    present = [c for c in columns if c in df.columns]
+    if present:
+        df[present] = df[present].apply(pd.to_numeric, errors="coerce").round().astype("Int64")
+    return df
 
-    return cleaned
 
 def show_detailed_verification():
     check_dict = st.session_state.get("check_dict", {})
@@ -135,8 +196,6 @@ def show_detailed_verification():
         if not rows:
             st.info("정산서 검증 데이터가 없습니다.")
         else:
-            import pandas as pd
-
             # 1) rows를 아티스트별로 묶고, "공제내역" + "수익배분율"을 하나로 합침
             #    { 아티스트명 : {"공제내역": {...}, "수익배분율": {...}} }
             merged_dict = {}
@@ -193,27 +252,16 @@ def show_detailed_verification():
 
             # (E) 부울컬럼 하이라이트
             bool_cols = [c for c in df.columns if c.startswith("match_")]
-            def highlight_boolean(val):
-                if val is True:
-                    return "background-color: #AAFFAA"
-                elif val is False:
-                    return "background-color: #FFAAAA"
-                else:
-                    return ""
-
-            # (F) 일부 숫자 칼럼에는 포맷 지정
-            format_dict = {
-                "원본_곡비": "{:.0f}", "정산서_곡비": "{:.0f}",
-                "원본_공제금액": "{:.0f}", "정산서_공제금액": "{:.0f}",
-                "원본_공제후잔액": "{:.0f}", "정산서_공제후잔액": "{:.0f}",
-                "원본_정산율(%)": "{:.0f}", "정산서_정산율(%)": "{:.0f}",
-            }
 
-            st.dataframe(
-                df.style
-                .format(format_dict)
-                .applymap(highlight_boolean, subset=bool_cols)
-            )
+            # (F) 일부 숫자 칼럼은 정수로 변환해서 표시
+            round_int_columns(df, [
+                "원본_곡비", "정산서_곡비",
+                "원본_공제금액", "정산서_공제금액",
+                "원본_공제후잔액", "정산서_공제후잔액",
+                "원본_정산율(%)", "정산서_정산율(%)",
+            ])
+
+            st.dataframe(df.style.map(highlight_boolean, subset=bool_cols))
 
 
     with tabB:
@@ -222,7 +270,6 @@ def show_detailed_verification():
         if not rows:
             st.info("세부매출 검증 데이터가 없습니다.")
         else:
-            import pandas as pd
             df = pd.DataFrame(rows)
 
             # 이하 기존 replace 로직 / fluxus_song 요약행 삽입 등 ...
@@ -295,22 +342,12 @@ def show_detailed_verification():
             # 3) boolean highlighting
             bool_cols = [c for c in df_result.columns if c.startswith("match_")]
 
-            def highlight_boolean(val):
-                if val is True:
-                    return "background-color: #AAFFAA"
-                elif val is False:
-                    return "background-color: #FFAAAA"
-                else:
-                    return ""
-
-            # (정수/금액) 칼럼 포맷
-            int_columns = ["원본_매출액", "정산서_매출액"]
-            format_dict = {col: "{:.0f}" for col in int_columns if col in df_result.columns}
+            # (정수/금액) 칼럼은 정수로 변환해서 표시
+            round_int_columns(df_result, ["원본_매출액", "정산서_매출액"])
 
             # 4) 아티스트/앨범/서비스명 폭 넓히기
             df_styled = (
                 df_result.style
-                .format(format_dict)
                 .map(highlight_boolean, subset=bool_cols)
                 .set_properties(
                     **{
@@ -349,6 +386,7 @@ def normalized_month(m):
 def almost_equal(a, b, tol=1):
     return abs(a - b) < tol
 
+@lru_cache(maxsize=None)
 def get_next_month_str(ym: str) -> str:
     year = int(ym[:4])
     month = int(ym[4:])
@@ -358,6 +396,7 @@ def get_next_month_str(ym: str) -> str:
         month = 1
     return f"{year}{month:02d}"
 
+@lru_cache(maxsize=None)
 def get_prev_month_str(ym: str) -> str:
     """
     'YYYYMM' → 바로 직전 달 'YYYYMM'
@@ -371,114 +410,326 @@ def get_prev_month_str(ym: str) -> str:
         month = 12
     return f"{year}{month:02d}"
 
-def create_new_spreadsheet(filename: str, folder_id: str, drive_svc, attempt=1, max_attempts=5) -> str:
-    try:
+def create_new_spreadsheet(filename: str, folder_id: str, drive_svc, *, reuse_existing: bool = False) -> str:
+    """
+    폴더에 새 스프레드시트 생성 후 file ID 반환
+    - reuse_existing=True 일 때만 같은 이름 파일을 먼저 찾아 재사용 (files.list 1회 추가)
+    - userRateLimitExceeded(403) 등은 execute_with_backoff에서 대기 후 재시도
+    """
+    if reuse_existing:
         query = (
             f"parents in '{folder_id}' and trashed=false "
             f"and name='{filename}'"
         )
-        response = drive_svc.files().list(
+        response = execute_with_backoff(drive_svc.files().list(
             q=query,
             fields="files(id, name)",
             pageSize=50
-        ).execute()
+        ))
         files = response.get("files", [])
         if files:
             existing_file_id = files[0]["id"]
             print(f"파일 '{filename}' 이미 존재 -> 재사용 (ID={existing_file_id})")
             return existing_file_id
 
-        file_metadata = {
-            "name": filename,
-            "mimeType": "application/vnd.google-apps.spreadsheet",
-            "parents": [folder_id],
-        }
-        file = drive_svc.files().create(body=file_metadata).execute()
-        return file["id"]
-
-    except HttpError as e:
-        if (e.resp.status == 403 and
-            "userRateLimitExceeded" in str(e) and
-            attempt < max_attempts):
-            sleep_sec = 2 ** attempt
-            print(f"[WARN] userRateLimitExceeded -> {sleep_sec}초 후 재시도 ({attempt}/{max_attempts})")
-            time.sleep(sleep_sec)
-            return create_new_spreadsheet(filename, folder_id, drive_svc, attempt+1, max_attempts)
-        else:
-            raise e
+    file_metadata = {
+        "name": filename,
+        "mimeType": "application/vnd.google-apps.spreadsheet",
+        "parents": [folder_id],
+    }
+    file = execute_with_backoff(drive_svc.files().create(body=file_metadata))
+    return file["id"]
 
-def batch_add_sheets(spreadsheet_id, sheet_svc, list_of_sheet_titles):
-    meta = sheet_svc.spreadsheets().get(spreadsheetId=spreadsheet_id).execute()
-    existing_sheets = meta["sheets"]
-    existing_titles = [s["properties"]["title"] for s in existing_sheets]
+def batch_add_sheets(spreadsheet_id: str, sheet_svc, list_of_sheet_titles: List[str],
+                     source_sheet_ids: Optional[Dict[str, int]] = None) -> Dict[str, int]:
+    """
+    없는 탭만 일괄 생성
+    - source_sheet_ids: {탭 제목: 원본 sheetId} -> 해당 탭은 addSheet 대신 duplicateSheet(템플릿 복제)
+    - return: 새로 만든 탭 {제목: sheetId}
+    """
+    existing_titles = list_tab_titles(sheet_svc, spreadsheet_id)  # set -> 탭마다 O(1) 존재 확인
 
     missing = [t for t in list_of_sheet_titles if t not in existing_titles]
     if not missing:
         print("모든 시트가 이미 존재합니다.")
-        return
+        return {}
 
-    BATCH_SIZE = 30
+    source_sheet_ids = source_sheet_ids or {}
     requests_add = []
-    total_count = 0
-    
+    created = {}
+
+    def _collect(resp):
+        for rep in resp["replies"]:
+            sheet_props = (rep.get("addSheet") or rep["duplicateSheet"])["properties"]
+            created[sheet_props["title"]] = sheet_props["sheetId"]
+
     for title in missing:
-        requests_add.append({
-            "addSheet": {
-                "properties": {
-                    "title": title,
-                    "gridProperties": {
-                        "rowCount": 200,
-                        "columnCount": 8
+        if title in source_sheet_ids:
+            # 복제 탭도 addSheet처럼 맨 뒤에 순서대로 붙도록 위치 지정
+            requests_add.append({
+                "duplicateSheet": {
+                    "sourceSheetId": source_sheet_ids[title],
+                    "insertSheetIndex": len(existing_titles) + len(requests_add),
+                    "newSheetName": title
+                }
+            })
+        else:
+            requests_add.append({
+                "addSheet": {
+                    "properties": {
+                        "title": title,
+                        "gridProperties": {
+                            "rowCount": 200,
+                            "columnCount": 8
+                        }
                     }
                 }
-            }
-        })
+            })
+
+    # 생성 요청은 batchUpdate 1회 최대치(BATCH_UPDATE_CHUNK_SIZE) 단위로 묶어 전송 (대부분 1회 왕복)
+    for chunk in chunk_requests(requests_add):
+        resp = execute_with_backoff(sheet_svc.spreadsheets().batchUpdate(
+            spreadsheetId=spreadsheet_id,
+            body={"requests": chunk}
+        ))
+        _collect(resp)
+        print(f"addSheet 완료: {len(resp['replies'])}개 생성")
+
+    print(f"시트 생성 총 개수: {len(created)}")
+    for idx, (title, sheet_id) in enumerate(created.items()):
+        print(f" -> {idx} '{title}' (sheetId={sheet_id})")
+    return created
+
+
+# batchUpdate 요청 1개 / GridRange 타입 (요청 조립 헬퍼 공용)
+Request = Dict[str, Any]
+GridRange = Dict[str, int]
+
+# batchUpdate 1회당 최대 요청 수 (payload 크기/서버 처리 시간 제한 대응)
+BATCH_UPDATE_CHUNK_SIZE = 500
+
+
+def chunk_requests(requests: List[Request], chunk_size: int = BATCH_UPDATE_CHUNK_SIZE) -> Iterator[List[Request]]:
+    """
+    requests를 chunk_size 이하 묶음으로 나눈다.
+    mergeCells 바로 뒤에 오는 repeatCell(같은 범위 서식)이 다른 묶음으로
+    갈라지지 않도록, 경계가 mergeCells 직후이면 한 칸 앞에서 자른다.
+    """
+    start = 0
+    total = len(requests)
+    while start < total:
+        end = min(start + chunk_size, total)
+        if (end < total and end - start > 1
+                and "mergeCells" in requests[end - 1]
+                and "repeatCell" in requests[end]):
+            end -= 1
+        yield requests[start:end]
+        start = end
+
+
+# 병렬 전송 스레드 수
+BATCH_UPDATE_WORKERS = 4
+
+# 일시적 오류(쿼터 초과/서버 오류) - 이 경우에만 대기 후 재시도
+RETRYABLE_HTTP_STATUS = (429, 500, 502, 503, 504)
+
+
+def _error_status(e: Exception) -> Optional[int]:
+    """HttpError(googleapiclient) / APIError(gspread)의 HTTP 상태코드"""
+    if isinstance(e, HttpError):
+        return e.resp.status
+    return getattr(getattr(e, "response", None), "status_code", None)
+
+
+def _is_retryable(e: Exception) -> bool:
+    """일시적 오류 여부: 429/5xx(RETRYABLE_HTTP_STATUS), 또는 Drive의 403 (user)RateLimitExceeded"""
+    status = _error_status(e)
+    return status in RETRYABLE_HTTP_STATUS or (status == 403 and "RateLimitExceeded" in str(e))
+
+
+def call_with_backoff(fn, *args, max_attempts: int = 5, **kwargs):
+    """
+    구글 API 호출 fn(*args, **kwargs) 실행 (Sheets/Drive .execute(), gspread 메서드 공통)
+    일시적 오류(_is_retryable)이면 2^n초(최대 32초, +지터) 대기 후 재시도, 평소에는 대기 없이 바로 실행
+    """
+    for attempt in range(max_attempts):
+        try:
+            return fn(*args, **kwargs)
+        except (HttpError, gspread.exceptions.APIError) as e:
+            status = _error_status(e)
+            if not _is_retryable(e) or attempt == max_attempts - 1:
+                raise
+            wait = min(2 ** attempt, 32) + random.random()
+            print(f"[WARN] HTTP {status} -> {wait:.1f}초 후 재시도 ({attempt+1}/{max_attempts})")
+            time.sleep(wait)
+
+
+def execute_with_backoff(request, http=None, max_attempts: int = 5):
+    """googleapiclient 요청 실행 (call_with_backoff 사용)"""
+    return call_with_backoff(request.execute, http=http, max_attempts=max_attempts)
+
+
+def new_authorized_http(credentials):
+    """스레드 전용 http 객체 (httplib2.Http는 스레드 간 공유 불가)"""
+    return google_auth_httplib2.AuthorizedHttp(credentials, http=httplib2.Http())
+
+
+def sheet_range(title: str, a1: str = "") -> str:
+    """탭 제목(+A1 범위) -> values API range 문자열 ("'탭'!E2:G10")"""
+    quoted = "'" + title.replace("'", "''") + "'"
+    return f"{quoted}!{a1}" if a1 else quoted
+
+
+def list_tab_titles(sheet_svc, spreadsheet_id: str, http=None) -> Set[str]:
+    """탭 이름 집합 (spreadsheets.get을 탭 제목 필드만 받도록 fields 지정 -> Worksheet 객체/전체 메타데이터 불필요)"""
+    meta = execute_with_backoff(
+        sheet_svc.spreadsheets().get(spreadsheetId=spreadsheet_id, fields="sheets.properties.title"),
+        http=http
+    )
+    return {s["properties"]["title"] for s in meta.get("sheets", [])}
+
+
+def open_with_tab_titles(gc, sheet_svc, sheet_name: str, http=None, sheet_id: Optional[str] = None):
+    """
+    open_cached + list_tab_titles -> (Spreadsheet, {탭 이름})
+    - 스레드에서 호출할 때는 스레드 전용 gc/http 사용 (st.session_state는 메인 스레드에서만 읽고 씀)
+    """
+    sh = open_cached(gc, sheet_name, sheet_id)
+    return sh, list_tab_titles(sheet_svc, sh.id, http=http)
+
+
+def batch_get_all_values(sheet_svc, spreadsheet_id: str, titles: List[str], http=None) -> List[List[List[str]]]:
+    """
+    여러 탭의 전체 값을 values.batchGet 1번으로 읽기 (titles 순서대로 반환)
+    - get_all_values()와 같게 짧은 행은 ""로 채워 직사각형으로 맞춤
+    """
+    ranges = [sheet_range(t) for t in titles]
+    resp = execute_with_backoff(
+        sheet_svc.spreadsheets().values().batchGet(spreadsheetId=spreadsheet_id, ranges=ranges),
+        http=http
+    )
+    return [gspread.utils.fill_gaps(vr.get("values", [])) for vr in resp.get("valueRanges", [])]
+
+
+def batch_update_values(sheet_svc, spreadsheet_id: str, data: List[Dict[str, Any]],
+                        value_input_option: str = "USER_ENTERED", http=None) -> None:
+    """
+    여러 범위 값 쓰기를 values.batchUpdate 1번으로 전송 (gspread Worksheet 거치지 않음)
+    - data: [{"range": sheet_range(탭, "E2:G10"), "values": [[...], ...]}, ...]
+    """
+    execute_with_backoff(sheet_svc.spreadsheets().values().batchUpdate(
+        spreadsheetId=spreadsheet_id,
+        body={"valueInputOption": value_input_option, "data": data}
+    ), http=http)
+
+
+# 열 블록 값 쓰기에서 범위 1개당 최대 행 수 (큰 탭은 여러 범위로 잘라 같은 values.batchUpdate에 담음)
+VALUE_CHUNK_ROWS = 500
+
+
+def column_block_ranges(title: str, first_col: str, last_col: str, start_row: int,
+                        values: List[List[Any]], chunk_rows: int = VALUE_CHUNK_ROWS) -> List[Dict[str, Any]]:
+    """values(행 목록)를 chunk_rows행씩 나눈 batch_update_values용 data ("'탭'!E2:G501", "'탭'!E502:G1001", ...)"""
+    data = []
+    for i in range(0, len(values), chunk_rows):
+        chunk = values[i:i + chunk_rows]
+        r0 = start_row + i
+        data.append({"range": sheet_range(title, f"{first_col}{r0}:{last_col}{r0 + len(chunk) - 1}"), "values": chunk})
+    return data
+
+
+def request_sheet_id(request: Request) -> Optional[int]:
+    """요청 1개가 대상으로 하는 sheetId (찾지 못하면 None)"""
+    body = next(iter(request.values()))
+    if "sheetId" in body:
+        return body["sheetId"]
+    for key in ("range", "properties", "bandedRange", "start"):
+        part = body.get(key)
+        if isinstance(part, dict):
+            if "sheetId" in part:
+                return part["sheetId"]
+            if isinstance(part.get("range"), dict) and "sheetId" in part["range"]:
+                return part["range"]["sheetId"]
+    return None
+
+
+def _split_by_sheet(requests: List[Request]) -> Optional[List[List[Request]]]:
+    """
+    requests를 sheetId별 묶음(순서 유지)으로 나눈다.
+    sheetId를 알 수 없는 요청이 있으면 선후 관계를 보장할 수 없으므로 None
+    """
+    lanes: Dict[int, List[Request]] = {}
+    for r in requests:
+        sid = request_sheet_id(r)
+        if sid is None:
+            return None
+        lanes.setdefault(sid, []).append(r)
+    return list(lanes.values())
+
+
+def send_batch_update(sheet_svc, spreadsheet_id: str, requests: List[Request],
+                      chunk_size: int = BATCH_UPDATE_CHUNK_SIZE,
+                      max_workers: int = BATCH_UPDATE_WORKERS) -> None:
+    """
+    requests를 chunk_size 단위로 나눠 batchUpdate 전송.
+    - 서로 다른 시트(sheetId)의 요청은 max_workers개 스레드로 동시에 전송
+    - 같은 시트 요청은 한 스레드에서 순서대로 보내므로 선후 관계 유지
+    - httplib2는 스레드 안전하지 않아 스레드마다 별도 http 객체 사용
+    """
+    credentials = getattr(getattr(sheet_svc, "_http", None), "credentials", None)
+    lanes = _split_by_sheet(requests)
+    if credentials is None or lanes is None or len(lanes) < 2 or max_workers < 2:
+        for chunk in chunk_requests(requests, chunk_size):
+            execute_with_backoff(sheet_svc.spreadsheets().batchUpdate(
+                spreadsheetId=spreadsheet_id,
+                body={"requests": chunk}
+            ))
+        return
+
+    # 시트별 묶음을 chunk_size 이하로 다시 채워 담는다 (한 시트는 한 작업 안에만)
+    jobs: List[List[Request]] = []
+    for lane in lanes:
+        if jobs and len(jobs[-1]) + len(lane) <= chunk_size:
+            jobs[-1].extend(lane)
+        else:
+            jobs.append(list(lane))
+
+    local = threading.local()
 
-        if len(requests_add) >= BATCH_SIZE:
-            body = {"requests": requests_add}
-            resp = sheet_svc.spreadsheets().batchUpdate(
+    def _send(job: List[Request]):
+        if not hasattr(local, "http"):
+            local.http = new_authorized_http(credentials)
+        for chunk in chunk_requests(job, chunk_size):
+            execute_with_backoff(sheet_svc.spreadsheets().batchUpdate(
                 spreadsheetId=spreadsheet_id,
-                body=body
-            ).execute()
+                body={"requests": chunk}
+            ), http=local.http)
 
-            total_count += len(resp["replies"])
-            print(f"분할 addSheet 완료: {len(resp['replies'])}개 생성")
-            requests_add.clear()
-            time.sleep(2)
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        list(ex.map(_send, jobs))
 
-    if requests_add:
-        body = {"requests": requests_add}
-        resp = sheet_svc.spreadsheets().batchUpdate(
-            spreadsheetId=spreadsheet_id,
-            body=body
-        ).execute()
-        total_count += len(resp["replies"])
-        print(f"마지막 addSheet 완료: {len(resp['replies'])}개 생성")
-        requests_add.clear()
-
-    print(f"시트 생성 총 개수: {total_count}")
-    for idx, rep in enumerate(resp["replies"]):
-        sheet_props = rep["addSheet"]["properties"]
-        print(f" -> {idx} '{sheet_props['title']}' (sheetId={sheet_props['sheetId']})")
-
-def duplicate_worksheet_with_new_name(gs_obj, from_sheet_name: str, to_sheet_name: str):
-    all_ws = gs_obj.worksheets()
-    all_titles = [w.title for w in all_ws]
-    from_ws = None
-    for w in all_ws:
-        if w.title == from_sheet_name:
-            from_ws = w
-            break
+
+# 값 쓰기(values.batchUpdate) 동시 실행 스레드 수
+VALUE_WRITE_WORKERS = 4
+
+# values.batchUpdate 1회당 최대 범위(탭) 수 (payload 크기 제한 대응)
+VALUE_BATCH_RANGES = 100
+
+def duplicate_worksheet_with_new_name(gs_obj, from_sheet_name: str, to_sheet_name: str, ws_map=None):
+    # ws_map: 이미 조회해 둔 {탭 제목: Worksheet} 가 있으면 재사용 (메타데이터 재조회 생략)
+    if ws_map is None:
+        ws_map = {w.title: w for w in call_with_backoff(gs_obj.worksheets)}
+    from_ws = ws_map.get(from_sheet_name)
     if not from_ws:
         raise ValueError(f"원본 시트 '{from_sheet_name}'를 찾을 수 없습니다.")
 
     base_name = to_sheet_name
     idx = 2
-    while to_sheet_name in all_titles:
+    while to_sheet_name in ws_map:
         to_sheet_name = f"{base_name} ({idx})"
         idx += 1
 
-    new_ws = gs_obj.duplicate_sheet(source_sheet_id=from_ws.id, new_sheet_name=to_sheet_name)
+    new_ws = call_with_backoff(gs_obj.duplicate_sheet, source_sheet_id=from_ws.id, new_sheet_name=to_sheet_name)
     return new_ws
 
 def is_korean_char(ch: str):
@@ -487,119 +738,142 @@ def is_korean_char(ch: str):
 def is_korean_string(s: str):
     return any(is_korean_char(ch) for ch in s)
 
+@lru_cache(maxsize=16384)
 def album_sort_key(album_name: str):
     return (0 if is_korean_string(album_name) else 1, album_name)
 
 def to_currency(num):
     return f"₩{format(int(round(num)), ',')}"
 
-def update_next_month_tab(song_cost_sh, ym: str):
+def to_won(num) -> int:
+    """원 단위 정수 (문자열 '₩1,234' 대신 숫자로 기록, 표시는 시트의 KRW_NUMBER_FORMAT 서식)"""
+    return int(round(num))
+
+def header_index_map(header: List[str]) -> Dict[str, int]:
+    """헤더명 -> 열 인덱스 dict (같은 이름이 여러 번 있으면 list.index처럼 첫 번째 열)"""
+    col_idx: Dict[str, int] = {}
+    for i, name in enumerate(header):
+        col_idx.setdefault(name, i)
+    return col_idx
+
+
+def update_next_month_tab(song_cost_sh, ym: str, sheet_svc, old_data=None, ws_map=None, http=None):
     """
     예시 함수 (기존 코드 내 사용)
+    - sheet_svc: 값 쓰기(values.batchUpdate)용 sheets 서비스 (http: 스레드 전용 http 객체)
+    - old_data: 이미 읽어 둔 ym 탭 값 (없으면 새로 읽음)
+    - ws_map  : 이미 조회해 둔 {탭 제목: Worksheet} (없으면 새로 조회)
     """
-    old_ws = song_cost_sh.worksheet(ym)
-    old_data = old_ws.get_all_values()
+    if old_data is None:
+        old_data = call_with_backoff(call_with_backoff(song_cost_sh.worksheet, ym).get_all_values)
     if not old_data:
         print(f"'{ym}' 탭이 비어 있음")
         return
 
     old_header = old_data[0]
     old_body   = old_data[1:]
+    # 헤더명 -> 열 인덱스 (list.index 반복 검색 대신 dict 1번 생성)
+    col_idx = header_index_map(old_header)
 
     try:
-        idx_artist_old = old_header.index("아티스트명")
-        idx_remain_old = old_header.index("당월 잔액")
-    except ValueError:
+        idx_artist_old = col_idx["아티스트명"]
+        idx_remain_old = col_idx["당월 잔액"]
+    except KeyError:
         print("이전 달 시트에 '아티스트명' 또는 '당월 잔액' 칼럼이 없습니다.")
         return
 
-    # 전월 잔액을 dict로 모아둠
-    prev_month_dict = {}
-    for row in old_body:
-        artist_name = row[idx_artist_old].strip()
-        if not artist_name or artist_name in ("합계","총계"):
-            continue
-        try:
-            remain_val = float(row[idx_remain_old].replace(",", ""))
-        except:
-            remain_val = 0.0
-        prev_month_dict[artist_name] = remain_val
+    # 전월 잔액을 dict로 모아둠 (행 루프/try-float 대신 열 단위로 한 번에 변환)
+    artist_s = pd.Series([row[idx_artist_old] for row in old_body], dtype=object).str.strip()
+    remain_s = pd.to_numeric(
+        pd.Series([row[idx_remain_old] for row in old_body], dtype=object).str.replace(",", "", regex=False),
+        errors="coerce"
+    ).fillna(0.0).astype(float)
+    keep = artist_s.ne("") & ~artist_s.isin(["합계", "총계"])
+    prev_month_dict = dict(zip(artist_s[keep], remain_s[keep].tolist()))
 
     # 다음 달 시트 만들기(복제)
     next_ym = get_next_month_str(ym)
-    new_ws = duplicate_worksheet_with_new_name(song_cost_sh, ym, next_ym)
+    new_ws = duplicate_worksheet_with_new_name(song_cost_sh, ym, next_ym, ws_map=ws_map)
     
-    # 복제된 시트의 데이터 읽기
-    new_data = new_ws.get_all_values()
-    if not new_data:
-        print(f"복제된 '{next_ym}' 탭이 비어 있습니다.")
-        return
+    # 복제된 시트는 원본 탭과 값이 같으므로 다시 읽지 않고 old_data 사용 (get_all_values 왕복 생략)
+    new_data = old_data
 
-    new_header = new_data[0]
+    # 복제본 헤더 = 원본 헤더 -> col_idx 그대로 사용
     try:
-        idx_artist_new = new_header.index("아티스트명")
-        idx_prev_new   = new_header.index("전월 잔액")
-        idx_curr_new   = new_header.index("당월 발생액")   # ★ 추가 부분
-        idx_deduct_new = new_header.index("당월 차감액")
-        # idx_remain_new = new_header.index("당월 잔액")
-    except ValueError:
+        idx_artist_new = col_idx["아티스트명"]
+        idx_prev_new   = col_idx["전월 잔액"]
+        idx_curr_new   = col_idx["당월 발생액"]   # ★ 추가 부분
+        idx_deduct_new = col_idx["당월 차감액"]
+        # idx_remain_new = col_idx["당월 잔액"]
+    except KeyError:
         print("새로 만든 시트(다음 달 탭)에 필요한 칼럼이 없습니다.")
         return
     
     # 본문 (마지막 합계 행은 제외)
     content = new_data[1:-1]
+    if not content:
+        # 갱신할 아티스트 행이 없으면 복제만 하고 종료 (빈 범위 E2:G1 쓰기 요청 방지)
+        print(f"'{next_ym}' 탭에 갱신할 본문 행이 없습니다. (복제만 완료)")
+        return
 
-    updated_prev_vals = []   # D열에 들어갈 값
-    updated_curr_vals   = []  # E열(예: 당월 발생액) -> 0으로 초기화
-    updated_deduct_vals = [] # F열에 들어갈 값
-
-    for row in content:
-        artist = row[idx_artist_new].strip()
-        old_val = prev_month_dict.get(artist, 0.0)  # 전월 잔액
-        updated_prev_vals.append([old_val])
-        updated_curr_vals.append(["0"])       # 새 탭 '당월 발생액' 칸 (0)
-        updated_deduct_vals.append(["0"])  # 당월 차감액은 0으로 초기화
-
-    row_count = len(content)
-    start_row = 2
-    end_row   = 1 + row_count
-
-    # batch_update에 쓸 requests
-    requests_body = [
-        {
-            "range": f"E{start_row}:E{end_row}",
-            "values": updated_prev_vals
-        },
-        {
-            "range": f"F{start_row}:F{end_row}",  # (★ 추가) 당월 발생액 열
-            "values": updated_curr_vals
-        },
-        {
-            "range": f"G{start_row}:G{end_row}",
-            "values": updated_deduct_vals
-        }
+    # E~G 연속 열을 한 블록으로: [전월 잔액, 당월 발생액, 당월 차감액]
+    #  - 전월 잔액 = 이전 달 '당월 잔액' (dict 조회 1번씩)
+    #  - 당월 발생액(★ 추가) / 당월 차감액은 0으로 초기화
+    updated_block = [
+        [prev_month_dict.get(row[idx_artist_new].strip(), 0.0), "0", "0"]
+        for row in content
     ]
 
-    # 한 번에 batch_update로 호출
-    new_ws.batch_update(
-        requests_body,
-        value_input_option="USER_ENTERED"
-    )
+    # E:G 블록(VALUE_CHUNK_ROWS행씩 나눈 범위)을 values.batchUpdate 1번으로
+    batch_update_values(sheet_svc, song_cost_sh.id, column_block_ranges(new_ws.title, "E", "G", 2, updated_block),
+                        http=http)
 
     print(f"'{ym}' → '{next_ym}' 탭 복제 및 전월/당월 차감액만 갱신(배치 업데이트) 완료!")
 
 
+# 합계행 아티스트명 패턴 (대소문자 무시) - is_summary_row는 fullmatch, 매출 합산은 search(포함 여부)
+_SUMMARY_NAME_RE = re.compile(r"합계|총계|total", re.IGNORECASE)
+
+
 def is_summary_row(cleaned_artist_name: str) -> bool:
     """
     아티스트명이 공란('')이거나,
     '합계', '총계', 'TOTAL', 'total' 같은 문자열이면
     합계행으로 간주해서 True 리턴
     """
-    if not cleaned_artist_name:
-        return True
-    # 대소문자 구분 없이 모두 upper() 해서 비교
-    up = cleaned_artist_name.upper()
-    return (up in ("합계", "총계", "TOTAL"))
+    return not cleaned_artist_name or _SUMMARY_NAME_RE.fullmatch(cleaned_artist_name) is not None
+
+
+def sum_revenue_by_artist(rows: List[List[str]], col_artist: int, col_revenue: int) -> Dict[str, float]:
+    """
+    매출 인풋 본문 행들을 DataFrame으로 만들어 아티스트별 매출 합계를 groupby로 계산.
+    (아티스트명이 공란 / '합계'·'총계'·'total' 포함 / 숫자만인 행은 합계행으로 보고 제외)
+    """
+    if not rows:
+        return {}
+    df = pd.DataFrame({
+        "artist": [clean_artist_name(r[col_artist]) for r in rows],
+        "revenue": [r[col_revenue] for r in rows],
+    })
+    artist = df["artist"]
+    summary_mask = (
+        artist.eq("")
+        | artist.str.contains(_SUMMARY_NAME_RE)
+        | artist.str.isdigit()
+    )
+    # float() 변환 실패 → 0.0 과 동일하게 coerce 후 fillna(0)
+    revenue = pd.to_numeric(df["revenue"].str.replace(",", "", regex=False), errors="coerce").fillna(0.0).astype(float)
+    keep = ~summary_mask
+    return revenue[keep].groupby(artist[keep], sort=False).sum().to_dict()
+
+
+def drop_summary_rows(rows: List[List[str]], col_artist: int) -> List[List[str]]:
+    """is_summary_row(공란 / '합계'·'총계'·'TOTAL')에 해당하는 행을 마스크 1번으로 제외"""
+    if not rows:
+        return []
+    artist = pd.Series([clean_artist_name(r[col_artist]) for r in rows], dtype=object)
+    summary_mask = artist.eq("") | artist.str.fullmatch(_SUMMARY_NAME_RE)
+    return list(itertools.compress(rows, (~summary_mask).tolist()))
 
 
 
@@ -612,7 +886,6 @@ def section_zero_prepare_song_cost():
       '전월 잔액 + 당월 발생액' vs (UMAG + FLUXUS매출) 비교 → '당월 차감액' 갱신
     - 소속이 여러 개인 경우에도 (UMAG + FLUXUS) 매출 모두 합산
     """
-    import pandas as pd  # 함수 시작부
 
     st.subheader("0) 곡비 파일 수정")
 
@@ -633,7 +906,7 @@ def section_zero_prepare_song_cost():
 
     if st.button("곡비 파일 수정하기"):
         creds_a = get_credentials_from_secrets("A")
-        gc_a = gspread.authorize(creds_a)
+        _, _, sheet_svc_a = get_clients("A")
 
         if not re.match(r'^\d{6}$', new_ym):
             st.error("진행기간은 YYYYMM 6자리로 입력해야 합니다.")
@@ -642,75 +915,91 @@ def section_zero_prepare_song_cost():
         st.session_state["ym"] = new_ym
         prev_ym = get_prev_month_str(new_ym)
 
-        # (1) input_song cost 열기
-        try:
-            song_cost_sh = gc_a.open("input_song cost")
-        except gspread.exceptions.SpreadsheetNotFound:
-            st.error("Google Sheet 'input_song cost'를 찾을 수 없습니다.")
-            return
+        # (1) input_song cost + (2) umag / fluxus_song / fluxus_yt 열기
+        #     파일 열기 + 탭 목록 조회 4건은 서로 독립 -> 스레드로 동시에 (gspread 클라이언트는 스레드마다 따로)
+        open_targets = [
+            ("input_song cost", "Google Sheet 'input_song cost'를 찾을 수 없습니다."),
+            ("input_online revenue_umag_integrated", "'input_online revenue_umag_integrated' 없음"),
+            ("input_online revenue_fluxus_song", "'input_online revenue_fluxus_song' 없음"),
+            ("input_online revenue_fluxus_yt", "'input_online revenue_fluxus_yt' 없음"),
+        ]
+        #     이전에 연 적 있는 파일은 캐시된 ID로 open_by_key (Drive 이름 검색 생략)
+        sheet_ids = st.session_state.setdefault(SHEET_ID_CACHE_KEY, {})
+        with ThreadPoolExecutor(max_workers=len(open_targets)) as ex:
+            open_jobs = [
+                ex.submit(open_with_tab_titles, gspread.authorize(creds_a), sheet_svc_a, name,
+                          new_authorized_http(creds_a), sheet_ids.get(name))
+                for name, _ in open_targets
+            ]
+            opened = []
+            for job, (_, err_msg) in zip(open_jobs, open_targets):
+                try:
+                    opened.append(job.result())
+                except Exception:
+                    st.error(err_msg)
+                    return
+        for (name, _), (sh, _) in zip(open_targets, opened):
+            sheet_ids[name] = sh.id
+        ((song_cost_sh, titles_sc), (umag_sh, titles_umag),
+         (fluxus_song_sh, titles_flux_song), (fluxus_yt_sh, titles_flux_yt)) = opened
 
-        # (2) umag / fluxus_song / fluxus_yt 열기
-        try:
-            umag_sh = gc_a.open("input_online revenue_umag_integrated")
-        except:
-            st.error("'input_online revenue_umag_integrated' 없음")
+        # ---------------------------
+        # 0-0) 필요한 탭이 모두 있는지 먼저 확인한 뒤, 값은 파일별 values.batchGet 1번씩
+        #      (4개 파일 요청은 스레드로 동시에 보내 왕복 대기를 겹침)
+        # ---------------------------
+        if prev_ym not in titles_sc:
+            st.error(f"'input_song cost'에 직전 달 '{prev_ym}' 탭이 없습니다.")
             return
-        
-        try:
-            fluxus_song_sh = gc_a.open("input_online revenue_fluxus_song")
-        except:
-            st.error("'input_online revenue_fluxus_song' 없음")
+        if new_ym not in titles_sc:
+            st.error(f"이번 달 '{new_ym}' 탭이 없습니다.")
             return
-        
-        try:
-            fluxus_yt_sh = gc_a.open("input_online revenue_fluxus_yt")
-        except:
-            st.error("'input_online revenue_fluxus_yt' 없음")
+        if new_ym not in titles_umag:
+            st.error(f"'input_online revenue_umag_integrated'에 '{new_ym}' 탭 없음")
+            return
+        if new_ym not in titles_flux_song:
+            st.error(f"'fluxus_song'에 '{new_ym}' 탭이 없음")
+            return
+        if new_ym not in titles_flux_yt:
+            st.error(f"'fluxus_yt'에 '{new_ym}' 탭 없음")
             return
 
+        with ThreadPoolExecutor(max_workers=4) as ex:
+            read_jobs = [
+                ex.submit(batch_get_all_values, sheet_svc_a, sh.id, titles, new_authorized_http(creds_a))
+                for sh, titles in ((song_cost_sh, [prev_ym, new_ym]), (umag_sh, [new_ym]),
+                                   (fluxus_song_sh, [new_ym]), (fluxus_yt_sh, [new_ym]))
+            ]
+            (data_prev, data_new), (data_umag,), (data_fs,), (data_fy,) = [j.result() for j in read_jobs]
+
         # ---------------------------
         # 0-A) 직전 달(YYYYMM) 탭에서 '아티스트별 당월 잔액' dict
         # ---------------------------
-        ws_map_sc = {ws.title: ws for ws in song_cost_sh.worksheets()}
-        if prev_ym not in ws_map_sc:
-            st.error(f"'input_song cost'에 직전 달 '{prev_ym}' 탭이 없습니다.")
-            return
-
-        ws_prev = ws_map_sc[prev_ym]
-        data_prev = ws_prev.get_all_values()
         if not data_prev:
             st.error(f"'{prev_ym}' 탭이 비어있음")
             return
 
         header_prev = data_prev[0]
         body_prev = data_prev[1:]
+        col_prev = header_index_map(header_prev)  # 헤더명 -> 열 인덱스 (list.index 반복 검색 대신)
         try:
-            idx_artist_p = header_prev.index("아티스트명")
-            idx_remain_p = header_prev.index("당월 잔액")
-        except ValueError as e:
+            idx_artist_p = col_prev["아티스트명"]
+            idx_remain_p = col_prev["당월 잔액"]
+        except KeyError as e:
             st.error(f"직전 달 '{prev_ym}' 시트에 '아티스트명' 또는 '당월 잔액' 없음: {e}")
             return
 
-        prev_remain_dict = {}
-        for row_p in body_prev:
-            artist_p = clean_artist_name(row_p[idx_artist_p])
-            if not artist_p or artist_p in ("합계","총계"):
-                continue
-            try:
-                val_p = float(row_p[idx_remain_p].replace(",",""))
-            except:
-                val_p = 0.0
-            prev_remain_dict[artist_p] = val_p
+        # 행 루프/try-float 대신 열 단위로 한 번에 변환 (float 변환 실패 -> 0.0)
+        artist_p = pd.Series([clean_artist_name(r[idx_artist_p]) for r in body_prev], dtype=object)
+        remain_p = pd.to_numeric(
+            pd.Series([r[idx_remain_p] for r in body_prev], dtype=object).str.replace(",", "", regex=False),
+            errors="coerce"
+        ).fillna(0.0).astype(float)
+        keep_p = artist_p.ne("") & ~artist_p.isin(["합계", "총계"])
+        prev_remain_dict = dict(zip(artist_p[keep_p], remain_p[keep_p].tolist()))
 
         # ---------------------------
         # 0-B) 이번 달(YYYYMM) 탭 read
         # ---------------------------
-        if new_ym not in ws_map_sc:
-            st.error(f"이번 달 '{new_ym}' 탭이 없습니다.")
-            return
-
-        ws_new = ws_map_sc[new_ym]
-        data_new = ws_new.get_all_values()
         if not data_new:
             st.error(f"'{new_ym}' 탭이 비어있음")
             return
@@ -718,250 +1007,125 @@ def section_zero_prepare_song_cost():
         header_new = data_new[0]
         body_new   = data_new[1:-1]  # 마지막 합계행 제외
 
+        col_new = header_index_map(header_new)
         try:
-            idx_sosok_n  = header_new.index("소속")
-            idx_artist_n = header_new.index("아티스트명")
-            idx_prev_n   = header_new.index("전월 잔액")
-            idx_curr_n   = header_new.index("당월 발생액")
-            idx_ded_n    = header_new.index("당월 차감액")
-        except:
+            idx_sosok_n  = col_new["소속"]
+            idx_artist_n = col_new["아티스트명"]
+            idx_prev_n   = col_new["전월 잔액"]
+            idx_curr_n   = col_new["당월 발생액"]
+            idx_ded_n    = col_new["당월 차감액"]
+        except KeyError:
             st.error(f"[{new_ym}] 탭에 '소속' 또는 '당월 차감액' 등이 없음")
             return
 
         # ---------------------------
         # 0-C) UMAG 인풋 read
         # ---------------------------
-        ws_map_umag = {ws.title: ws for ws in umag_sh.worksheets()}
-        if new_ym not in ws_map_umag:
-            st.error(f"'input_online revenue_umag_integrated'에 '{new_ym}' 탭 없음")
-            return
-        ws_umag = ws_map_umag[new_ym]
-        data_umag = ws_umag.get_all_values()
         header_umag = data_umag[0]
         body_umag   = data_umag[1:]
 
-        # [추가] 합계행(요약행) 필터링
-        col_artist_umag = header_umag.index("앨범아티스트")
-        filtered_umag = []
-        for row_u in body_umag:
-            a_u = clean_artist_name(row_u[col_artist_umag])
-            if is_summary_row(a_u):  
-                # 합계/총계/공란 → skip
-                continue
-            filtered_umag.append(row_u)
-
-        body_umag = filtered_umag
-
+        col_umag = header_index_map(header_umag)
         try:
-            col_artist_umag  = header_umag.index("앨범아티스트")
-            col_revenue_umag = header_umag.index("권리사정산금액")
-        except:
+            col_artist_umag  = col_umag["앨범아티스트"]
+            col_revenue_umag = col_umag["권리사정산금액"]
+        except KeyError:
             st.error("'앨범아티스트' / '권리사정산금액' 칼럼 필요(UMAG)")
             return
 
-        from collections import defaultdict
-        sum_umag_dict = defaultdict(float)
-        for row_u in body_umag:
-            a_u = clean_artist_name(row_u[col_artist_umag])
-
-            # 소문자로 변환한 값
-            a_lower = a_u.lower()
-            # (1) 아티스트명이 공란, (2) 아티스트명 안에 '합계','총계','total' 포함, 
-            # (3) 전부 숫자인 경우 -> 합계행으로 보고 스킵
-            if (
-                not a_u 
-                or '합계' in a_u 
-                or '총계' in a_u 
-                or 'total' in a_lower 
-                or a_u.isdigit()
-            ):
-                continue
+        # [추가] 합계행(요약행) 필터링 (합계/총계/공란 → skip)
+        body_umag = drop_summary_rows(body_umag, col_artist_umag)
 
-            try:
-                val_u = float(row_u[col_revenue_umag].replace(",",""))
-            except:
-                val_u = 0.0
-            sum_umag_dict[a_u] += val_u
+        sum_umag_dict = sum_revenue_by_artist(body_umag, col_artist_umag, col_revenue_umag)
 
         # ---------------------------
         # 0-D) fluxus_song read
         # ---------------------------
-        ws_map_flux_song = {ws.title: ws for ws in fluxus_song_sh.worksheets()}
-        if new_ym not in ws_map_flux_song:
-            st.error(f"'fluxus_song'에 '{new_ym}' 탭이 없음")
-            return
-        ws_fs = ws_map_flux_song[new_ym]
-        data_fs = ws_fs.get_all_values()
         if not data_fs:
             st.error(f"'{new_ym}' 탭(fluxus_song) 비어있음")
             return
         header_fs = data_fs[0]
         body_fs   = data_fs[1:]
 
-        # [추가] 합계/요약행 필터링
-        col_artist_fs = header_fs.index("가수명")
-        filtered_fs = []
-        for row_fs_ in body_fs:
-            artist_temp = clean_artist_name(row_fs_[col_artist_fs])
-            if is_summary_row(artist_temp):
-                continue
-            filtered_fs.append(row_fs_)
-        body_fs = filtered_fs
-
+        col_fs = header_index_map(header_fs)
         try:
-            col_artist_fs = header_fs.index("가수명")
-            col_revenue_fs= header_fs.index("권리사 정산액")
-        except:
+            col_artist_fs = col_fs["가수명"]
+            col_revenue_fs= col_fs["권리사 정산액"]
+        except KeyError:
             st.error("fluxus_song: '가수명' / '권리사 정산액' 칼럼 필요")
             return
 
-        sum_flux_song_dict = defaultdict(float)
-        for row_fs in body_fs:
-            a_fs = clean_artist_name(row_fs[col_artist_fs])
-
-            # 소문자로 변환한 값
-            a_lower = a_fs.lower()
-            # (1) 아티스트명이 공란, (2) 아티스트명 안에 '합계','총계','total' 포함, 
-            # (3) 전부 숫자인 경우 -> 합계행으로 보고 스킵
-            if (
-                not a_fs 
-                or '합계' in a_lower 
-                or '총계' in a_lower 
-                or 'total' in a_lower 
-                or a_fs.isdigit()
-            ):
-                continue
+        # [추가] 합계/요약행 필터링
+        body_fs = drop_summary_rows(body_fs, col_artist_fs)
 
-            try:
-                val_fs = float(row_fs[col_revenue_fs].replace(",",""))
-            except:
-                val_fs = 0.0
-            sum_flux_song_dict[a_fs] += val_fs
+        sum_flux_song_dict = sum_revenue_by_artist(body_fs, col_artist_fs, col_revenue_fs)
 
 
         # ---------------------------
         # 0-E) fluxus_yt read
         # ---------------------------
-        ws_map_flux_yt = {ws.title: ws for ws in fluxus_yt_sh.worksheets()}
-        if new_ym not in ws_map_flux_yt:
-            st.error(f"'fluxus_yt'에 '{new_ym}' 탭 없음")
-            return
-        ws_fy = ws_map_flux_yt[new_ym]
-        data_fy = ws_fy.get_all_values()
         if not data_fy:
             st.error(f"'{new_ym}' 탭(fluxus_yt) 비어있음")
             return
         header_fy = data_fy[0]
         body_fy   = data_fy[1:]
 
-        # [추가] 합계/요약행 필터링
-        col_artist_fy = header_fy.index("ALBIM ARTIST")
-        filtered_fy = []
-        for row_fy_ in body_fy:
-            artist_temp = clean_artist_name(row_fy_[col_artist_fy])
-            if is_summary_row(artist_temp):
-                continue
-            filtered_fy.append(row_fy_)
-        body_fy = filtered_fy
-
+        col_fy = header_index_map(header_fy)
         try:
-            col_artist_fy  = header_fy.index("ALBIM ARTIST")
-            col_revenue_fy = header_fy.index("권리사 정산액 \n(KRW)")
-        except:
+            col_artist_fy  = col_fy["ALBIM ARTIST"]
+            col_revenue_fy = col_fy["권리사 정산액 \n(KRW)"]
+        except KeyError:
             st.error("'fluxus_yt' 칼럼( ALBIM ARTIST, 권리사 정산액 \n(KRW) ) 필요")
             return
 
-        sum_flux_yt_dict = defaultdict(float)
-        for row_fy in body_fy:
-            a_fy = clean_artist_name(row_fy[col_artist_fy])
-
-            # 소문자로 변환한 값
-            a_lower = a_fy.lower()
-            # (1) 아티스트명이 공란, (2) 아티스트명 안에 '합계','총계','total' 포함, 
-            # (3) 전부 숫자인 경우 -> 합계행으로 보고 스킵
-            if (
-                not a_fy 
-                or '합계' in a_fy 
-                or '총계' in a_fy 
-                or 'total' in a_lower 
-                or a_fy.isdigit()
-            ):
-                continue
+        # [추가] 합계/요약행 필터링
+        body_fy = drop_summary_rows(body_fy, col_artist_fy)
 
-            try:
-                val_fy = float(row_fy[col_revenue_fy].replace(",",""))
-            except:
-                val_fy = 0.0
-            sum_flux_yt_dict[a_fy] += val_fy
+        sum_flux_yt_dict = sum_revenue_by_artist(body_fy, col_artist_fy, col_revenue_fy)
 
         # ---------------------------------------
         # [중요] 2개 이상 소속도 “모두” 매출 더해서 actual_deduct 산출
         # ---------------------------------------
-        updated_vals_for_def = []
-
-        for row_idx, row_data in enumerate(body_new):
-            artist_n = clean_artist_name(row_data[idx_artist_n])
-            if not artist_n or artist_n in ("합계","총계"):
-                updated_vals_for_def.append(["","",""])
-                continue
-
-            sosok_str = row_data[idx_sosok_n].strip().upper()
-            affils = re.split(r'[,&/]', sosok_str)  # "UMAG,FLUXUS" → ["UMAG","FLUXUS"]
-            affils = [x.strip() for x in affils if x.strip()]
-
-            try:
-                curr_val_str = row_data[idx_curr_n].replace(",","")
-                curr_val = float(curr_val_str) if curr_val_str else 0.0
-            except:
-                curr_val = 0.0
-
-            prev_val = prev_remain_dict.get(artist_n,0.0)
-
-            # 모든 소속매출 합산
-            total_revenue = 0.0
-            for one_sosok in affils:
-                if one_sosok == "UMAG":
-                    total_revenue += sum_umag_dict.get(artist_n, 0.0)
-                elif one_sosok == "FLUXUS":
-                    fs_val = sum_flux_song_dict.get(artist_n, 0.0)
-                    fy_val = sum_flux_yt_dict.get(artist_n, 0.0)
-                    total_revenue += (fs_val + fy_val)
-                else:
-                    # 알수없는 소속? pass
-                    pass
-
-            can_deduct = prev_val + curr_val
-            actual_deduct = min(total_revenue, can_deduct)
-
-            updated_vals_for_def.append([prev_val, curr_val, actual_deduct])
-
-        # batch_update → (E:F:G) or (D:E:F) 등 실제 칼럼 위치 맞춤
-        total_rows = len(body_new)
-        start_row = 2
-        end_row   = 1 + total_rows
-        range_notation = f"E{start_row}:G{end_row}"  # (전월/당월발생/당월차감)
-        requests_body = [{"range": range_notation, "values": updated_vals_for_def}]
-        ws_new.batch_update(requests_body, value_input_option="USER_ENTERED")
+        #   (행 단위 루프 대신 DataFrame 한 번으로 전월/당월발생/당월차감 계산)
+        df_new = pd.DataFrame({
+            "artist": [clean_artist_name(r[idx_artist_n]) for r in body_new],
+            "sosok":  [r[idx_sosok_n] for r in body_new],
+            "curr":   [r[idx_curr_n] for r in body_new],
+        }, dtype=object)
+        artist_s = df_new["artist"]
+        sosok_s  = df_new["sosok"].str.strip().str.upper()
+        # "UMAG,FLUXUS" / "umag / fluxus" → 구분자(, & /) 사이에 정확히 UMAG / FLUXUS 가 있는지
+        has_umag   = sosok_s.str.contains(r"(?:^|[,&/])\s*UMAG\s*(?:[,&/]|$)", regex=True)
+        has_fluxus = sosok_s.str.contains(r"(?:^|[,&/])\s*FLUXUS\s*(?:[,&/]|$)", regex=True)
+
+        prev_val = artist_s.map(prev_remain_dict).fillna(0.0).astype(float)
+        curr_val = pd.to_numeric(df_new["curr"].str.replace(",", "", regex=False), errors="coerce").fillna(0.0).astype(float)
+
+        # 모든 소속매출 합산 (알 수 없는 소속은 0)
+        umag_rev = artist_s.map(sum_umag_dict).fillna(0.0).astype(float).where(has_umag, 0.0)
+        flux_rev = (
+            artist_s.map(sum_flux_song_dict).fillna(0.0).astype(float)
+            + artist_s.map(sum_flux_yt_dict).fillna(0.0).astype(float)
+        ).where(has_fluxus, 0.0)
+        total_revenue = umag_rev + flux_rev
+
+        can_deduct = prev_val + curr_val
+        actual_deduct = total_revenue.where(total_revenue <= can_deduct, can_deduct)
+
+        vals_df = pd.DataFrame({"prev": prev_val, "curr": curr_val, "deduct": actual_deduct}).astype(object)
+        vals_df.loc[artist_s.eq("") | artist_s.isin(["합계", "총계"])] = ""
+        updated_vals_for_def = vals_df.values.tolist()
+
+        # batch_update → (E:F:G) 전월/당월발생/당월차감, VALUE_CHUNK_ROWS행씩 나눈 범위를 요청 1번에
+        requests_body = column_block_ranges(new_ym, "E", "G", 2, updated_vals_for_def)
+        if requests_body:
+            batch_update_values(sheet_svc_a, song_cost_sh.id, requests_body)
 
         #--------------------------------
         # 아티스트 수 검증
         #--------------------------------
-        umag_count_artists = 0
-        fluxus_count_artists = 0
-
-        # 곡비파일(body_new)에서 소속을 보고 카운팅
-        for row_data in body_new:
-            sosok_str = row_data[idx_sosok_n].strip().upper()
-            affils = re.split(r'[,&/]', sosok_str)
-            affils = [x.strip() for x in affils if x.strip()]
-
-            # 소속 문자열 안에 "UMAG"가 있으면 UMAG 카운트
-            if "UMAG" in affils:
-                umag_count_artists += 1
-
-            # 소속 문자열 안에 "FLUXUS"가 있으면 FLUXUS 카운트
-            if "FLUXUS" in affils:
-                fluxus_count_artists += 1
+        # 곡비파일(body_new)에서 소속을 보고 카운팅 (차감액 계산에 쓴 소속 마스크 재사용)
+        umag_count_artists = int(has_umag.sum())
+        fluxus_count_artists = int(has_fluxus.sum())
 
         # 매출 인풋파일들의 "원본" 행 개수
         umag_raw_rows = len(body_umag)   # 예: UMAG 매출
@@ -989,9 +1153,7 @@ def section_zero_prepare_song_cost():
 
         for row_data in body_new:
             artist_n = clean_artist_name(row_data[idx_artist_n])
-            sosok_str = row_data[idx_sosok_n].strip().upper()
-            affils = re.split(r'[,&/]', sosok_str)
-            affils = [x.strip() for x in affils if x.strip()]
+            affils = split_affiliations(row_data[idx_sosok_n])
 
             # 소속 중에 UMAG가 하나라도 있으면 => umag_artists_from_cost.add(artist_n)
             if "UMAG" in affils:
@@ -1068,32 +1230,9 @@ def section_zero_prepare_song_cost():
 
         # --------------------------------
         # C) 실제 매출 행 처리 개수
+        #    = 위 2)~4) 누락행 탐색에서 함께 센 *_processed_rows 그대로 사용
         # --------------------------------
 
-        # (1) UMAG
-        umag_processed_rows = 0
-        for row_u in body_umag:
-            raw_artist = row_u[col_artist_umag]
-            a = clean_artist_name(raw_artist)
-            if a in umag_artists_from_cost:  # 곡비에도 있고, 소속=UMAG인 아티스트
-                umag_processed_rows += 1
-
-        # (2) FLUXUS SONG
-        fluxus_song_processed_rows = 0
-        for row_fs in body_fs:
-            raw_artist = row_fs[col_artist_fs]
-            a = clean_artist_name(raw_artist)
-            if a in fluxus_artists_from_cost:
-                fluxus_song_processed_rows += 1
-
-        # (3) FLUXUS YT
-        fluxus_yt_processed_rows = 0
-        for row_fy in body_fy:
-            raw_artist = row_fy[col_artist_fy]
-            a = clean_artist_name(raw_artist)
-            if a in fluxus_artists_from_cost:
-                fluxus_yt_processed_rows += 1
-
         # --------------------------------
         # D) st.session_state 저장
         # --------------------------------
@@ -1163,7 +1302,6 @@ def section_zero_prepare_song_cost():
                     # UMAG
                     if missing_all["UMAG"]:
                         st.write("#### 매출액_UMAG 누락 행 목록")
-                        import pandas as pd
                         df_umag_miss = pd.DataFrame(missing_all["UMAG"])
                         st.dataframe(df_umag_miss)
 
@@ -1229,10 +1367,7 @@ def section_one_report_input():
         st.session_state["ym"] = ym
         st.session_state["report_date"] = report_date
 
-        creds_a = get_credentials_from_secrets("A")
-        gc_a = gspread.authorize(creds_a)
-        drive_svc_a = build("drive", "v3", credentials=creds_a)
-        sheet_svc_a = build("sheets", "v4", credentials=creds_a)
+        gc_a, drive_svc_a, sheet_svc_a = get_clients("A")
 
         check_dict = {}
         out_file_id = generate_report(
@@ -1248,6 +1383,7 @@ def section_one_report_input():
 
         st.session_state["report_done"] = True
         st.session_state["report_file_id"] = out_file_id
+        st.session_state.pop("report_xlsx", None)  # 이전 보고서에서 가져온 .xlsx는 폐기
         st.session_state["check_dict"] = check_dict
 
         st.success(f"보고서 생성 완료! file_id={out_file_id}")
@@ -1314,7 +1450,6 @@ def section_two_sheet_link_and_verification():
                     st.warning(f"다음 아티스트에서 불일치가 발생함: {unique_artists}")
                     
                     st.write("#### 정산서 검증에서 불일치인 항목들")
-                    import pandas as pd
                     df_err = pd.DataFrame(error_rows)
                     st.dataframe(df_err)
 
@@ -1333,6 +1468,214 @@ def section_two_sheet_link_and_verification():
 # ------------------------------------------------------------------------------
 # (D) 엑셀 업로드 → 아티스트별 XLSX 파일 분할
 # ------------------------------------------------------------------------------
+XLSX_MIME = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+
+def export_spreadsheet_xlsx(drive_svc, file_id: str) -> bytes:
+    """구글시트 전체를 Drive export로 .xlsx 1개(bytes)로 받기 (서식 포함, 파일→다운로드와 동일)"""
+    return execute_with_backoff(drive_svc.files().export_media(fileId=file_id, mimeType=XLSX_MIME))
+
+
+# 아티스트별 xlsx 생성 동시 실행 스레드 수 (재압축 zlib deflate는 GIL을 풀고 실행 -> 스레드로 병렬화)
+#  (Streamlit 서버 프로세스에서 fork/spawn 하지 않음 - 다중 스레드 fork 교착, __main__ 스크립트 함수 pickle 문제)
+XLSX_SPLIT_WORKERS = min(4, os.cpu_count() or 1)
+
+# ZIP 생성 중 진행률 UI 최소 갱신 간격(초) - 최대 20회/초
+SPLIT_PROGRESS_INTERVAL = 0.05
+
+_XLSX_SHEET_TAG_RE = re.compile(r"<sheet\b[^>]*?/>")
+_XLSX_RELATIONSHIP_TAG_RE = re.compile(r"<Relationship\b[^>]*?/>")
+_XLSX_OVERRIDE_TAG_RE = re.compile(r"<Override\b[^>]*?/>")
+_XLSX_DEFINED_NAMES_RE = re.compile(r"<definedNames\s*/>|<definedNames\b.*?</definedNames>", re.S)
+_XLSX_DEFINED_NAME_RE = re.compile(r"<definedName\b[^>]*?(?:/>|>(.*?)</definedName>)", re.S)
+_XLSX_LOCAL_SHEET_ID_RE = re.compile(r'\blocalSheetId="(\d+)"')
+# 정의된 이름 수식 안의 시트 참조: 'UMAG_가수A(정산서)'!$A$1 (작은따옴표 안의 '는 '') 또는 Sheet1!A1
+_XLSX_SHEET_REF_RE = re.compile(r"'((?:[^']|'')+)'!|([^\s'!(),;:=+\-*/&^<>{}\"\[\]]+)!")
+_XLSX_ACTIVE_TAB_RE = re.compile(r'\b(activeTab|firstSheet)="\d+"')
+# 공유문자열 테이블 항목(<si>)과 이를 참조하는 셀(<c ... t="s"><v>인덱스</v>)
+_XLSX_SST_HEAD_RE = re.compile(r"<sst\b[^>]*>")
+_XLSX_SST_ITEM_RE = re.compile(r"<si\b[^>]*/>|<si\b.*?</si>", re.S)
+_XLSX_SST_COUNT_RE = re.compile(r'\s(?:count|uniqueCount)="\d+"')
+_XLSX_SHARED_CELL_RE = re.compile(r'(<c\b[^>]*?\st="s"[^>]*>\s*<v>)(\d+)(</v>)')
+# docProps/app.xml의 전체 탭 이름 목록 (HeadingPairs는 TitlesOfParts 개수 정보)
+_XLSX_APP_TITLES_RE = re.compile(r"<HeadingPairs>.*?</HeadingPairs>|<TitlesOfParts>.*?</TitlesOfParts>", re.S)
+_XLSX_CALC_CHAIN = "xl/calcChain.xml"
+_XLSX_SHARED_STRINGS = "xl/sharedStrings.xml"
+_XLSX_APP_PROPS = "docProps/app.xml"
+_XLSX_CONTENT_TYPES = "[Content_Types].xml"
+
+
+def _xml_unescape(text: str) -> str:
+    return (text.replace("&lt;", "<").replace("&gt;", ">")
+            .replace("&quot;", '"').replace("&apos;", "'").replace("&amp;", "&"))
+
+
+def _xml_attr(tag: str, name: str) -> Optional[str]:
+    """XML 태그 문자열에서 속성값(이스케이프 해제) 추출 - name은 'r:id'처럼 접두어 포함 가능"""
+    m = re.search(r'\s' + re.escape(name) + r'="([^"]*)"', tag)
+    if not m:
+        return None
+    return _xml_unescape(m.group(1))
+
+
+def _read_xlsx_parts(xlsx_data: bytes) -> Dict[str, bytes]:
+    with zipfile.ZipFile(io.BytesIO(xlsx_data)) as zf:
+        return {name: zf.read(name) for name in zf.namelist()}
+
+
+def _xlsx_sheet_entries(parts: Dict[str, bytes]) -> List[Tuple[str, str, str]]:
+    """
+    workbook.xml의 <sheet> 목록 -> [(탭 이름, <sheet> 태그 원문, 워크시트 파트 경로)]
+    (openpyxl로 파싱하지 않고 workbook.xml / workbook.xml.rels만 읽음)
+    """
+    rel_targets = {}
+    for tag in _XLSX_RELATIONSHIP_TAG_RE.findall(parts["xl/_rels/workbook.xml.rels"].decode("utf-8")):
+        target = _xml_attr(tag, "Target")
+        # Target은 'worksheets/sheet1.xml'(xl/ 기준 상대경로) 또는 '/xl/worksheets/sheet1.xml'(절대경로)
+        rel_targets[_xml_attr(tag, "Id")] = target[1:] if target.startswith("/") else "xl/" + target
+
+    entries = []
+    for tag in _XLSX_SHEET_TAG_RE.findall(parts["xl/workbook.xml"].decode("utf-8")):
+        entries.append((_xml_attr(tag, "name"), tag, rel_targets.get(_xml_attr(tag, "r:id"))))
+    return entries
+
+
+def _xlsx_rels_path(part: str) -> str:
+    """파트 경로 -> 그 파트의 관계(.rels) 파트 경로 ("" = 패키지 루트 -> '_rels/.rels')"""
+    head, _, tail = part.rpartition("/")
+    return f"{head}/_rels/{tail}.rels" if head else f"_rels/{tail}.rels"
+
+
+def _xlsx_rel_targets(parts: Dict[str, bytes], part: str) -> List[str]:
+    """part의 .rels에 적힌 패키지 내부 대상 파트 경로 목록 (External 링크 제외)"""
+    head = part.rpartition("/")[0]
+    rels = parts.get(_xlsx_rels_path(part))
+    if rels is None:
+        return []
+    targets = []
+    for tag in _XLSX_RELATIONSHIP_TAG_RE.findall(rels.decode("utf-8")):
+        if _xml_attr(tag, "TargetMode") == "External":
+            continue
+        target = _xml_attr(tag, "Target")
+        targets.append(target[1:] if target.startswith("/") else posixpath.normpath(posixpath.join(head, target)))
+    return targets
+
+
+def _rebuild_shared_strings(sst_xml: str, sheet_xmls: Dict[str, str]) -> Tuple[str, Dict[str, str]]:
+    """
+    남는 시트(sheet_xmls)가 참조하는 공유문자열만 담은 sharedStrings.xml + t="s" 인덱스를 다시 매긴 시트 XML
+    (빠지는 탭에만 있는 문자열 = 다른 아티스트의 이름/앨범/곡명이 결과 파일에 남지 않도록)
+    """
+    item_matches = list(_XLSX_SST_ITEM_RE.finditer(sst_xml))
+    new_index: Dict[int, int] = {}
+    ref_count = 0
+
+    def _renumber(m):
+        nonlocal ref_count
+        ref_count += 1
+        idx = new_index.setdefault(int(m.group(2)), len(new_index))
+        return f"{m.group(1)}{idx}{m.group(3)}"
+
+    renumbered = {path: _XLSX_SHARED_CELL_RE.sub(_renumber, xml) for path, xml in sheet_xmls.items()}
+
+    head = _XLSX_SST_HEAD_RE.search(sst_xml)
+    if head.group(0).endswith("/>"):  # <sst .../> (빈 테이블)
+        tail = "</sst>"
+    else:
+        tail = sst_xml[(item_matches[-1] if item_matches else head).end():]  # </sst> (+ extLst)
+    open_tag = _XLSX_SST_COUNT_RE.sub("", head.group(0)).rstrip("/>").rstrip()
+    kept_items = [item_matches[old].group(0) for old in new_index]  # dict 삽입 순서 = 새 인덱스 순서
+    new_xml = (sst_xml[:head.start()] + f'{open_tag} count="{ref_count}" uniqueCount="{len(kept_items)}">'
+               + "".join(kept_items) + tail)
+    return new_xml, renumbered
+
+
+def _repackage_sheets(parts: Dict[str, bytes], keep_sheets: List[str]) -> bytes:
+    """
+    원본 xlsx 파트에서 keep_sheets 탭만 남긴 xlsx(bytes) 생성
+    - 스타일/테마 등 공용 XML은 바이트 그대로 복사 (셀 파싱/재작성 없음 -> 구글시트 서식 그대로)
+    - 공유문자열 테이블은 남는 시트가 쓰는 문자열만으로 다시 만들고, 시트 XML의 t="s" 인덱스만 다시 매김
+    - workbook.xml: 빠지는 탭의 <sheet>, 빠지는 탭을 참조하는 definedName 제거 (localSheetId는 새 순번으로)
+    - .rels 관계를 따라 남는 탭에서 닿지 않는 파트(빠지는 탭의 메모/그림 등)와 calcChain.xml은 제거
+    - docProps/app.xml의 전체 탭 이름 목록(TitlesOfParts) 제거, activeTab/firstSheet는 첫 탭으로
+    """
+    drop_parts = {_XLSX_CALC_CHAIN}
+    kept_sheet_paths = []
+    local_ids: Dict[int, int] = {}  # 원본 탭 순번 -> 결과 파일 탭 순번
+    workbook_xml = parts["xl/workbook.xml"].decode("utf-8")
+    for old_idx, (title, tag, sheet_path) in enumerate(_xlsx_sheet_entries(parts)):
+        if title in keep_sheets:
+            local_ids[old_idx] = len(local_ids)
+            kept_sheet_paths.append(sheet_path)
+        else:
+            workbook_xml = workbook_xml.replace(tag, "", 1)
+            drop_parts.add(sheet_path)
+
+    def _keep_defined_name(m):
+        tag = m.group(0)
+        local = _XLSX_LOCAL_SHEET_ID_RE.search(tag)
+        if local and int(local.group(1)) not in local_ids:
+            return ""
+        for quoted, bare in _XLSX_SHEET_REF_RE.findall(_xml_unescape(m.group(1) or "")):
+            if (quoted.replace("''", "'") if quoted else bare) not in keep_sheets:
+                return ""
+        if local:
+            tag = tag.replace(local.group(0), f'localSheetId="{local_ids[int(local.group(1))]}"', 1)
+        return tag
+
+    def _filter_defined_names(m):
+        block = _XLSX_DEFINED_NAME_RE.sub(_keep_defined_name, m.group(0))
+        return block if _XLSX_DEFINED_NAME_RE.search(block) else ""
+
+    workbook_xml = _XLSX_DEFINED_NAMES_RE.sub(_filter_defined_names, workbook_xml)
+    workbook_xml = _XLSX_ACTIVE_TAB_RE.sub(r'\1="0"', workbook_xml)
+
+    # 패키지 루트(_rels/.rels)에서 관계를 따라 닿는 파트만 남김 (빠지는 탭을 거쳐야만 닿는 파트는 제외)
+    reachable = set()
+    pending = [""]
+    while pending:
+        for target in _xlsx_rel_targets(parts, pending.pop()):
+            if target in parts and target not in reachable and target not in drop_parts:
+                reachable.add(target)
+                pending.append(target)
+    out_set = {_XLSX_CONTENT_TYPES, *reachable, *map(_xlsx_rels_path, reachable | {""})}
+    out_names = [name for name in parts if name in out_set]
+
+    def _keep_workbook_rel(m):
+        target = _xml_attr(m.group(0), "Target")
+        return "" if (target[1:] if target.startswith("/") else "xl/" + target) in drop_parts else m.group(0)
+
+    rels_xml = _XLSX_RELATIONSHIP_TAG_RE.sub(_keep_workbook_rel, parts["xl/_rels/workbook.xml.rels"].decode("utf-8"))
+    types_xml = _XLSX_OVERRIDE_TAG_RE.sub(
+        lambda m: m.group(0) if _xml_attr(m.group(0), "PartName")[1:] in out_set else "",
+        parts[_XLSX_CONTENT_TYPES].decode("utf-8"))
+
+    replaced = {
+        "xl/workbook.xml": workbook_xml.encode("utf-8"),
+        "xl/_rels/workbook.xml.rels": rels_xml.encode("utf-8"),
+        _XLSX_CONTENT_TYPES: types_xml.encode("utf-8"),
+    }
+    if _XLSX_SHARED_STRINGS in out_set:
+        sst_xml, sheet_xmls = _rebuild_shared_strings(
+            parts[_XLSX_SHARED_STRINGS].decode("utf-8"),
+            {path: parts[path].decode("utf-8") for path in kept_sheet_paths})
+        replaced[_XLSX_SHARED_STRINGS] = sst_xml.encode("utf-8")
+        replaced.update((path, xml.encode("utf-8")) for path, xml in sheet_xmls.items())
+    if _XLSX_APP_PROPS in out_set:
+        replaced[_XLSX_APP_PROPS] = _XLSX_APP_TITLES_RE.sub("", parts[_XLSX_APP_PROPS].decode("utf-8")).encode("utf-8")
+
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for name in out_names:
+            zf.writestr(name, replaced.get(name, parts[name]))
+    return buf.getvalue()
+
+
+def build_artist_xlsx(source_parts: Dict[str, bytes], keep_sheets: List[str]) -> bytes:
+    """원본 xlsx 파트(source_parts, 읽기 전용 공유)에서 keep_sheets 탭만 담은 xlsx(bytes) 생성 (워커 스레드에서 실행)"""
+    return _repackage_sheets(source_parts, keep_sheets)
+
+
 def section_three_upload_and_split_excel():
     """
     1) 보고서 구글시트에서 '파일→다운로드→Microsoft Excel(.xlsx)'로 받은 파일을 업로드
@@ -1353,36 +1696,48 @@ def section_three_upload_and_split_excel():
             """
             [사용안내]
             1. 생성된 구글시트 파일을 '엑셀(.xlsx)'로 다운로드 받습니다.
+               ('구글시트에서 바로 가져오기' 버튼을 누르면 다운로드/업로드 없이 바로 진행됩니다.)
             2. 본 파일을 업로드하면, 아티스트별로 정산서/세부매출내역 탭만 포함된 엑셀 파일이 생성됩니다.
             3. 생성된 엑셀을 하나로 묶은 ZIP 파일을 다운로드하면, 아티스트별 보고서를 개별 확인할 수 있습니다.
             """
         )
 
-    # (2) 파일 업로드
+    # (2) 생성된 구글시트를 Drive export로 바로 가져오기 (또는 직접 받은 파일 업로드)
+    if st.button("구글시트에서 바로 가져오기"):
+        try:
+            _, drive_svc_a, _ = get_clients("A")
+            st.session_state["report_xlsx"] = export_spreadsheet_xlsx(
+                drive_svc_a, st.session_state["report_file_id"]
+            )
+        except HttpError as e:
+            st.error(f"구글시트 내보내기(.xlsx) 중 오류 발생: {e}")
+
     uploaded_file = st.file_uploader("정산 보고서 .xlsx 파일 업로드", type=["xlsx"])
-    if uploaded_file is None:
+    if uploaded_file is not None:
+        original_file_data = uploaded_file.read()
+    elif "report_xlsx" in st.session_state:
+        original_file_data = st.session_state["report_xlsx"]
+    else:
         return
 
-    # (3) 업로드된 엑셀 전체 로딩
+    # (3) 엑셀 전체 로딩
     progress_bar = st.progress(0.0)
     progress_text = st.empty()
 
-    original_file_data = uploaded_file.read()
     try:
-        # 전체 워크북 (구글시트에서 다운로드한 그대로)
-        wb_all = openpyxl.load_workbook(io.BytesIO(original_file_data))
+        # 탭 이름은 workbook.xml만 읽음 (셀 데이터는 파싱하지 않음), 파트는 아티스트별 분리에서 재사용
+        source_parts = _read_xlsx_parts(original_file_data)
+        sheet_names = [title for title, _, _ in _xlsx_sheet_entries(source_parts)]
     except Exception as e:
         st.error(f"엑셀 파일을 읽는 중 오류 발생: {e}")
         return
 
-    sheet_names = wb_all.sheetnames
     if not sheet_names:
         st.warning("업로드된 엑셀 파일에 시트가 없습니다.")
         return
 
     # (4) “어떤 아티스트”에 해당하는 탭들이 있는지 찾기
     #     예: 'UMAG_홍길동(정산서)', 'UMAG_홍길동(세부매출내역)' 형태라고 가정
-    from collections import defaultdict
     all_artists_sheets = defaultdict(
         lambda: {
             "umag_report": None,
@@ -1442,55 +1797,45 @@ def section_three_upload_and_split_excel():
 
 
     all_artist_list = sorted(all_artists_sheets.keys())
-    total_artists = len(all_artist_list)
 
-
-    # 5) ZIP으로 묶기
+    # 5) 아티스트별 (최대 4개) 탭 목록 - None이 아닌 것만, 탭이 하나도 없으면 스킵
+    jobs = []
+    for artist in all_artist_list:
+        sheet_dict = all_artists_sheets[artist]
+        keep_sheets = [sname for sname in (sheet_dict["umag_report"],
+                                           sheet_dict["umag_detail"],
+                                           sheet_dict["fluxus_report"],
+                                           sheet_dict["fluxus_detail"])
+                       if sname is not None]
+        if keep_sheets:
+            jobs.append((artist, keep_sheets))
+
+    current_ym = st.session_state.get("ym", "000000")
+
+    # 6) 아티스트별 xlsx는 스레드 풀에서 동시에 생성, ZIP 쓰기는 메인 스레드에서 순서대로
     zip_buf = io.BytesIO()
-    with zipfile.ZipFile(zip_buf, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
-        for i, artist in enumerate(all_artist_list):
-            ratio = (i + 1) / total_artists
-            progress_bar.progress(ratio)
-            progress_text.info(f"{int(ratio*100)}% - '{artist}' 처리 중...")
-
-            sheet_dict = all_artists_sheets[artist]
-
-            # 이 아티스트가 가지는 (최대 4개) 탭
-            # None이 아닌 것만 수집
-            keep_sheets = []
-            for sname in [sheet_dict["umag_report"],
-                          sheet_dict["umag_detail"],
-                          sheet_dict["fluxus_report"],
-                          sheet_dict["fluxus_detail"]]:
-                if sname is not None:
-                    keep_sheets.append(sname)
-
-            if not keep_sheets:
-                # 이 아티스트는 시트가 하나도 없으면 스킵
-                continue
-
-            # (A) 원본 워크북 복사
-            temp_wb = openpyxl.load_workbook(io.BytesIO(original_file_data))
-
-            # (B) 필요 시트(keep_sheets)만 남기고 전부 제거
-            for sname in temp_wb.sheetnames:
-                if sname not in keep_sheets:
-                    ws_del = temp_wb[sname]
-                    temp_wb.remove(ws_del)
-
-            # (C) 저장
-            single_buf = io.BytesIO()
-            temp_wb.save(single_buf)
-            single_buf.seek(0)
-
-            current_ym = st.session_state.get("ym", "000000")
+    # xlsx는 이미 deflate 압축된 파일이므로 ZIP은 무압축(ZIP_STORED)으로 묶음
+    with zipfile.ZipFile(zip_buf, mode="w", compression=zipfile.ZIP_STORED) as zf, \
+            ThreadPoolExecutor(max_workers=XLSX_SPLIT_WORKERS) as ex:
+        futures = [ex.submit(build_artist_xlsx, source_parts, keep_sheets) for _, keep_sheets in jobs]
+        next_ui_tick = 0.0
+        for i, (artist, _) in enumerate(jobs):
             safe_artist = artist.replace("/", "_").replace("\\", "_")
             # 예: "홍길동_정산보고서_202501.xlsx"
             filename_xlsx = f"{safe_artist}_정산보고서_{current_ym}.xlsx"
+            zf.writestr(filename_xlsx, futures[i].result())
+            futures[i] = None  # ZIP에 쓴 xlsx 바이트는 바로 해제 (ZIP + 개별 파일 이중 보관 방지)
 
-            zf.writestr(filename_xlsx, single_buf.getvalue())
+            # 진행률 UI는 SPLIT_PROGRESS_INTERVAL 간격으로만 갱신 (아티스트마다 websocket 왕복 방지)
+            now = time.monotonic()
+            if now >= next_ui_tick:
+                ratio = (i + 1) / len(jobs)
+                progress_bar.progress(ratio)
+                progress_text.info(f"{int(ratio*100)}% - '{artist}' 처리 완료")
+                next_ui_tick = now + SPLIT_PROGRESS_INTERVAL
 
     zip_buf.seek(0)
+    progress_bar.progress(1.0)
     progress_text.success("모든 아티스트 처리 완료! ZIP 다운로드 가능")
     st.download_button(
         label="ZIP 다운로드",
@@ -1501,6 +1846,464 @@ def section_three_upload_and_split_excel():
 
 
 
+# ------------------------------------------------------------------------------
+# 정산서/세부매출내역 탭 서식 (batchUpdate repeatCell 공용 서식)
+#  - 아티스트마다 같은 서식 dict를 새로 만들지 않고, 모듈 로드시 1번 만든 dict를 공유
+# ------------------------------------------------------------------------------
+COLOR_YELLOW = {"red": 1.0, "green": 0.8, "blue": 0.0}
+COLOR_CYAN = {"red": 0.3, "green": 0.82, "blue": 0.88}
+COLOR_LIGHT_BLUE = {"red": 0.896, "green": 0.988, "blue": 1}
+COLOR_EMAIL_BLUE = {"red": 0.29, "green": 0.53, "blue": 0.91}
+COLOR_BLACK = {"red": 0, "green": 0, "blue": 0}
+COLOR_WHITE = {"red": 1.0, "green": 1.0, "blue": 1.0}
+
+# 테두리 스타일 (요청마다 새로 만들지 않고 같은 dict를 참조)
+BORDER_SOLID = {"style": "SOLID", "width": 1}  # 색 미지정 (기본 검정)
+BORDER_SOLID_WHITE = {"style": "SOLID", "width": 1, "color": COLOR_WHITE}
+BORDER_SOLID_BLACK = {"style": "SOLID", "width": 1, "color": COLOR_BLACK}
+BORDER_DOTTED_BLACK = {"style": "DOTTED", "width": 1, "color": COLOR_BLACK}
+
+TEXT_MALGUN_10 = {"fontFamily": "Malgun Gothic", "fontSize": 10, "bold": False}
+TEXT_MALGUN_10_BOLD = {"fontFamily": "Malgun Gothic", "fontSize": 10, "bold": True}
+TEXT_MALGUN_15_BOLD = {"fontFamily": "Malgun Gothic", "fontSize": 15, "bold": True}
+
+# 세부매출내역 금액(G열) 표시 형식 - 값은 숫자(to_won)로 쓰고 '₩1,234' 표시는 시트가 담당
+KRW_NUMBER_FORMAT = {"type": "CURRENCY", "pattern": "₩#,##0"}
+
+
+def _cell_format(fields: str, **user_entered_format: Any) -> Dict[str, Any]:
+    """repeatCell에 들어갈 cell/fields 묶음 생성"""
+    return {
+        "cell": {"userEnteredFormat": user_entered_format},
+        "fields": fields,
+    }
+
+
+# 요청 fields 마스크 (같은 문자열 객체를 모든 요청에서 공유)
+_HALIGN_TEXT = "userEnteredFormat(horizontalAlignment,textFormat)"
+_HALIGN_NUMFMT = "userEnteredFormat(horizontalAlignment,numberFormat)"
+_HALIGN_TEXT_NUMFMT = "userEnteredFormat(horizontalAlignment,textFormat,numberFormat)"
+_ALIGN_TEXT = "userEnteredFormat(horizontalAlignment,verticalAlignment,textFormat)"
+_BG_ALIGN_TEXT = "userEnteredFormat(backgroundColor,horizontalAlignment,verticalAlignment,textFormat)"
+_GRID_SIZE = "gridProperties(rowCount,columnCount)"
+_PIXEL_SIZE = "pixelSize"
+
+# (1) 세부매출내역 탭
+FMT_DETAIL_HEADER_YELLOW = _cell_format(
+    _BG_ALIGN_TEXT, backgroundColor=COLOR_YELLOW, horizontalAlignment="CENTER", verticalAlignment="MIDDLE",
+    textFormat={"bold": True, "foregroundColor": COLOR_BLACK})
+FMT_DETAIL_SUM_YELLOW = _cell_format(
+    _BG_ALIGN_TEXT, backgroundColor=COLOR_YELLOW, horizontalAlignment="CENTER", verticalAlignment="MIDDLE",
+    textFormat={"bold": True})
+FMT_DETAIL_HEADER_CYAN = _cell_format(
+    _BG_ALIGN_TEXT, backgroundColor=COLOR_CYAN, horizontalAlignment="CENTER", verticalAlignment="MIDDLE",
+    textFormat={"bold": True, "foregroundColor": COLOR_BLACK})
+FMT_DETAIL_SUM_CYAN = _cell_format(
+    _BG_ALIGN_TEXT, backgroundColor=COLOR_CYAN, horizontalAlignment="CENTER", verticalAlignment="MIDDLE",
+    textFormat={"bold": True})
+FMT_DETAIL_SUM_VALUE = _cell_format(
+    _HALIGN_TEXT_NUMFMT, horizontalAlignment="RIGHT",
+    textFormat={"bold": True}, numberFormat=KRW_NUMBER_FORMAT)
+FMT_DETAIL_VALUE = _cell_format(
+    _HALIGN_NUMFMT, horizontalAlignment="RIGHT", numberFormat=KRW_NUMBER_FORMAT)
+
+# (2) 정산서 탭
+FMT_BODY_CENTER = _cell_format(
+    _ALIGN_TEXT, horizontalAlignment="CENTER", verticalAlignment="MIDDLE", textFormat=TEXT_MALGUN_10)
+FMT_BODY_CENTER_BOLD = _cell_format(
+    _ALIGN_TEXT, horizontalAlignment="CENTER", verticalAlignment="MIDDLE", textFormat=TEXT_MALGUN_10_BOLD)
+FMT_BODY_RIGHT = _cell_format(
+    _ALIGN_TEXT, horizontalAlignment="RIGHT", verticalAlignment="MIDDLE", textFormat=TEXT_MALGUN_10)
+FMT_PERIOD_TITLE = _cell_format(
+    _ALIGN_TEXT, horizontalAlignment="LEFT", verticalAlignment="MIDDLE", textFormat=TEXT_MALGUN_15_BOLD)
+FMT_REPORT_TITLE = _cell_format(
+    _BG_ALIGN_TEXT, backgroundColor=COLOR_LIGHT_BLUE, horizontalAlignment="CENTER", verticalAlignment="MIDDLE",
+    textFormat=TEXT_MALGUN_15_BOLD)
+FMT_NOTICE_LEFT = _cell_format(
+    _ALIGN_TEXT, horizontalAlignment="LEFT", verticalAlignment="MIDDLE", textFormat={"bold": False})
+FMT_TITLE_LEFT_BOLD = _cell_format(
+    _ALIGN_TEXT, horizontalAlignment="LEFT", verticalAlignment="MIDDLE", textFormat={"bold": True})
+FMT_EMAIL_BLUE_BOLD = _cell_format(
+    _ALIGN_TEXT, horizontalAlignment="RIGHT", verticalAlignment="MIDDLE",
+    textFormat={"foregroundColor": COLOR_EMAIL_BLUE, "fontFamily": "Malgun Gothic", "fontSize": 10, "bold": True})
+FMT_HEADER_CYAN = _cell_format(
+    _BG_ALIGN_TEXT, backgroundColor=COLOR_CYAN, horizontalAlignment="CENTER", verticalAlignment="MIDDLE",
+    textFormat=TEXT_MALGUN_10_BOLD)
+FMT_SUM_BLUE = _cell_format(
+    _BG_ALIGN_TEXT, backgroundColor=COLOR_LIGHT_BLUE, horizontalAlignment="CENTER", verticalAlignment="MIDDLE",
+    textFormat=TEXT_MALGUN_10_BOLD)
+
+
+def add_repeat(requests: List[Request], range_: GridRange, fmt: Dict[str, Any]) -> None:
+    """repeatCell 요청 추가 (fmt는 위 FMT_* 공용 서식)"""
+    requests.append({
+        "repeatCell": {
+            "range": range_,
+            "cell": fmt["cell"],
+            "fields": fmt["fields"],
+        }
+    })
+
+
+def grid_range(sheet_id: int, r0: int, r1: int, c0: int, c1: int) -> GridRange:
+    """GridRange 생성 (행/열 모두 0-based, end는 미포함)"""
+    return {
+        "sheetId": sheet_id,
+        "startRowIndex": r0,
+        "endRowIndex": r1,
+        "startColumnIndex": c0,
+        "endColumnIndex": c1
+    }
+
+
+def make_borders(range_: GridRange, border: Dict[str, Any],
+                 inner_border: Optional[Dict[str, Any]] = None) -> Request:
+    """updateBorders 요청 생성 (바깥 4면 = border, 안쪽 가로/세로 = inner_border 또는 border)"""
+    inner = border if inner_border is None else inner_border
+    return {"updateBorders": {
+        "range": range_,
+        "top": border, "bottom": border, "left": border, "right": border,
+        "innerHorizontal": inner, "innerVertical": inner
+    }}
+
+
+def dimension_size_requests(sheet_id: int, dimension: str, sizes: Dict[int, int]) -> List[Request]:
+    """
+    열너비/행높이 updateDimensionProperties 요청 목록 ({0-based 인덱스: 픽셀})
+    호출부에서 requests.extend(...) 한 번으로 붙인다.
+    """
+    return [
+        {
+            "updateDimensionProperties": {
+                "range": {
+                    "sheetId": sheet_id,
+                    "dimension": dimension,
+                    "startIndex": idx,
+                    "endIndex": idx + 1
+                },
+                "properties": {"pixelSize": size},
+                "fields": _PIXEL_SIZE
+            }
+        }
+        for idx, size in sizes.items()
+    ]
+
+
+def make_merge(sheet_id: int, r0: int, r1: int, c0: int, c1: int) -> Request:
+    """mergeCells(MERGE_ALL) 요청 생성"""
+    return {
+        "mergeCells": {
+            "range": grid_range(sheet_id, r0, r1, c0, c1),
+            "mergeType": "MERGE_ALL"
+        }
+    }
+
+
+def make_banding(sheet_id: int, r0: int, r1: int, c0: int, c1: int) -> Request:
+    """
+    addBanding(흰색/연파랑 줄무늬) 요청 생성
+    (BandingProperties는 색상만 지정 가능 -> 글꼴/정렬은 repeatCell로 따로 지정)
+    """
+    return {
+        "addBanding": {
+            "bandedRange": {
+                "range": grid_range(sheet_id, r0, r1, c0, c1),
+                "rowProperties": {
+                    "firstBandColor": COLOR_WHITE,
+                    "secondBandColor": COLOR_LIGHT_BLUE
+                },
+            }
+        }
+    }
+
+
+def add_merge(requests: List[Request], sheet_id: int, r0: int, r1: int, c0: int, c1: int) -> None:
+    """mergeCells 요청 추가 (1칸짜리/빈 범위는 병합할 필요가 없으므로 생략)"""
+    if r1 <= r0 or c1 <= c0 or (r1 - r0) * (c1 - c0) == 1:
+        return
+    requests.append(make_merge(sheet_id, r0, r1, c0, c1))
+
+
+def emit_table(requests: List[Request], sheet_id: int, title_row: int, header_row: int,
+               body_rows: Optional[Tuple[int, int]] = None, sum_row: Optional[int] = None,
+               end_col: int = 7, banded: bool = False, with_header: bool = True) -> None:
+    """
+    정산서 표 1개 서식 요청 추가 (타이틀 / 헤더 / 본문 / 합계행)
+    - body_rows: (시작행, 끝행) 또는 None
+    - sum_row  : 합계행 (B~끝-1열 병합 + 파란 배경) 또는 None
+    - banded   : True면 본문에 줄무늬(addBanding) 추가
+    - with_header: False면 타이틀/헤더 생략 (정산서 템플릿에 이미 적용된 고정 위치 표)
+    """
+    if with_header:
+        add_repeat(requests, grid_range(sheet_id, title_row, title_row+1, 1, 2), FMT_TITLE_LEFT_BOLD)
+        add_repeat(requests, grid_range(sheet_id, header_row, header_row+1, 1, end_col), FMT_HEADER_CYAN)
+    if body_rows is not None and body_rows[1] > body_rows[0]:  # 유효범위 체크 (빈 본문이면 생략)
+        if banded:
+            requests.append(make_banding(sheet_id, body_rows[0], body_rows[1], 1, end_col))
+        add_repeat(requests, grid_range(sheet_id, body_rows[0], body_rows[1], 1, end_col), FMT_BODY_CENTER)
+    if sum_row is not None:
+        add_merge(requests, sheet_id, sum_row, sum_row+1, 1, end_col-1)
+        add_repeat(requests, grid_range(sheet_id, sum_row, sum_row+1, 1, end_col), FMT_SUM_BLUE)
+
+
+# 셀 서식 결과에 영향이 없는 요청 (repeatCell 사이에 끼어 있어도 합치기 가능)
+_FORMAT_NEUTRAL_REQUESTS = ("mergeCells", "updateDimensionProperties", "updateSheetProperties")
+
+
+def _join_grid_ranges(a: GridRange, b: GridRange) -> Optional[GridRange]:
+    """a 바로 아래(행) 또는 오른쪽(열)에 b가 붙어 있으면 합친 GridRange, 아니면 None"""
+    if a["sheetId"] != b["sheetId"]:
+        return None
+    same_cols = (a["startColumnIndex"] == b["startColumnIndex"] and
+                 a["endColumnIndex"] == b["endColumnIndex"])
+    same_rows = (a["startRowIndex"] == b["startRowIndex"] and
+                 a["endRowIndex"] == b["endRowIndex"])
+    if same_cols and a["endRowIndex"] == b["startRowIndex"]:
+        return dict(a, endRowIndex=b["endRowIndex"])
+    if same_rows and a["endColumnIndex"] == b["startColumnIndex"]:
+        return dict(a, endColumnIndex=b["endColumnIndex"])
+    return None
+
+
+def coalesce_repeat_cells(requests: List[Request]) -> List[Request]:
+    """
+    같은 서식(cell/fields)의 repeatCell이 행/열로 맞닿아 있으면 하나의 범위로 합침
+    - 사이에 서식에 영향을 주는 요청(다른 repeatCell, 테두리, 밴딩 등)이 있으면 순서 보존을 위해 합치지 않음
+    """
+    merged = []
+    last_repeat = None  # merged 안의 직전 repeatCell
+    for req in requests:
+        rc = req.get("repeatCell")
+        if rc is None:
+            if next(iter(req)) not in _FORMAT_NEUTRAL_REQUESTS:
+                last_repeat = None
+            merged.append(req)
+            continue
+
+        if last_repeat is not None:
+            prev = last_repeat["repeatCell"]
+            if prev["fields"] == rc["fields"] and prev["cell"] == rc["cell"]:
+                joined = _join_grid_ranges(prev["range"], rc["range"])
+                if joined is not None:
+                    prev["range"] = joined
+                    continue
+
+        last_repeat = {"repeatCell": dict(rc)}
+        merged.append(last_repeat)
+    return merged
+
+
+def dedupe_requests(requests: List[Request]) -> List[Request]:
+    """
+    완전히 같은 요청 중복 제거
+    - mergeCells: 같은 범위 병합은 몇 번을 해도 결과가 같으므로 전체에서 1번만
+    - 서식 요청(repeatCell/테두리 등): 바로 앞 서식 요청과 같을 때만 제거
+      (사이에 다른 서식이 끼어 있으면 다시 적용해야 결과가 같으므로 유지)
+    """
+    out = []
+    seen_merges = set()
+    last_format_key = None
+    for req in requests:
+        if "mergeCells" in req:
+            key = json.dumps(req, sort_keys=True)
+            if key in seen_merges:
+                continue
+            seen_merges.add(key)
+        elif not any(kind in req for kind in _FORMAT_NEUTRAL_REQUESTS):
+            key = json.dumps(req, sort_keys=True)
+            if key == last_format_key:
+                continue
+            last_format_key = key
+        out.append(req)
+    return out
+
+
+def compact_requests(requests: List[Request]) -> List[Request]:
+    """탭 1개 분량의 요청을 합치기(coalesce) + 중복 제거한 목록"""
+    return dedupe_requests(coalesce_repeat_cells(requests))
+
+
+def compute_report_cursors(n_service_rows: int, n_album_rows: int) -> Dict[str, int]:
+    """
+    정산서 탭 표 위치(0-based 행) 계산 - 1번 표 본문 행 수 / 2번 표 본문 행 수만으로 결정됨
+    - sum1/sum2/sum4: 1/2/4번 표 합계행 기준 (sum1, sum2는 합계행 +1)
+    - album/deduction/rate: 2/3/4번 표 헤더행, sum3: 4번 표 타이틀행
+    - report_end: 탭 전체 행 수 (부가세 안내 포함)
+    """
+    sum1 = 14 + n_service_rows + 2      # 1번 표 본문(14행~) + 빈 행 + 합계행
+    album = sum1 + 2                    # 2번 표 타이틀 다음 헤더행
+    sum2 = album + n_album_rows + 2     # 헤더 + 본문 + 합계행
+    deduction = sum2 + 2                # 3번 표 헤더행
+    sum3 = deduction + 3                # 헤더 + 본문 + 빈 행
+    rate = sum3 + 1                     # 4번 표 헤더행
+    sum4 = rate + 2                     # 헤더 + 본문 다음 총 정산금액 행
+    return {
+        "sum1": sum1, "album": album, "sum2": sum2, "deduction": deduction,
+        "sum3": sum3, "rate": rate, "sum4": sum4, "report_end": sum4 + 4,
+    }
+
+
+# ------------------------------------------------------------------------------
+# 정산서 탭 템플릿
+#  - 열너비/행높이/상단 1~10행/1번 표 헤더(13~14행) 서식은 아티스트와 무관 -> 소속별 템플릿 탭에 1번만 지정
+#  - 아티스트 정산서 탭은 템플릿을 duplicateSheet로 복제해서 생성 (행 위치가 바뀌는 서식만 매번 지정)
+# ------------------------------------------------------------------------------
+REPORT_TEMPLATE_TITLES = {
+    "UMAG": "_template_UMAG(정산서)",
+    "FLUXUS": "_template_FLUXUS(정산서)",
+}
+REPORT_COLUMN_WIDTHS = {
+    "UMAG": [40, 200, 130, 120, 130, 130, 130, 40],   # A ~ H
+    "FLUXUS": [40, 180, 160, 140, 150, 160, 40],      # A ~ G
+}
+REPORT_ROW_HEIGHTS = {3: 30, 5: 30}  # 4행(판매분), 6행(정산내역서 제목)
+
+# 세부매출내역 탭 열너비 {0-based 열: 픽셀}
+DETAIL_COLUMN_WIDTHS = {0: 140, 1: 140, 4: 120}
+FLUXUS_DETAIL_COLUMN_WIDTHS = {0: 140, 1: 160, 2: 100, 3: 160, 4: 100, 5: 120, 6: 140}
+
+
+def build_report_static_requests(sheet_id: int, sosok: str) -> List[Request]:
+    """정산서 탭에서 아티스트와 무관한 서식 요청 (열너비/행높이/상단 고정 항목/1번 표 헤더)"""
+    requests: List[Request] = []
+    last_col = len(REPORT_COLUMN_WIDTHS[sosok]) - 1  # 오른쪽 여백 열 (UMAG=H, FLUXUS=G)
+
+    # (B) 열너비 / (C) 특정행 높이
+    requests.extend(dimension_size_requests(sheet_id, "COLUMNS", dict(enumerate(REPORT_COLUMN_WIDTHS[sosok]))))
+    requests.extend(dimension_size_requests(sheet_id, "ROWS", REPORT_ROW_HEIGHTS))
+
+    # (D)~(G), (J-1/J-2) 셀 서식은 1~14행 x A~여백 전 열 서식 행렬로 만들어 updateCells 1번에 지정
+    #  - 서식 dict는 FMT_* 공용 객체를 그대로 참조 (셀마다 복사하지 않음)
+    #  - 지정하지 않은 칸은 빈 CellData -> 새 탭 기본 서식과 동일
+    cell_grid = [[{} for _ in range(last_col)] for _ in range(14)]
+
+    def fill(r0, r1, c0, c1, fmt):
+        for r in range(r0, r1):
+            for c in range(c0, c1):
+                cell_grid[r][c] = fmt["cell"]
+
+    fill(1, 2, last_col-1, last_col, FMT_BODY_RIGHT)        # (D) 발행 날짜 (여백 바로 왼쪽 칸, 2행)
+    fill(3, 4, 1, last_col-2, FMT_PERIOD_TITLE)             # (E) 판매분 (4행)
+    fill(5, 6, 1, last_col, FMT_REPORT_TITLE)               # (F) 아티스트 정산내역서 (6행)
+    fill(7, 10, 1, last_col-2, FMT_NOTICE_LEFT)             # (G) 안내문 (8~10행)
+    fill(9, 10, last_col-2, last_col, FMT_EMAIL_BLUE_BOLD)  # 10행 (E-Mail 칸)
+    fill(12, 13, 1, 2, FMT_TITLE_LEFT_BOLD)                 # (J-1) 1번 표 타이틀 (13행)
+    fill(13, 14, 1, last_col, FMT_HEADER_CYAN)              # (J-2) 1번 표 헤더 (14행)
+    requests.append({
+        "updateCells": {
+            "start": {"sheetId": sheet_id, "rowIndex": 0, "columnIndex": 0},
+            "rows": [{"values": row} for row in cell_grid],
+            "fields": _BG_ALIGN_TEXT
+        }
+    })
+
+    # 병합 (E)(F)(G) + 1번 표 헤더
+    add_merge(requests, sheet_id, 3, 4, 1, last_col-2)
+    add_merge(requests, sheet_id, 5, 6, 1, last_col)
+    for r in (7, 8, 9):
+        add_merge(requests, sheet_id, r, r+1, 1, last_col-2)
+    add_merge(requests, sheet_id, 9, 10, last_col-2, last_col)
+    if sosok == "FLUXUS":
+        add_merge(requests, sheet_id, 13, 14, 2, 4)  # 헤더 C~D열 병합
+    return requests
+
+
+def build_report_dynamic_requests(sheet_id: int, sosok: str, cursors: Dict[str, int],
+                                  with_static: bool = False) -> List[Request]:
+    """
+    정산서 탭에서 표 위치(cursors, compute_report_cursors 결과)에 따라 달라지는 서식 요청
+    - UMAG/FLUXUS 공용 (열 수만 다름, FLUXUS는 C~D열 병합 추가)
+    - with_static: True면 템플릿 고정 서식(build_report_static_requests)도 포함 (템플릿 복제가 아닌 탭)
+    """
+    requests: List[Request] = []
+    n_cols = len(REPORT_COLUMN_WIDTHS[sosok])  # UMAG=8(A~H), FLUXUS=7(A~G)
+    end_col = n_cols - 1                       # 표 끝 열(미포함) = 오른쪽 여백 열
+    sum1, album, sum2 = cursors["sum1"], cursors["album"], cursors["sum2"]
+    deduction, sum3, rate = cursors["deduction"], cursors["sum3"], cursors["rate"]
+    sum4, report_end = cursors["sum4"], cursors["report_end"]
+    gr = lambda r0, r1, c0, c1: grid_range(sheet_id, r0, r1, c0, c1)
+
+    # (A) 시트 row/col 크기
+    requests.append({
+        "updateSheetProperties": {
+            "properties": {
+                "sheetId": sheet_id,
+                "gridProperties": {"rowCount": report_end, "columnCount": n_cols}
+            },
+            "fields": _GRID_SIZE
+        }
+    })
+
+    # (B)~(G), (J-1/J-2) 열너비/행높이/상단 고정 항목/1번 표 헤더
+    if with_static:
+        requests.extend(build_report_static_requests(sheet_id, sosok))
+
+    # (H) 1열 정렬 (번호 영역)
+    add_repeat(requests, gr(1, rate+1, 0, 1), FMT_BODY_CENTER)
+    # (I) 하단 고정 항목(부가세, 표 마지막 열)
+    add_repeat(requests, gr(report_end-2, report_end, end_col-1, end_col), FMT_BODY_RIGHT)
+
+    # (J-4~J-5) "음원 서비스별 정산내역" 표 본문(줄무늬)/합계행 (타이틀/헤더는 템플릿)
+    emit_table(requests, sheet_id, 12, 13, body_rows=(14, sum1-2), sum_row=sum1-1,
+               end_col=end_col, banded=True, with_header=False)
+    # (J-3) 합계행 전 병합
+    add_merge(requests, sheet_id, sum1-2, sum1-1, 1, end_col)
+    if sosok == "FLUXUS":
+        # (J-6) 표에 C~D열 병합
+        for r_idx in range(14, sum1-2):
+            add_merge(requests, sheet_id, r_idx, r_idx+1, 2, 4)
+
+    # (K) 앨범별 정산내역 표 (타이틀/헤더/본문/합계행)
+    emit_table(requests, sheet_id, album-1, album, body_rows=(album+1, sum2-1), sum_row=sum2-1,
+               end_col=end_col)
+    if sosok == "FLUXUS":
+        # 헤더/본문 C~D열 병합
+        for r_idx in range(album, sum2-1):
+            add_merge(requests, sheet_id, r_idx, r_idx+1, 2, 4)
+
+    # (L) 공제 내역 표 (합계 칸만 굵게)
+    emit_table(requests, sheet_id, deduction-1, deduction, body_rows=(deduction+1, deduction+2),
+               end_col=end_col)
+    add_repeat(requests, gr(deduction+1, deduction+2, end_col-1, end_col), FMT_BODY_CENTER_BOLD)
+
+    # (M) 수익 배분 표
+    emit_table(requests, sheet_id, rate-1, rate, body_rows=(rate+1, rate+2), sum_row=sum4,
+               end_col=end_col)
+
+    # (N) 전체 테두리: 안쪽 화이트 + 시트 외곽 검정 SOLID (요청 1개)
+    requests.append(make_borders(gr(0, report_end, 0, n_cols), BORDER_SOLID_BLACK,
+                                 inner_border=BORDER_SOLID_WHITE))
+
+    # (O) 표 부분 점선 (1~4번 표, 바깥+안쪽 모두 DOTTED)
+    for r1, r2 in ((13, sum1), (album, sum2), (deduction, sum3-1), (rate, sum4+1)):
+        requests.append(make_borders(gr(r1, r2, 1, end_col), BORDER_DOTTED_BLACK))
+    return requests
+
+
+def create_report_templates(spreadsheet_id: str, sheet_svc, sosok_list: List[str]) -> Dict[str, int]:
+    """
+    소속별 정산서 템플릿 탭 생성 + 고정 서식 지정
+    (이전 실행에서 남은 템플릿 탭이 있으면 재사용)
+    return: {소속: 템플릿 sheetId}
+    """
+    template_titles = [REPORT_TEMPLATE_TITLES[s] for s in sosok_list]
+    if not template_titles:
+        return {}
+
+    title_to_id = batch_add_sheets(spreadsheet_id, sheet_svc, template_titles)
+    if any(t not in title_to_id for t in template_titles):
+        meta = execute_with_backoff(sheet_svc.spreadsheets().get(spreadsheetId=spreadsheet_id))
+        for sh_meta in meta["sheets"]:
+            title_to_id.setdefault(sh_meta["properties"]["title"], sh_meta["properties"]["sheetId"])
+
+    template_ids = {s: title_to_id[REPORT_TEMPLATE_TITLES[s]] for s in sosok_list}
+    requests = []
+    for sosok, sheet_id in template_ids.items():
+        requests.extend(build_report_static_requests(sheet_id, sosok))
+    send_batch_update(sheet_svc, spreadsheet_id, coalesce_repeat_cells(requests))
+    return template_ids
+
+
 # ========== [4] 핵심 로직: generate_report =============
 def generate_report(
     ym: str, 
@@ -1532,12 +2335,12 @@ def generate_report(
         st.error("Google Sheet 'input_song cost'를 찾을 수 없습니다.")
         return ""
 
-    ws_map_sc = {ws.title: ws for ws in song_cost_sh.worksheets()}
+    ws_map_sc = {ws.title: ws for ws in call_with_backoff(song_cost_sh.worksheets)}
     if ym not in ws_map_sc:
         st.error(f"input_song cost에 '{ym}' 탭이 없습니다.")
         return ""
     ws_sc = ws_map_sc[ym]
-    data_sc = ws_sc.get_all_values()
+    data_sc = call_with_backoff(ws_sc.get_all_values)
     if not data_sc:
         st.error(f"'{ym}' 탭이 비어있습니다.")
         return ""
@@ -1546,48 +2349,47 @@ def generate_report(
     rows_sc = data_sc[1:-1]
 
     # 이번에 '당월 발생액' 칼럼까지 사용하므로 인덱스 추가
+    col_sc = header_index_map(header_sc)  # 헤더명 -> 열 인덱스 (list.index 반복 검색 대신)
     try:
-        idx_sosok  = header_sc.index("소속")  # ← 추가
-        idx_artist = header_sc.index("아티스트명")
-        idx_rate   = header_sc.index("정산 요율")
-        idx_prev   = header_sc.index("전월 잔액")
-        idx_curr   = header_sc.index("당월 발생액")
-        idx_deduct = header_sc.index("당월 차감액")
-        idx_remain = header_sc.index("당월 잔액")
-    except ValueError as e:
+        idx_sosok  = col_sc["소속"]  # ← 추가
+        idx_artist = col_sc["아티스트명"]
+        idx_rate   = col_sc["정산 요율"]
+        idx_prev   = col_sc["전월 잔액"]
+        idx_curr   = col_sc["당월 발생액"]
+        idx_deduct = col_sc["당월 차감액"]
+        idx_remain = col_sc["당월 잔액"]
+    except KeyError as e:
         st.error(f"[input_song cost] 시트 칼럼 명이 맞는지 확인 필요: {e}")
         return ""
 
-    # 숫자로 변환하는 헬퍼
-    def to_num(x: str) -> float:
-        if not x:
-            return 0.0
-        return float(x.replace("%", "").replace(",", ""))
-
-
     # 아티스트별 곡비 정보
     #   → '전월 잔액'(prev), '당월 발생액'(curr), '당월 차감'(deduct), '당월 잔액'(remain), '정산요율'(rate)
     #   (실제 작업에서는 나중에 '곡비' = prev + curr)
     artist_cost_dict = {}
     artist_sosok_dict = {}  # ← 새로 추가
 
-    for row in rows_sc:
+    cost_rows = [row for row in rows_sc if row[idx_artist].strip()]
+
+    # 숫자 칼럼은 셀마다 to_num 대신 열 단위로 한 번에 변환 ('%', ',' 제거, 빈칸 -> 0.0)
+    cost_cols = {
+        "정산요율": idx_rate,
+        "전월잔액": idx_prev,
+        "당월발생": idx_curr,
+        "당월차감액": idx_deduct,
+        "당월잔액": idx_remain,
+    }
+    cost_df = pd.DataFrame({
+        key: pd.Series([row[idx] for row in cost_rows], dtype=object)
+               .str.replace(r"[%,]", "", regex=True).replace("", "0").astype(float)
+        for key, idx in cost_cols.items()
+    })
+
+    for row, cost_data in zip(cost_rows, cost_df.to_dict("records")):
         artist_name = row[idx_artist].strip()
-        if not artist_name:
-            continue
 
-        sosok_str = row[idx_sosok].strip().upper()  # "UMAG", "FLUXUS", "UMAG,FLUXUS" 등
-        # 만약 쉼표 등으로 여러 소속일 수 있다면 split
-        affils = re.split(r'[,&/]', sosok_str)  # ["UMAG","FLUXUS"] 등
-        affils = [x.strip() for x in affils if x.strip()]
-
-        cost_data = {
-            "정산요율": to_num(row[idx_rate]),
-            "전월잔액": to_num(row[idx_prev]),
-            "당월발생": to_num(row[idx_curr]),
-            "당월차감액": to_num(row[idx_deduct]),
-            "당월잔액": to_num(row[idx_remain])
-        }
+        # "UMAG", "FLUXUS", "UMAG,FLUXUS" 등 -> ["UMAG","FLUXUS"] 등
+        affils = split_affiliations(row[idx_sosok])
+
         artist_cost_dict[artist_name] = cost_data
 
         # artist_sosok_dict에도 넣는다
@@ -1601,31 +2403,31 @@ def generate_report(
         st.error("Google Sheet 'input_online revenue_umag_integrated'를 찾을 수 없습니다.")
         return ""
 
-    ws_map_or = {ws.title: ws for ws in revenue_sh.worksheets()}
+    ws_map_or = {ws.title: ws for ws in call_with_backoff(revenue_sh.worksheets)}
     if ym not in ws_map_or:
         st.error(f"input_online revenue_umag_integrated에 '{ym}' 탭이 없습니다.")
         return ""
     ws_or = ws_map_or[ym]
-    data_or = ws_or.get_all_values()
+    data_or = call_with_backoff(ws_or.get_all_values)
     if not data_or:
         st.error(f"{ym} 탭이 비어있습니다.")
         return ""
 
     header_or = data_or[0]
     rows_or = data_or[1:]
+    col_or = header_index_map(header_or)
     try:
-        col_aartist = header_or.index("앨범아티스트")
-        col_album   = header_or.index("앨범명")
-        col_major   = header_or.index("대분류")
-        col_middle  = header_or.index("중분류")
-        col_service = header_or.index("서비스명")
-        col_revenue = header_or.index("권리사정산금액")
-    except ValueError as e:
+        col_aartist = col_or["앨범아티스트"]
+        col_album   = col_or["앨범명"]
+        col_major   = col_or["대분류"]
+        col_middle  = col_or["중분류"]
+        col_service = col_or["서비스명"]
+        col_revenue = col_or["권리사정산금액"]
+    except KeyError as e:
         st.error(f"[input_online revenue_umag_integrated] 시트 칼럼 명이 맞는지 확인 필요: {e}")
         return ""
 
     # 아티스트별 매출 정보
-    from collections import defaultdict
     artist_revenue_dict = defaultdict(list)
     for row in rows_or:
         a = row[col_aartist].strip()
@@ -1636,7 +2438,7 @@ def generate_report(
         mid = row[col_middle]
         srv = row[col_service]
         try:
-            rv_val = float(row[col_revenue].replace(",", ""))
+            rv_val = float(row[col_revenue].translate(_NO_COMMA))
         except:
             rv_val = 0.0
         artist_revenue_dict[a].append({
@@ -1663,34 +2465,34 @@ def generate_report(
     # 여기서 fluxus_song_sh / fluxus_yt_sh 중 ym 탭 존재 여부, get_all_values() 로 읽는 로직, 
     # 그리고 '가수명'(혹은 'ALBIM ARTIST') + '권리사 정산액' 칼럼 파싱 등을 하시면 됩니다.
     # 예시:
-    ws_map_fs = {ws.title: ws for ws in fluxus_song_sh.worksheets()}
+    ws_map_fs = {ws.title: ws for ws in call_with_backoff(fluxus_song_sh.worksheets)}
     if ym not in ws_map_fs:
         st.error(f"fluxus_song '{ym}' 탭 없음")
         return
     ws_fs = ws_map_fs[ym]
-    data_fs = ws_fs.get_all_values()
+    data_fs = call_with_backoff(ws_fs.get_all_values)
 
-    ws_map_fy = {ws.title: ws for ws in fluxus_yt_sh.worksheets()}
+    ws_map_fy = {ws.title: ws for ws in call_with_backoff(fluxus_yt_sh.worksheets)}
     if ym not in ws_map_fy:
         st.error(f"fluxus_yt '{ym}' 탭 없음")
         return
     ws_fy = ws_map_fy[ym]
-    data_fy = ws_fy.get_all_values()
+    data_fy = call_with_backoff(ws_fy.get_all_values)
 
 
     header_fs = data_fs[0]
     rows_fs = data_fs[1:-1]
+    col_fs = header_index_map(header_fs)
     try:
-        fs_col_aartist = header_fs.index("가수명")
-        fs_col_album   = header_fs.index("앨범명")
-        fs_col_country = header_fs.index("서비스 구분")
-        fs_col_revenue = header_fs.index("권리사 정산액")
-    except ValueError as e:
+        fs_col_aartist = col_fs["가수명"]
+        fs_col_album   = col_fs["앨범명"]
+        fs_col_country = col_fs["서비스 구분"]
+        fs_col_revenue = col_fs["권리사 정산액"]
+    except KeyError as e:
         st.error(f"[input_online revenue_fluxus_song] 시트 칼럼 명이 맞는지 확인 필요: {e}")
         return ""
 
     # 아티스트별 매출 정보
-    from collections import defaultdict
     fluxus_song_dict = defaultdict(list)
     sum_fs_rv_val = 0.0
     for row in rows_fs:
@@ -1700,7 +2502,7 @@ def generate_report(
         fs_alb = row[fs_col_album]
         fs_ctry = row[fs_col_country]
         try:
-            fs_rv_val = float(row[fs_col_revenue].replace(",", ""))
+            fs_rv_val = float(row[fs_col_revenue].translate(_NO_COMMA))
         except:
             fs_rv_val = 0.0
         sum_fs_rv_val += fs_rv_val
@@ -1714,19 +2516,19 @@ def generate_report(
 
     header_fy = data_fy[0]
     rows_fy = data_fy[1:]
+    col_fy = header_index_map(header_fy)
     try:
-        fy_col_aartist = header_fy.index("ALBIM ARTIST")
-        fy_col_album   = header_fy.index("ALBUM TITLE")
-        fy_col_title   = header_fy.index("TRACK TITLE")
-        fy_col_number  = header_fy.index("TRACK NO.")
-        fy_col_id = header_fy.index("TRACK ID")
-        fy_col_revenue = header_fy.index("권리사 정산액 \n(KRW)")
-    except ValueError as e:
+        fy_col_aartist = col_fy["ALBIM ARTIST"]
+        fy_col_album   = col_fy["ALBUM TITLE"]
+        fy_col_title   = col_fy["TRACK TITLE"]
+        fy_col_number  = col_fy["TRACK NO."]
+        fy_col_id = col_fy["TRACK ID"]
+        fy_col_revenue = col_fy["권리사 정산액 \n(KRW)"]
+    except KeyError as e:
         st.error(f"[input_online revenue_fluxus_yt] 시트 칼럼 명이 맞는지 확인 필요: {e}")
         return ""
 
     # 아티스트별 매출 정보
-    from collections import defaultdict
     fluxus_yt_dict = defaultdict(list)
     sum_fy_rv_val = 0.0
     for row in rows_fy:
@@ -1738,7 +2540,7 @@ def generate_report(
         fy_number = row[fy_col_number]
         fy_id = row[fy_col_id]
         try:
-            fy_rv_val = float(row[fy_col_revenue].replace(",", ""))
+            fy_rv_val = float(row[fy_col_revenue].translate(_NO_COMMA))
         except:
             fy_rv_val = 0.0
         sum_fy_rv_val += fy_rv_val
@@ -1751,6 +2553,11 @@ def generate_report(
             "sum_fy_rv_val": sum_fy_rv_val
         })
 
+    # 아티스트별 매출 행은 여기서 앨범 순으로 1번만 정렬 (아티스트 루프에서 다시 sorted() 하지 않음)
+    for rows_by_artist in (artist_revenue_dict, fluxus_song_dict, fluxus_yt_dict):
+        for artist_rows in rows_by_artist.values():
+            artist_rows.sort(key=lambda d: album_sort_key(d["album"]))
+
     
     # for artist, val in fluxus_song_dict.items():
     #    # val이 매출액 float 라면, "앨범명", "서비스명" 등도 함께 append 해야 할 수도 있음
@@ -1813,11 +2620,11 @@ def generate_report(
     # ------------------- (D) output_report_YYYYMM --------
     out_filename = f"ouput_report_{ym}"
     out_file_id = create_new_spreadsheet(out_filename, folder_id, drive_svc)
-    out_sh = gc.open_by_key(out_file_id)
+    out_sh = call_with_backoff(gc.open_by_key, out_file_id)
     
     # 기본생성 sheet1 삭제 시도
     try:
-        out_sh.del_worksheet(out_sh.worksheet("Sheet1"))
+        call_with_backoff(out_sh.del_worksheet, call_with_backoff(out_sh.worksheet, "Sheet1"))
     except:
         pass
 
@@ -1830,6 +2637,7 @@ def generate_report(
 
     # 시트 생성(batch)
     needed_titles = []
+    report_title_sosok = {}  # {정산서 탭 제목: 소속}
     for artist in all_artists:
         # 곡비 파일에 아티스트 없으면 스킵!
         if artist not in artist_sosok_dict:
@@ -1841,12 +2649,25 @@ def generate_report(
             if one_sosok == "UMAG":
                 needed_titles.append(f"{one_sosok}_{artist}(세부매출내역)")
                 needed_titles.append(f"{one_sosok}_{artist}(정산서)")
+                report_title_sosok[f"{one_sosok}_{artist}(정산서)"] = one_sosok
             elif one_sosok == "FLUXUS":
                 needed_titles.append(f"{one_sosok}_{artist}(세부매출내역)")
                 needed_titles.append(f"{one_sosok}_{artist}(정산서)")
+                report_title_sosok[f"{one_sosok}_{artist}(정산서)"] = one_sosok
             else:
                 print(f"unknown 소속: {one_sosok}")
-    batch_add_sheets(out_file_id, sheet_svc, needed_titles)
+
+    # 정산서 탭은 소속별 템플릿(고정 서식 적용 완료)을 복제해서 생성
+    template_ids = create_report_templates(
+        out_file_id, sheet_svc,
+        [s for s in REPORT_TEMPLATE_TITLES if s in report_title_sosok.values()]
+    )
+    created_titles = batch_add_sheets(
+        out_file_id, sheet_svc, needed_titles,
+        source_sheet_ids={t: template_ids[s] for t, s in report_title_sosok.items()}
+    )
+    # 탭 제목 -> Worksheet (메타데이터 1회 조회, 탭마다 out_sh.worksheet() 조회하지 않음)
+    out_ws_by_title = {w.title: w for w in call_with_backoff(out_sh.worksheets)}
 
 
     # ===================================================================
@@ -1855,9 +2676,17 @@ def generate_report(
 
     all_requests = []  # batchUpdate requests 모음
 
+    # 탭 값은 {"range", "values"}로 모아 두었다가 루프 뒤 values.batchUpdate로 한꺼번에 전송
+    value_data = []
+
     all_artists = sorted(artist_cost_dict.keys())  # 곡비파일에 있는 아티스트만
 
+    # 진행률 UI 갱신은 약 50회로 제한 (매 아티스트마다 갱신하면 websocket 왕복이 누적됨)
+    ui_step = max(1, len(all_artists) // 50)
+
     for i, artist in enumerate(all_artists):
+        show_progress = ((i + 1) % ui_step == 0) or (i == len(all_artists) - 1)
+
         if artist not in artist_sosok_dict:
             # 곡비 파일에 없는 아티스트는 스킵(또는 경고 표시)
             print(f"[WARN] 곡비에 없는 아티스트 '{artist}'는 무시합니다.")
@@ -1871,16 +2700,16 @@ def generate_report(
             #-------------------------------------------------------------------------
             if one_sosok == "UMAG":
                 # 진행률
-                ratio = (i + 1) / len(all_artists)
-                progress_bar.progress(ratio)
-                artist_placeholder.info(f"[{i+1}/{len(all_artists)}] '{artist}' 처리 중...")
+                if show_progress:
+                    ratio = (i + 1) / len(all_artists)
+                    progress_bar.progress(ratio)
+                    artist_placeholder.info(f"[{i+1}/{len(all_artists)}] '{artist}' 처리 중...")
 
                 # ##################################
                 # UMAG 세부매출내역 탭 (batchUpdate 방식)
                 # ##################################
-                ws_detail = out_sh.worksheet(f"{one_sosok}_{artist}(세부매출내역)")
-                details = artist_revenue_dict[artist]
-                details_sorted = sorted(details, key=lambda d: album_sort_key(d["album"]))
+                ws_detail = out_ws_by_title[f"{one_sosok}_{artist}(세부매출내역)"]
+                details_sorted = artist_revenue_dict[artist]  # 이미 앨범 순 정렬됨
 
                 detail_matrix = []
                 detail_matrix.append(["앨범아티스트","앨범명","대분류","중분류","서비스명","기간","매출 순수익"])
@@ -1896,19 +2725,19 @@ def generate_report(
                         d["middle"],
                         d["service"],
                         f"{year_val}년 {month_val}월",
-                        to_currency(rv)
+                        to_won(rv)
                     ])
 
                 # 합계
-                detail_matrix.append(["합계","","","","","", to_currency(total_det)])
+                detail_matrix.append(["합계","","","","","", to_won(total_det)])
                 row_cursor_detail_end = len(detail_matrix)
 
                 # 시트 업데이트
-                ws_detail.update(range_name="A1", values=detail_matrix)
-                time.sleep(1)
+                value_data.append({"range": sheet_range(ws_detail.title, "A1"), "values": detail_matrix})
 
                 # 세부매출내역 탭에 대한 서식/테두리 등 batch 요청
                 detail_requests = []
+                gr = lambda r0, r1, c0, c1: grid_range(sheet_id_detail, r0, r1, c0, c1)
                 sheet_id_detail = ws_detail.id
 
                 # (A) 시트 크기(row_cursor_detail_end, 7열)
@@ -1921,182 +2750,35 @@ def generate_report(
                                 "columnCount": 7
                             }
                         },
-                        "fields": "gridProperties(rowCount,columnCount)"
+                        "fields": _GRID_SIZE
                     }
                 })
 
-                # (B) 열너비 설정 (A=0, B=1, ...)
-                # 예: A열(0) → 140, B열(1) → 140, E열(4) → 120
-                detail_requests.extend([
-                    {
-                        "updateDimensionProperties": {
-                            "range": {
-                                "sheetId": sheet_id_detail,
-                                "dimension": "COLUMNS",
-                                "startIndex": 0, 
-                                "endIndex": 1
-                            },
-                            "properties": {"pixelSize": 140},
-                            "fields": "pixelSize"
-                        }
-                    },
-                    {
-                        "updateDimensionProperties": {
-                            "range": {
-                                "sheetId": sheet_id_detail,
-                                "dimension": "COLUMNS",
-                                "startIndex": 1,
-                                "endIndex": 2
-                            },
-                            "properties": {"pixelSize": 140},
-                            "fields": "pixelSize"
-                        }
-                    },
-                    {
-                        "updateDimensionProperties": {
-                            "range": {
-                                "sheetId": sheet_id_detail,
-                                "dimension": "COLUMNS",
-                                "startIndex": 4,
-                                "endIndex": 5
-                            },
-                            "properties": {"pixelSize": 120},
-                            "fields": "pixelSize"
-                        }
-                    },
-                ])
+                # (B) 열너비 설정 (DETAIL_COLUMN_WIDTHS: A열 140, B열 140, E열 120)
+                detail_requests.extend(dimension_size_requests(sheet_id_detail, "COLUMNS", DETAIL_COLUMN_WIDTHS))
 
                 # (C) 헤더(A1~G1) 포맷
-                detail_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": sheet_id_detail,
-                            "startRowIndex": 0,
-                            "endRowIndex": 1,
-                            "startColumnIndex": 0,
-                            "endColumnIndex": 7
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "backgroundColor": {"red":1.0, "green":0.8, "blue":0.0},
-                                "horizontalAlignment": "CENTER",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "bold": True,
-                                    "foregroundColor": {"red":0,"green":0,"blue":0}
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(backgroundColor,horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
+                add_repeat(detail_requests, gr(0, 1, 0, 7), FMT_DETAIL_HEADER_YELLOW)
 
                 # (D) 합계행 병합 + 서식
                 sum_row_0based = row_cursor_detail_end - 1
-                detail_requests.append({
-                    "mergeCells": {
-                        "range": {
-                            "sheetId": sheet_id_detail,
-                            "startRowIndex": sum_row_0based,
-                            "endRowIndex": sum_row_0based+1,
-                            "startColumnIndex": 0,
-                            "endColumnIndex": 6
-                        },
-                        "mergeType": "MERGE_ALL"
-                    }
-                })
-                detail_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": sheet_id_detail,
-                            "startRowIndex": sum_row_0based,
-                            "endRowIndex": sum_row_0based+1,
-                            "startColumnIndex": 0,
-                            "endColumnIndex": 6
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "backgroundColor": {"red":1.0,"green":0.8,"blue":0.0},
-                                "horizontalAlignment": "CENTER",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {"bold": True}
-                            }
-                        },
-                        "fields": "userEnteredFormat(backgroundColor,horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
+                add_merge(detail_requests, sheet_id_detail, sum_row_0based, sum_row_0based+1, 0, 6)
+                add_repeat(detail_requests, gr(sum_row_0based, sum_row_0based+1, 0, 6), FMT_DETAIL_SUM_YELLOW)
                 # 합계값(G열)에 오른쪽 정렬
-                detail_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": sheet_id_detail,
-                            "startRowIndex": sum_row_0based,
-                            "endRowIndex": sum_row_0based+1,
-                            "startColumnIndex": 6,
-                            "endColumnIndex": 7
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "horizontalAlignment": "RIGHT",
-                                "textFormat": {"bold": True}
-                            }
-                        },
-                        "fields": "userEnteredFormat(horizontalAlignment,textFormat)"
-                    }
-                })
+                add_repeat(detail_requests, gr(sum_row_0based, sum_row_0based+1, 6, 7), FMT_DETAIL_SUM_VALUE)
                 # 매출 순수익 칼럼 (F열=idx=6) 나머지 행들
-                detail_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": sheet_id_detail,
-                            "startRowIndex": 1,
-                            "endRowIndex": sum_row_0based,
-                            "startColumnIndex": 6,
-                            "endColumnIndex": 7
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "horizontalAlignment": "RIGHT"
-                            }
-                        },
-                        "fields": "userEnteredFormat(horizontalAlignment)"
-                    }
-                })
+                add_repeat(detail_requests, gr(1, sum_row_0based, 6, 7), FMT_DETAIL_VALUE)
 
                 # (E) 전체 테두리
-                detail_requests.append({
-                    "updateBorders": {
-                        "range": {
-                            "sheetId": sheet_id_detail,
-                            "startRowIndex": 0,
-                            "endRowIndex": row_cursor_detail_end,
-                            "startColumnIndex": 0,
-                            "endColumnIndex": 7
-                        },
-                        "top":    {"style":"SOLID","width":1},
-                        "bottom": {"style":"SOLID","width":1},
-                        "left":   {"style":"SOLID","width":1},
-                        "right":  {"style":"SOLID","width":1},
-                        "innerHorizontal": {"style":"SOLID","width":1},
-                        "innerVertical":   {"style":"SOLID","width":1}
-                    }
-                })
+                detail_requests.append(make_borders(gr(0, row_cursor_detail_end, 0, 7), BORDER_SOLID))
 
-                all_requests.extend(detail_requests)
-
-                # (호출 횟수 분할) 1회 batchUpdate 요청이 너무 커지면 나눠서 전송
-                if len(all_requests) >= 200:
-                    sheet_svc.spreadsheets().batchUpdate(
-                        spreadsheetId=out_file_id,
-                        body={"requests": all_requests}
-                    ).execute()
-                    all_requests.clear()
-                    time.sleep(1)
+                # 요청 누적 (전송은 루프가 끝난 뒤 한 번에)
+                all_requests.extend(compact_requests(detail_requests))
 
                 # ##################################
                 # UMAG 정산서 탭 (batchUpdate 방식)
                 # ##################################
-                ws_report = out_sh.worksheet(f"{one_sosok}_{artist}(정산서)")
+                ws_report = out_ws_by_title[f"{one_sosok}_{artist}(정산서)"]
                 ws_report_id = ws_report.id
 
                 # 매출 합
@@ -2128,9 +2810,18 @@ def generate_report(
                 # --------------------------------------
                 # 정산서 테이블(직접 row col 배열 채우기)
                 # --------------------------------------
-                report_matrix = []
-                for _ in range(300):
-                    report_matrix.append([""] * 8)
+                # 표 위치(행)는 본문 행 수만으로 정해지므로 먼저 계산 -> 필요한 행 수만큼만 배열 생성
+                cursors = compute_report_cursors(len(details_sorted), len(album_sum))
+                row_cursor_sum1 = cursors["sum1"]
+                row_cursor_album = cursors["album"]
+                row_cursor_sum2 = cursors["sum2"]
+                row_cursor_deduction = cursors["deduction"]
+                row_cursor_sum3 = cursors["sum3"]
+                row_cursor_rate = cursors["rate"]
+                row_cursor_sum4 = cursors["sum4"]
+                row_cursor_report_end = cursors["report_end"]
+
+                report_matrix = [[""] * 8 for _ in range(row_cursor_report_end)]
 
                 # 1) 상단 공통정보
                 report_matrix[1][6] = report_date   # 보고서 발행일
@@ -2156,64 +2847,50 @@ def generate_report(
                 for i_h, val_h in enumerate(headers_1):
                     report_matrix[header_row_1][1 + i_h] = val_h
 
-                row_cursor = header_row_1 + 1
-                for d in details_sorted:
+                for row_idx, d in enumerate(details_sorted, start=header_row_1+1):
                     rv = d["revenue"]
-                    report_matrix[row_cursor][1] = d["album"]
-                    report_matrix[row_cursor][2] = d["major"]
-                    report_matrix[row_cursor][3] = d["middle"]
-                    report_matrix[row_cursor][4] = d["service"]
-                    report_matrix[row_cursor][5] = f"{year_val}년 {month_val}월"
-                    report_matrix[row_cursor][6] = to_currency(rv)
-                    row_cursor += 1
+                    report_matrix[row_idx][1] = d["album"]
+                    report_matrix[row_idx][2] = d["major"]
+                    report_matrix[row_idx][3] = d["middle"]
+                    report_matrix[row_idx][4] = d["service"]
+                    report_matrix[row_idx][5] = f"{year_val}년 {month_val}월"
+                    report_matrix[row_idx][6] = to_currency(rv)
 
-                row_cursor += 2
-                # 합계
-                report_matrix[row_cursor-1][1] = "합계"
-                report_matrix[row_cursor-1][6] = to_currency(sum_1)
-                row_cursor_sum1 = row_cursor
-                row_cursor += 1
+                # 합계 (본문 다음 빈 행 1개 뒤)
+                report_matrix[row_cursor_sum1-1][1] = "합계"
+                report_matrix[row_cursor_sum1-1][6] = to_currency(sum_1)
 
                 # -----------------------------------------------------------------
                 # 2. 앨범 별 정산 내역
                 # -----------------------------------------------------------------
-                report_matrix[row_cursor][0] = "2."
-                report_matrix[row_cursor][1] = "앨범 별 정산 내역"
-                row_cursor += 1
-                row_cursor_album = row_cursor
-                report_matrix[row_cursor][1] = "앨범"
-                report_matrix[row_cursor][5] = "기간"
-                report_matrix[row_cursor][6] = "매출액"
-                row_cursor += 1
-
-                for alb in sorted(album_sum.keys(), key=album_sort_key):
+                report_matrix[row_cursor_album-1][0] = "2."
+                report_matrix[row_cursor_album-1][1] = "앨범 별 정산 내역"
+                report_matrix[row_cursor_album][1] = "앨범"
+                report_matrix[row_cursor_album][5] = "기간"
+                report_matrix[row_cursor_album][6] = "매출액"
+
+                for row_idx, alb in enumerate(sorted(album_sum.keys(), key=album_sort_key), start=row_cursor_album+1):
                     amt = album_sum[alb]
-                    report_matrix[row_cursor][1] = alb
-                    report_matrix[row_cursor][5] = f"{year_val}년 {month_val}월"
-                    report_matrix[row_cursor][6] = to_currency(amt)
-                    row_cursor += 1
+                    report_matrix[row_idx][1] = alb
+                    report_matrix[row_idx][5] = f"{year_val}년 {month_val}월"
+                    report_matrix[row_idx][6] = to_currency(amt)
 
-                row_cursor += 1
-                report_matrix[row_cursor-1][1] = "합계"
-                report_matrix[row_cursor-1][6] = to_currency(sum_2)
-                row_cursor_sum2 = row_cursor
-                row_cursor += 1
+                report_matrix[row_cursor_sum2-1][1] = "합계"
+                report_matrix[row_cursor_sum2-1][6] = to_currency(sum_2)
 
                 # -----------------------------------------------------------------
                 # 3. 공제 내역
                 #    (요청사항: '곡비' 칼럼 = (전월 잔액 + 당월 발생액))
                 # -----------------------------------------------------------------
-                report_matrix[row_cursor][0] = "3."
-                report_matrix[row_cursor][1] = "공제 내역"
-                row_cursor += 1
-                row_cursor_deduction = row_cursor
-
-                report_matrix[row_cursor][1] = "앨범"
-                report_matrix[row_cursor][2] = "곡비"
-                report_matrix[row_cursor][3] = "공제 금액"
-                report_matrix[row_cursor][5] = "공제 후 남은 곡비"
-                report_matrix[row_cursor][6] = "공제 적용 금액"
-                row_cursor += 1
+                report_matrix[row_cursor_deduction-1][0] = "3."
+                report_matrix[row_cursor_deduction-1][1] = "공제 내역"
+
+                report_matrix[row_cursor_deduction][1] = "앨범"
+                report_matrix[row_cursor_deduction][2] = "곡비"
+                report_matrix[row_cursor_deduction][3] = "공제 금액"
+                report_matrix[row_cursor_deduction][5] = "공제 후 남은 곡비"
+                report_matrix[row_cursor_deduction][6] = "공제 적용 금액"
+                row_cursor = row_cursor_deduction + 1
 
                 # 앨범(들)을 표기만 할지, 혹은 여러줄로 표현할지 등은 업무 규칙에 따라
                 alb_list = sorted(album_sum.keys(), key=album_sort_key)
@@ -2228,39 +2905,29 @@ def generate_report(
                 report_matrix[row_cursor][5] = to_currency(remain_val)
                 # 공제 적용 금액 (매출 - 공제금액)
                 report_matrix[row_cursor][6] = to_currency(sum_2 - deduct_val)
-                row_cursor += 2
-                row_cursor_sum3 = row_cursor
 
                 # -----------------------------------------------------------------
                 # 4. 수익 배분
                 # -----------------------------------------------------------------
-                report_matrix[row_cursor][0] = "4."
-                report_matrix[row_cursor][1] = "수익 배분"
-                row_cursor += 1
-                row_cursor_rate = row_cursor
-                report_matrix[row_cursor][1] = "앨범"
-                report_matrix[row_cursor][2] = "항목"
-                report_matrix[row_cursor][3] = "적용율"
-                report_matrix[row_cursor][6] = "적용 금액"
-                row_cursor += 1
+                report_matrix[row_cursor_sum3][0] = "4."
+                report_matrix[row_cursor_sum3][1] = "수익 배분"
+                report_matrix[row_cursor_rate][1] = "앨범"
+                report_matrix[row_cursor_rate][2] = "항목"
+                report_matrix[row_cursor_rate][3] = "적용율"
+                report_matrix[row_cursor_rate][6] = "적용 금액"
 
-                report_matrix[row_cursor][1] = alb_str
-                report_matrix[row_cursor][2] = "수익 배분율"
-                report_matrix[row_cursor][3] = f"{int(rate_val)}%"
-                report_matrix[row_cursor][6] = to_currency(final_amount)
-                row_cursor += 1
+                report_matrix[row_cursor_rate+1][1] = alb_str
+                report_matrix[row_cursor_rate+1][2] = "수익 배분율"
+                report_matrix[row_cursor_rate+1][3] = f"{int(rate_val)}%"
+                report_matrix[row_cursor_rate+1][6] = to_currency(final_amount)
 
-                report_matrix[row_cursor][1] = "총 정산금액"
-                report_matrix[row_cursor][6] = to_currency(final_amount)
-                row_cursor_sum4 = row_cursor
-                row_cursor += 2
+                report_matrix[row_cursor_sum4][1] = "총 정산금액"
+                report_matrix[row_cursor_sum4][6] = to_currency(final_amount)
 
-                report_matrix[row_cursor][6] = "* 부가세 별도"
-                row_cursor_report_end = row_cursor + 2
+                report_matrix[row_cursor_sum4+2][6] = "* 부가세 별도"
 
                 # 시트에 실제 업로드
-                ws_report.update(range_name="A1", values=report_matrix)
-                time.sleep(1)
+                value_data.append({"range": sheet_range(ws_report.title, "A1"), "values": report_matrix})
 
                 # ------------------------------------
                 # (검증) check_dict에 비교결과 반영
@@ -2332,1373 +2999,106 @@ def generate_report(
                 }
                 check_dict["details_verification"]["정산서"].append(row_report_item_4)
 
-                time.sleep(1)   
 
                 # --------------------------------------------------
                 # 정산서 탭(디자인/서식) batchUpdate
                 # --------------------------------------------------
-                report_requests = []
+                # (템플릿 복제가 아닌 기존 탭이면 고정 서식까지 지정)
+                report_requests = build_report_dynamic_requests(
+                    ws_report_id, "UMAG", cursors,
+                    with_static=f"{one_sosok}_{artist}(정산서)" not in created_titles
+                )
+
+                # 요청 누적 (전송은 루프가 끝난 뒤 한 번에)
+                all_requests.extend(compact_requests(report_requests))
+
+            #-------------------------------------------------------------------------
+            # FLUXUS 소속 처리
+            #-------------------------------------------------------------------------
+            elif one_sosok == "FLUXUS":
+                # 진행률
+                if show_progress:
+                    ratio = (i + 1) / len(all_artists)
+                    progress_bar.progress(ratio)
+                    artist_placeholder.info(f"[{i+1}/{len(all_artists)}] '{artist}' 처리 중...")
+
+                # ##########################
+                # (1) FLUXUS 세부매출내역 탭
+                # ##########################
+                ws_fluxus_detail = out_ws_by_title[f"{one_sosok}_{artist}(세부매출내역)"]
+                fluxus_yt_details_sorted = fluxus_yt_dict[artist]  # 이미 앨범 순 정렬됨
+                fluxus_fs_details_sorted = fluxus_song_dict[artist]
+
+                fluxus_detail_matrix = []
+                fluxus_detail_matrix.append(["앨범아티스트","앨범명","트랙 No.","트랙명","트랙 ID","기간","매출 순수익"])
+
+                total_det = 0
+                for d in fluxus_yt_details_sorted:
+                    fy_rv_val = d["revenue"]
+                    total_det += fy_rv_val
+                    fluxus_detail_matrix.append([
+                        artist,
+                        d["album"],
+                        d["track_number"],
+                        d["track_title"],
+                        d["track_id"],
+                        f"{year_val}년 {month_val}월",
+                        to_won(fy_rv_val)
+                    ])
+
+
+                # 합계
+                fluxus_detail_matrix.append(["합계","","","","","", to_won(total_det)])
+                row_cursor_fluxus_detail_end = len(fluxus_detail_matrix)
+
+                # 시트 업데이트
+                value_data.append({"range": sheet_range(ws_fluxus_detail.title, "A1"), "values": fluxus_detail_matrix})
+
+                # 세부매출내역 탭에 대한 서식/테두리 등 batch 요청
+                fluxus_detail_requests = []
+                gr = lambda r0, r1, c0, c1: grid_range(sheet_id_fluxus_detail, r0, r1, c0, c1)
+                sheet_id_fluxus_detail = ws_fluxus_detail.id
 
-                # (A) 시트 row/col 크기
-                report_requests.append({
+                # (A) 시트 크기(row_cursor_detail_end, 7열)
+                fluxus_detail_requests.append({
                     "updateSheetProperties": {
                         "properties": {
-                            "sheetId": ws_report_id,
+                            "sheetId": sheet_id_fluxus_detail,
                             "gridProperties": {
-                                "rowCount": row_cursor_report_end,
-                                "columnCount": 8
+                                "rowCount": row_cursor_fluxus_detail_end,
+                                "columnCount": 7
                             }
                         },
-                        "fields": "gridProperties(rowCount,columnCount)"
+                        "fields": _GRID_SIZE
                     }
                 })
 
-                # (B) 열너비 (A=0 ~ H=7)
-                report_requests.extend([
-                    {
-                        "updateDimensionProperties": {
-                            "range": {
-                                "sheetId": ws_report_id,
-                                "dimension": "COLUMNS",
-                                "startIndex": 0,
-                                "endIndex": 1
-                            },
-                            "properties": {"pixelSize": 40},
-                            "fields": "pixelSize"
-                        }
-                    },
-                    {
-                        "updateDimensionProperties": {
-                            "range": {
-                                "sheetId": ws_report_id,
-                                "dimension": "COLUMNS",
-                                "startIndex": 1,
-                                "endIndex": 2
-                            },
-                            "properties": {"pixelSize": 200},
-                            "fields": "pixelSize"
-                        }
-                    },
-                    {
-                        "updateDimensionProperties": {
-                            "range": {
-                                "sheetId": ws_report_id,
-                                "dimension": "COLUMNS",
-                                "startIndex": 2,
-                                "endIndex": 3
-                            },
-                            "properties": {"pixelSize": 130},
-                            "fields": "pixelSize"
-                        }
-                    },
-                    {
-                        "updateDimensionProperties": {
-                            "range": {
-                                "sheetId": ws_report_id,
-                                "dimension": "COLUMNS",
-                                "startIndex": 3,
-                                "endIndex": 4
-                            },
-                            "properties": {"pixelSize": 120},
-                            "fields": "pixelSize"
-                        }
-                    },
-                    {
-                        "updateDimensionProperties": {
-                            "range": {
-                                "sheetId": ws_report_id,
-                                "dimension": "COLUMNS",
-                                "startIndex": 4,
-                                "endIndex": 5
-                            },
-                            "properties": {"pixelSize": 130},
-                            "fields": "pixelSize"
-                        }
-                    },
-                    {
-                        "updateDimensionProperties": {
-                            "range": {
-                                "sheetId": ws_report_id,
-                                "dimension": "COLUMNS",
-                                "startIndex": 5,
-                                "endIndex": 6
-                            },
-                            "properties": {"pixelSize": 130},
-                            "fields": "pixelSize"
-                        }
-                    },
-                    {
-                        "updateDimensionProperties": {
-                            "range": {
-                                "sheetId": ws_report_id,
-                                "dimension": "COLUMNS",
-                                "startIndex": 6,
-                                "endIndex": 7
-                            },
-                            "properties": {"pixelSize": 130},
-                            "fields": "pixelSize"
-                        }
-                    },
-                    {
-                        "updateDimensionProperties": {
-                            "range": {
-                                "sheetId": ws_report_id,
-                                "dimension": "COLUMNS",
-                                "startIndex": 7,
-                                "endIndex": 8
-                            },
-                            "properties": {"pixelSize": 40},
-                            "fields": "pixelSize"
-                        }
-                    },
-                ])
-
-                # (C) 특정행 높이
-                report_requests.extend([
-                    {
-                        "updateDimensionProperties": {
-                            "range": {
-                                "sheetId": ws_report_id,
-                                "dimension": "ROWS",
-                                "startIndex": 3,
-                                "endIndex": 4
-                            },
-                            "properties": {"pixelSize": 30},
-                            "fields": "pixelSize"
-                        }
-                    },
-                    {
-                        "updateDimensionProperties": {
-                            "range": {
-                                "sheetId": ws_report_id,
-                                "dimension": "ROWS",
-                                "startIndex": 5,
-                                "endIndex": 6
-                            },
-                            "properties": {"pixelSize": 30},
-                            "fields": "pixelSize"
-                        }
-                    },
-                ])
-
-                # (D) 상단 고정 항목(발행 날짜, H2: row=1, col=6)
-                report_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_report_id,
-                            "startRowIndex": 1,
-                            "endRowIndex": 2,
-                            "startColumnIndex": 6,
-                            "endColumnIndex": 7
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "horizontalAlignment": "RIGHT",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "fontFamily": "Malgun Gothic",
-                                    "fontSize": 10,
-                                    "bold": False
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })        
-
-                # (E) 상단 고정 항목(판매분, B4:E4)
-                report_requests.append({
-                    "mergeCells": {
-                        "range": {
-                            "sheetId": ws_report_id,
-                            "startRowIndex": 3,  # (4-1)
-                            "endRowIndex": 4,
-                            "startColumnIndex": 1,  # (B=1)
-                            "endColumnIndex": 5     # (E=4 => endIndex=5)
-                        },
-                        "mergeType": "MERGE_ALL"
-                    }
-                })
-                report_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_report_id,
-                            "startRowIndex": 3,
-                            "endRowIndex": 4,
-                            "startColumnIndex": 1,
-                            "endColumnIndex": 5
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "horizontalAlignment": "LEFT",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "fontFamily": "Malgun Gothic",
-                                    "fontSize": 15,
-                                    "bold": True
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
+                # (B) 열너비 설정 (FLUXUS_DETAIL_COLUMN_WIDTHS: A~G 전 열)
+                fluxus_detail_requests.extend(dimension_size_requests(sheet_id_fluxus_detail, "COLUMNS", FLUXUS_DETAIL_COLUMN_WIDTHS))
 
-                # (F) 상단 고정 항목(아티스트 정산내역서, B6:G6)
-                report_requests.append({
-                    "mergeCells": {
-                        "range": {
-                            "sheetId": ws_report_id,
-                            "startRowIndex": 5,
-                            "endRowIndex": 6,
-                            "startColumnIndex": 1,
-                            "endColumnIndex": 7
-                        },
-                        "mergeType": "MERGE_ALL"
-                    }
-                })
-                report_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_report_id,
-                            "startRowIndex": 5,
-                            "endRowIndex": 6,
-                            "startColumnIndex": 1,
-                            "endColumnIndex": 7
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "backgroundColor": {"red": 0.896, "green": 0.988, "blue": 1},
-                                "horizontalAlignment": "CENTER",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "fontFamily": "Malgun Gothic",
-                                    "fontSize": 15,
-                                    "bold": True
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(backgroundColor,horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
+                # (C) 헤더(A1~G1) 포맷
+                add_repeat(fluxus_detail_requests, gr(0, 1, 0, 7), FMT_DETAIL_HEADER_CYAN)
 
-                # (G) 상단 고정 항목(안내문, B8:E8~B10:E10)
-                #8행
-                report_requests.append({
-                    "mergeCells": {
-                        "range": {
-                            "sheetId": ws_report_id,
-                            "startRowIndex": 7,  # (4-1)
-                            "endRowIndex": 8,
-                            "startColumnIndex": 1,  # (B=1)
-                            "endColumnIndex": 5     # (E=4 => endIndex=5)
-                        },
-                        "mergeType": "MERGE_ALL"
-                    }
-                })
-                report_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_report_id,
-                            "startRowIndex": 7,  # (4-1)
-                            "endRowIndex": 8,
-                            "startColumnIndex": 1,  # (B=1)
-                            "endColumnIndex": 5     # (E=4 => endIndex=5)
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "horizontalAlignment": "LEFT",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "bold": False
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
-                #9행
-                report_requests.append({
-                    "mergeCells": {
-                        "range": {
-                            "sheetId": ws_report_id,
-                            "startRowIndex": 8,  
-                            "endRowIndex": 9,
-                            "startColumnIndex": 1,
-                            "endColumnIndex": 5 
-                        },
-                        "mergeType": "MERGE_ALL"
-                    }
-                })
-                report_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_report_id,
-                            "startRowIndex": 8,  
-                            "endRowIndex": 9,
-                            "startColumnIndex": 1,
-                            "endColumnIndex": 5 
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "horizontalAlignment": "LEFT",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                "bold": False
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
-                #10행
-                report_requests.append({
-                    "mergeCells": {
-                        "range": {
-                            "sheetId": ws_report_id,
-                            "startRowIndex": 9,  
-                            "endRowIndex": 10,
-                            "startColumnIndex": 1,
-                            "endColumnIndex": 5 
-                        },
-                        "mergeType": "MERGE_ALL"
-                    }
-                })
-                report_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_report_id,
-                            "startRowIndex": 9,  
-                            "endRowIndex": 10,
-                            "startColumnIndex": 1,
-                            "endColumnIndex": 5 
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "horizontalAlignment": "LEFT",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "bold": False
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
-                # 10행 (E-Mail 칸)
-                report_requests.append({
-                    "mergeCells": {
-                        "range": {
-                            "sheetId": ws_report_id,
-                            "startRowIndex": 9,  
-                            "endRowIndex": 10,
-                            "startColumnIndex": 5,
-                            "endColumnIndex": 7 
-                        },
-                        "mergeType": "MERGE_ALL"
-                    }
-                })
-                report_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_report_id,
-                            "startRowIndex": 9,
-                            "endRowIndex": 10,
-                            "startColumnIndex": 5,
-                            "endColumnIndex": 7
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "horizontalAlignment": "RIGHT",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "foregroundColor": {"red": 0.29, "green": 0.53, "blue": 0.91},
-                                    "fontFamily": "Malgun Gothic",
-                                    "fontSize": 10,
-                                    "bold": True
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
-                
-                # (H) 1열 정렬 (번호 영역)
-                report_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_report_id,
-                            "startRowIndex": 1,
-                            "endRowIndex": row_cursor_rate+1,
-                            "startColumnIndex": 0,
-                            "endColumnIndex": 1
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "horizontalAlignment": "CENTER",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "fontFamily": "Malgun Gothic",
-                                    "fontSize": 10,
-                                    "bold": False
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
-
-                # (I) 하단 고정 항목(부가세, G)
-                report_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_report_id,
-                            "startRowIndex": row_cursor_report_end-2,
-                            "endRowIndex": row_cursor_report_end,
-                            "startColumnIndex": 6,
-                            "endColumnIndex": 7
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "horizontalAlignment": "RIGHT",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "fontFamily": "Malgun Gothic",
-                                    "fontSize": 10,
-                                    "bold": False
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                }) 
-            
-
-                # (J-1) "음원 서비스별 정산내역" 표 타이틀
-                report_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_report_id,
-                            "startRowIndex": 12,  # (4-1)
-                            "endRowIndex": 13,
-                            "startColumnIndex": 1,  # (B=1)
-                            "endColumnIndex": 2     # (E=4 => endIndex=5)
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "horizontalAlignment": "LEFT",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "bold": True
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
-                # (J-2) "음원 서비스별 정산내역" 표 헤더 (Row=13)
-                report_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_report_id,
-                            "startRowIndex": 13,
-                            "endRowIndex": 14,
-                            "startColumnIndex": 1,
-                            "endColumnIndex": 7
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "backgroundColor": {"red": 0.3, "green": 0.82, "blue": 0.88},
-                                "horizontalAlignment": "CENTER",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "fontFamily": "Malgun Gothic",
-                                    "fontSize": 10,
-                                    "bold": True
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(backgroundColor,horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
-                # (J-3) 합계행 전 병합
-                report_requests.append({
-                    "mergeCells": {
-                        "range": {
-                            "sheetId": ws_report_id,
-                            "startRowIndex": row_cursor_sum1-2,
-                            "endRowIndex": row_cursor_sum1-1,
-                            "startColumnIndex": 1,
-                            "endColumnIndex": 7
-                        },
-                        "mergeType": "MERGE_ALL"
-                    }
-                })
-                # (J-4) 합계행 병합
-                report_requests.append({
-                    "mergeCells": {
-                        "range": {
-                            "sheetId": ws_report_id,
-                            "startRowIndex": row_cursor_sum1-1,
-                            "endRowIndex": row_cursor_sum1,
-                            "startColumnIndex": 1,
-                            "endColumnIndex": 6
-                        },
-                        "mergeType": "MERGE_ALL"
-                    }
-                })
-                report_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_report_id,
-                            "startRowIndex": row_cursor_sum1-1,
-                            "endRowIndex": row_cursor_sum1,
-                            "startColumnIndex": 1,
-                            "endColumnIndex": 6
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "backgroundColor": {"red": 0.896, "green": 0.988, "blue": 1},
-                                "horizontalAlignment": "CENTER",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "fontFamily": "Malgun Gothic",
-                                    "fontSize": 10,
-                                    "bold": True
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(backgroundColor,horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
-                report_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_report_id,
-                            "startRowIndex": row_cursor_sum1-1,
-                            "endRowIndex": row_cursor_sum1,
-                            "startColumnIndex": 6,
-                            "endColumnIndex": 7
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "backgroundColor": {"red": 0.896, "green": 0.988, "blue": 1},
-                                "horizontalAlignment": "CENTER",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "fontFamily": "Malgun Gothic",
-                                    "fontSize": 10,
-                                    "bold": True
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(backgroundColor,horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
-                # (J-5) 표에 Banding (줄무늬 효과)
-                banding_start_row = 14
-                banding_end_row = row_cursor_sum1 - 2
-                banding_start_col = 1
-                banding_end_col = 7
-                if banding_end_row > banding_start_row:  # 유효범위 체크
-                    report_requests.append({
-                        "addBanding": {
-                            "bandedRange": {
-                                "range": {
-                                    "sheetId": ws_report_id,
-                                    "startRowIndex": banding_start_row,
-                                    "endRowIndex": banding_end_row,
-                                    "startColumnIndex": banding_start_col,
-                                    "endColumnIndex": banding_end_col
-                                },
-                                "rowProperties": {
-                                    "firstBandColor": {
-                                        "red": 1.0, "green": 1.0, "blue": 1.0
-                                    },
-                                    "secondBandColor": {
-                                        "red": 0.896, "green": 0.988, "blue": 1
-                                    }
-                                },
-                                
-                            }
-                        }
-                    })
-                    report_requests.append({
-                        "repeatCell": {
-                            "range": {
-                                "sheetId": ws_report_id,
-                                "startRowIndex": banding_start_row,
-                                "endRowIndex": banding_end_row,
-                                "startColumnIndex": banding_start_col,
-                                "endColumnIndex": banding_end_col
-                            },
-                            "cell": {
-                                "userEnteredFormat": {
-                                    "horizontalAlignment": "CENTER",
-                                    "verticalAlignment": "MIDDLE",
-                                    "textFormat": {
-                                        "fontFamily": "Malgun Gothic",
-                                        "fontSize": 10,
-                                        "bold": False
-                                    }
-                                }
-                            },
-                            "fields": "userEnteredFormat(horizontalAlignment,verticalAlignment,textFormat)"
-                        }
-                    })
-
-
-                # (K-1) 앨범별 정산내역 타이틀
-                report_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_report_id,
-                            "startRowIndex": row_cursor_album-1,
-                            "endRowIndex": row_cursor_album,
-                            "startColumnIndex": 1, 
-                            "endColumnIndex": 2    
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "horizontalAlignment": "LEFT",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "bold": True
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
-                # (K-2) 앨범별 정산내역 헤더
-                report_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_report_id,
-                            "startRowIndex": row_cursor_album,
-                            "endRowIndex": row_cursor_album+1,
-                            "startColumnIndex": 1,
-                            "endColumnIndex": 7
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "backgroundColor": {"red": 0.3, "green": 0.82, "blue": 0.88},
-                                "horizontalAlignment": "CENTER",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "fontFamily": "Malgun Gothic",
-                                    "fontSize": 10,
-                                    "bold": True
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(backgroundColor,horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
-                # (K-3) 앨범별 정산내역 표 본문
-                report_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_report_id,
-                            "startRowIndex": row_cursor_album+1,
-                            "endRowIndex": row_cursor_sum2-1,
-                            "startColumnIndex": 1,
-                            "endColumnIndex": 7
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "horizontalAlignment": "CENTER",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "fontFamily": "Malgun Gothic",
-                                    "fontSize": 10,
-                                    "bold": False
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
-                # (K-4) 앨범별 정산내역 합계행
-                report_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_report_id,
-                            "startRowIndex": row_cursor_sum2-1,
-                            "endRowIndex": row_cursor_sum2,
-                            "startColumnIndex": 1,
-                            "endColumnIndex": 7
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "horizontalAlignment": "CENTER",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "fontFamily": "Malgun Gothic",
-                                    "fontSize": 10,
-                                    "bold": True
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
-                # (K-5) 합계행 병합
-                report_requests.append({
-                    "mergeCells": {
-                        "range": {
-                            "sheetId": ws_report_id,
-                            "startRowIndex": row_cursor_sum2-1,
-                            "endRowIndex": row_cursor_sum2,
-                            "startColumnIndex": 1,
-                            "endColumnIndex": 6
-                        },
-                        "mergeType": "MERGE_ALL"
-                    }
-                })
-                report_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_report_id,
-                            "startRowIndex": row_cursor_sum2-1,
-                            "endRowIndex": row_cursor_sum2,
-                            "startColumnIndex": 1,
-                            "endColumnIndex": 6
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "backgroundColor": {"red": 0.896, "green": 0.988, "blue": 1},
-                                "horizontalAlignment": "CENTER",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "fontFamily": "Malgun Gothic",
-                                    "fontSize": 10,
-                                    "bold": True
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(backgroundColor,horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
-                report_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_report_id,
-                            "startRowIndex": row_cursor_sum2-1,
-                            "endRowIndex": row_cursor_sum2,
-                            "startColumnIndex": 6,
-                            "endColumnIndex": 7
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "backgroundColor": {"red": 0.896, "green": 0.988, "blue": 1},
-                                "horizontalAlignment": "CENTER",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "fontFamily": "Malgun Gothic",
-                                    "fontSize": 10,
-                                    "bold": True
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(backgroundColor,horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
-
-
-                # (L-1) 공제 내역 타이틀
-                report_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_report_id,
-                            "startRowIndex": row_cursor_deduction-1,  # (4-1)
-                            "endRowIndex": row_cursor_deduction,
-                            "startColumnIndex": 1,  # (B=1)
-                            "endColumnIndex": 2     # (E=4 => endIndex=5)
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "horizontalAlignment": "LEFT",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "bold": True
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
-                # (L-2) 공제 내역 헤더
-                report_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_report_id,
-                            "startRowIndex": row_cursor_deduction,
-                            "endRowIndex": row_cursor_deduction+1,
-                            "startColumnIndex": 1,
-                            "endColumnIndex": 7
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "backgroundColor": {"red": 0.3, "green": 0.82, "blue": 0.88},
-                                "horizontalAlignment": "CENTER",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "fontFamily": "Malgun Gothic",
-                                    "fontSize": 10,
-                                    "bold": True
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(backgroundColor,horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
-                # (L-3) 공제 내역 표 본문 (데이터부분)
-                report_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_report_id,
-                            "startRowIndex": row_cursor_deduction+1,
-                            "endRowIndex": row_cursor_deduction+2,
-                            "startColumnIndex": 1,
-                            "endColumnIndex": 6
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "horizontalAlignment": "CENTER",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "fontFamily": "Malgun Gothic",
-                                    "fontSize": 10,
-                                    "bold": False
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
-                # (L-4) 공제 내역 표 본문 (합계 부분)
-                report_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_report_id,
-                            "startRowIndex": row_cursor_deduction+1,
-                            "endRowIndex": row_cursor_deduction+2,
-                            "startColumnIndex": 6,
-                            "endColumnIndex": 7
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "horizontalAlignment": "CENTER",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "fontFamily": "Malgun Gothic",
-                                    "fontSize": 10,
-                                    "bold": True
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
-
-
-                # (M-1) 수익 배분 타이틀
-                report_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_report_id,
-                            "startRowIndex": row_cursor_rate-1,
-                            "endRowIndex": row_cursor_rate,
-                            "startColumnIndex": 1,  
-                            "endColumnIndex": 2    
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "horizontalAlignment": "LEFT",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "bold": True
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
-                # (M-2) 수익 배분 헤더
-                report_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_report_id,
-                            "startRowIndex": row_cursor_rate,
-                            "endRowIndex": row_cursor_rate+1,
-                            "startColumnIndex": 1,
-                            "endColumnIndex": 7
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "backgroundColor": {"red": 0.3, "green": 0.82, "blue": 0.88},
-                                "horizontalAlignment": "CENTER",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "fontFamily": "Malgun Gothic",
-                                    "fontSize": 10,
-                                    "bold": True
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(backgroundColor,horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
-                # (M-3) 수익 배분 표 본문 
-                report_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_report_id,
-                            "startRowIndex": row_cursor_rate+1,
-                            "endRowIndex": row_cursor_rate+2,
-                            "startColumnIndex": 1,
-                            "endColumnIndex": 7
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "horizontalAlignment": "CENTER",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "fontFamily": "Malgun Gothic",
-                                    "fontSize": 10,
-                                    "bold": False
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
-                # (M-4) 수익 배분 표 합계행 병합
-                report_requests.append({
-                    "mergeCells": {
-                        "range": {
-                            "sheetId": ws_report_id,
-                            "startRowIndex": row_cursor_sum4,
-                            "endRowIndex": row_cursor_sum4+1,
-                            "startColumnIndex": 1,
-                            "endColumnIndex": 6
-                        },
-                        "mergeType": "MERGE_ALL"
-                    }
-                })
-                report_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_report_id,
-                            "startRowIndex": row_cursor_sum4,
-                            "endRowIndex": row_cursor_sum4+1,
-                            "startColumnIndex": 1,
-                            "endColumnIndex": 6
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "backgroundColor": {"red": 0.896, "green": 0.988, "blue": 1},
-                                "horizontalAlignment": "CENTER",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "fontFamily": "Malgun Gothic",
-                                    "fontSize": 10,
-                                    "bold": True
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(backgroundColor,horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
-                report_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_report_id,
-                            "startRowIndex": row_cursor_sum4,
-                            "endRowIndex": row_cursor_sum4+1,
-                            "startColumnIndex": 6,
-                            "endColumnIndex": 7
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "backgroundColor": {"red": 0.896, "green": 0.988, "blue": 1},
-                                "horizontalAlignment": "CENTER",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "fontFamily": "Malgun Gothic",
-                                    "fontSize": 10,
-                                    "bold": True
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(backgroundColor,horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
-
-
-                # (N) 전체 테두리 화이트
-                report_requests.append({
-                    "updateBorders": {
-                        "range": {
-                            "sheetId": ws_report_id,
-                            "startRowIndex": 0,
-                            "endRowIndex": row_cursor_report_end,
-                            "startColumnIndex": 0,
-                            "endColumnIndex": 8
-                        },
-                        "top":    {"style": "SOLID","width":1, "color":{"red":1,"green":1,"blue":1}},
-                        "bottom": {"style": "SOLID","width":1, "color":{"red":1,"green":1,"blue":1}},
-                        "left":   {"style": "SOLID","width":1, "color":{"red":1,"green":1,"blue":1}},
-                        "right":  {"style": "SOLID","width":1, "color":{"red":1,"green":1,"blue":1}},
-                        "innerHorizontal": {"style":"SOLID","width":1,"color":{"red":1,"green":1,"blue":1}},
-                        "innerVertical":   {"style":"SOLID","width":1,"color":{"red":1,"green":1,"blue":1}}
-                    }
-                })
-                
-
-                # (O) 표 부분 점선 
-                def add_dotted_borders(r1, r2, c1, c2):
-                    """바깥+안쪽 모두 DOTTED"""
-                    report_requests.append({
-                        "updateBorders": {
-                            "range": {
-                                "sheetId": ws_report_id,
-                                "startRowIndex": r1,
-                                "endRowIndex": r2,
-                                "startColumnIndex": c1,
-                                "endColumnIndex": c2
-                            },
-                            "top":    {"style": "DOTTED", "width": 1, "color":{"red":0,"green":0,"blue":0}},
-                            "bottom": {"style": "DOTTED", "width": 1, "color":{"red":0,"green":0,"blue":0}},
-                            "left":   {"style": "DOTTED", "width": 1, "color":{"red":0,"green":0,"blue":0}},
-                            "right":  {"style": "DOTTED", "width": 1, "color":{"red":0,"green":0,"blue":0}},
-                            "innerHorizontal": {"style": "DOTTED", "width": 1, "color":{"red":0,"green":0,"blue":0}},
-                            "innerVertical":   {"style": "DOTTED", "width": 1, "color":{"red":0,"green":0,"blue":0}}
-                        }
-                    })
-                # 1번 섹션 A14:G30 => row=13..30, col=0..7
-                add_dotted_borders(13, row_cursor_sum1, 1, 7)
-                # 2번 섹션 
-                add_dotted_borders(row_cursor_album, row_cursor_sum2, 1, 7)
-                # 3번 섹션 
-                add_dotted_borders(row_cursor_deduction, row_cursor_sum3-1, 1, 7)
-                # 4번 섹션 
-                add_dotted_borders(row_cursor_rate, row_cursor_sum4+1, 1, 7)
-                
-
-                # (P) 시트 외곽 검정 SOLID 
-                report_requests.append({
-                    "updateBorders": {
-                        "range": {
-                            "sheetId": ws_report_id,
-                            "startRowIndex": 0,
-                            "endRowIndex": row_cursor_report_end,
-                            "startColumnIndex": 0,
-                            "endColumnIndex": 8
-                        },
-                        "top":    {"style": "SOLID","width":1, "color":{"red":0,"green":0,"blue":0}},
-                        "bottom": {"style": "SOLID","width":1, "color":{"red":0,"green":0,"blue":0}},
-                        "left":   {"style": "SOLID","width":1, "color":{"red":0,"green":0,"blue":0}},
-                        "right":  {"style": "SOLID","width":1, "color":{"red":0,"green":0,"blue":0}}
-                        # innerHorizontal, innerVertical는 생략 => 기존 값 유지
-                    }
-                })
-                
-                all_requests.extend(report_requests)
-
-
-                # batchUpdate 분할 전송
-                if len(all_requests) >= 200:
-                    sheet_svc.spreadsheets().batchUpdate(
-                        spreadsheetId=out_file_id,
-                        body={"requests": all_requests}
-                    ).execute()
-                    all_requests.clear()
-                    time.sleep(1)
-
-            #-------------------------------------------------------------------------
-            # FLUXUS 소속 처리
-            #-------------------------------------------------------------------------
-            elif one_sosok == "FLUXUS":
-                # 진행률
-                ratio = (i + 1) / len(all_artists)
-                progress_bar.progress(ratio)
-                artist_placeholder.info(f"[{i+1}/{len(all_artists)}] '{artist}' 처리 중...")
-
-                # ##########################
-                # (1) FLUXUS 세부매출내역 탭
-                # ##########################
-                ws_fluxus_detail = out_sh.worksheet(f"{one_sosok}_{artist}(세부매출내역)")
-                fluxus_yt_details = fluxus_yt_dict[artist]
-                fluxus_fs_details = fluxus_song_dict[artist]
-                fluxus_yt_details_sorted = sorted(fluxus_yt_details, key=lambda d: album_sort_key(d["album"]))
-                fluxus_fs_details_sorted = sorted(fluxus_fs_details, key=lambda d: album_sort_key(d["album"]))
-
-                fluxus_detail_matrix = []
-                fluxus_detail_matrix.append(["앨범아티스트","앨범명","트랙 No.","트랙명","트랙 ID","기간","매출 순수익"])
-
-                total_det = 0
-                for d in fluxus_yt_details_sorted:
-                    fy_rv_val = d["revenue"]
-                    total_det += fy_rv_val
-                    fluxus_detail_matrix.append([
-                        artist,
-                        d["album"],
-                        d["track_number"],
-                        d["track_title"],
-                        d["track_id"],
-                        f"{year_val}년 {month_val}월",
-                        to_currency(fy_rv_val)
-                    ])
-
-
-                # 합계
-                fluxus_detail_matrix.append(["합계","","","","","", to_currency(total_det)])
-                row_cursor_fluxus_detail_end = len(fluxus_detail_matrix)
-
-                # 시트 업데이트
-                ws_fluxus_detail.update(range_name="A1", values=fluxus_detail_matrix)
-                time.sleep(1)
-
-                # 세부매출내역 탭에 대한 서식/테두리 등 batch 요청
-                fluxus_detail_requests = []
-                sheet_id_fluxus_detail = ws_fluxus_detail.id
-
-                # (A) 시트 크기(row_cursor_detail_end, 7열)
-                fluxus_detail_requests.append({
-                    "updateSheetProperties": {
-                        "properties": {
-                            "sheetId": sheet_id_fluxus_detail,
-                            "gridProperties": {
-                                "rowCount": row_cursor_fluxus_detail_end,
-                                "columnCount": 7
-                            }
-                        },
-                        "fields": "gridProperties(rowCount,columnCount)"
-                    }
-                })
-
-                # (B) 열너비 설정 (A=0, B=1, ...)
-                # 예: A열(0) → 140, B열(1) → 140, E열(4) → 120
-                fluxus_detail_requests.extend([
-                    {
-                        "updateDimensionProperties": {
-                            "range": {
-                                "sheetId": sheet_id_fluxus_detail,
-                                "dimension": "COLUMNS",
-                                "startIndex": 0, 
-                                "endIndex": 1
-                            },
-                            "properties": {"pixelSize": 140},
-                            "fields": "pixelSize"
-                        }
-                    },
-                    {
-                        "updateDimensionProperties": {
-                            "range": {
-                                "sheetId": sheet_id_fluxus_detail,
-                                "dimension": "COLUMNS",
-                                "startIndex": 1,
-                                "endIndex": 2
-                            },
-                            "properties": {"pixelSize": 160},
-                            "fields": "pixelSize"
-                        }
-                    },
-                    {
-                        "updateDimensionProperties": {
-                            "range": {
-                                "sheetId": sheet_id_fluxus_detail,
-                                "dimension": "COLUMNS",
-                                "startIndex": 2,
-                                "endIndex": 3
-                            },
-                            "properties": {"pixelSize": 100},
-                            "fields": "pixelSize"
-                        }
-                    },
-                                        {
-                        "updateDimensionProperties": {
-                            "range": {
-                                "sheetId": sheet_id_fluxus_detail,
-                                "dimension": "COLUMNS",
-                                "startIndex": 3,
-                                "endIndex": 4
-                            },
-                            "properties": {"pixelSize": 160},
-                            "fields": "pixelSize"
-                        }
-                    },
-                                        {
-                        "updateDimensionProperties": {
-                            "range": {
-                                "sheetId": sheet_id_fluxus_detail,
-                                "dimension": "COLUMNS",
-                                "startIndex": 4,
-                                "endIndex": 5
-                            },
-                            "properties": {"pixelSize": 100},
-                            "fields": "pixelSize"
-                        }
-                    },
-                                        {
-                        "updateDimensionProperties": {
-                            "range": {
-                                "sheetId": sheet_id_fluxus_detail,
-                                "dimension": "COLUMNS",
-                                "startIndex": 5,
-                                "endIndex": 6
-                            },
-                            "properties": {"pixelSize": 120},
-                            "fields": "pixelSize"
-                        }
-                    },
-                                        {
-                        "updateDimensionProperties": {
-                            "range": {
-                                "sheetId": sheet_id_fluxus_detail,
-                                "dimension": "COLUMNS",
-                                "startIndex": 6,
-                                "endIndex": 7
-                            },
-                            "properties": {"pixelSize": 140},
-                            "fields": "pixelSize"
-                        }
-                    }
-                ])
-
-                # (C) 헤더(A1~G1) 포맷
-                fluxus_detail_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": sheet_id_fluxus_detail,
-                            "startRowIndex": 0,
-                            "endRowIndex": 1,
-                            "startColumnIndex": 0,
-                            "endColumnIndex": 7
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "backgroundColor": {"red": 0.3, "green": 0.82, "blue": 0.88},
-                                "horizontalAlignment": "CENTER",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "bold": True,
-                                    "foregroundColor": {"red":0,"green":0,"blue":0}
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(backgroundColor,horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
-
-                # (D) 합계행 병합 + 서식
-                sum_row_0based = row_cursor_fluxus_detail_end - 1
-                fluxus_detail_requests.append({
-                    "mergeCells": {
-                        "range": {
-                            "sheetId": sheet_id_fluxus_detail,
-                            "startRowIndex": sum_row_0based,
-                            "endRowIndex": sum_row_0based+1,
-                            "startColumnIndex": 0,
-                            "endColumnIndex": 6
-                        },
-                        "mergeType": "MERGE_ALL"
-                    }
-                })
-                fluxus_detail_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": sheet_id_fluxus_detail,
-                            "startRowIndex": sum_row_0based,
-                            "endRowIndex": sum_row_0based+1,
-                            "startColumnIndex": 0,
-                            "endColumnIndex": 6
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "backgroundColor": {"red": 0.3, "green": 0.82, "blue": 0.88},
-                                "horizontalAlignment": "CENTER",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {"bold": True}
-                            }
-                        },
-                        "fields": "userEnteredFormat(backgroundColor,horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
-                # 합계값(G열)에 오른쪽 정렬
-                fluxus_detail_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": sheet_id_fluxus_detail,
-                            "startRowIndex": sum_row_0based,
-                            "endRowIndex": sum_row_0based+1,
-                            "startColumnIndex": 6,
-                            "endColumnIndex": 7
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "horizontalAlignment": "RIGHT",
-                                "textFormat": {"bold": True}
-                            }
-                        },
-                        "fields": "userEnteredFormat(horizontalAlignment,textFormat)"
-                    }
-                })
-                # 매출 순수익 칼럼 (F열=idx=6) 나머지 행들
-                fluxus_detail_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": sheet_id_fluxus_detail,
-                            "startRowIndex": 1,
-                            "endRowIndex": sum_row_0based,
-                            "startColumnIndex": 6,
-                            "endColumnIndex": 7
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "horizontalAlignment": "RIGHT"
-                            }
-                        },
-                        "fields": "userEnteredFormat(horizontalAlignment)"
-                    }
-                })
-
-                # (E) 전체 테두리
-                fluxus_detail_requests.append({
-                    "updateBorders": {
-                        "range": {
-                            "sheetId": sheet_id_fluxus_detail,
-                            "startRowIndex": 0,
-                            "endRowIndex": row_cursor_fluxus_detail_end,
-                            "startColumnIndex": 0,
-                            "endColumnIndex": 7
-                        },
-                        "top":    {"style":"SOLID","width":1},
-                        "bottom": {"style":"SOLID","width":1},
-                        "left":   {"style":"SOLID","width":1},
-                        "right":  {"style":"SOLID","width":1},
-                        "innerHorizontal": {"style":"SOLID","width":1},
-                        "innerVertical":   {"style":"SOLID","width":1}
-                    }
-                })
+                # (D) 합계행 병합 + 서식
+                sum_row_0based = row_cursor_fluxus_detail_end - 1
+                add_merge(fluxus_detail_requests, sheet_id_fluxus_detail, sum_row_0based, sum_row_0based+1, 0, 6)
+                add_repeat(fluxus_detail_requests, gr(sum_row_0based, sum_row_0based+1, 0, 6), FMT_DETAIL_SUM_CYAN)
+                # 합계값(G열)에 오른쪽 정렬
+                add_repeat(fluxus_detail_requests, gr(sum_row_0based, sum_row_0based+1, 6, 7), FMT_DETAIL_SUM_VALUE)
+                # 매출 순수익 칼럼 (F열=idx=6) 나머지 행들
+                add_repeat(fluxus_detail_requests, gr(1, sum_row_0based, 6, 7), FMT_DETAIL_VALUE)
 
-                all_requests.extend(fluxus_detail_requests)
+                # (E) 전체 테두리
+                fluxus_detail_requests.append(make_borders(gr(0, row_cursor_fluxus_detail_end, 0, 7), BORDER_SOLID))
 
-                # (호출 횟수 분할) 1회 batchUpdate 요청이 너무 커지면 나눠서 전송
-                if len(all_requests) >= 200:
-                    sheet_svc.spreadsheets().batchUpdate(
-                        spreadsheetId=out_file_id,
-                        body={"requests": all_requests}
-                    ).execute()
-                    all_requests.clear()
-                    time.sleep(1)
+                # 요청 누적 (전송은 루프가 끝난 뒤 한 번에)
+                all_requests.extend(compact_requests(fluxus_detail_requests))
             
 
                 # ################################
                 # FLUXUS 정산서 탭 (batchUpdate 방식)
                 # ################################
-                ws_fluxus_report = out_sh.worksheet(f"{one_sosok}_{artist}(정산서)")
+                ws_fluxus_report = out_ws_by_title[f"{one_sosok}_{artist}(정산서)"]
                 ws_fluxus_report_id = ws_fluxus_report.id
 
                 # 매출 합
@@ -3747,9 +3147,20 @@ def generate_report(
                 # --------------------------------------
                 # 정산서 테이블(직접 row col 배열 채우기)
                 # --------------------------------------
-                report_fluxus_matrix = []
-                for _ in range(300):
-                    report_fluxus_matrix.append([""] * 7)
+                # 1번 표 본문 = 유튜브 트랙 행 + 앨범별 "국내, 해외 플랫폼" 합계 1행
+                #  -> 표 위치(행)를 먼저 계산해서 필요한 행 수만큼만 배열 생성
+                n_service_rows = len(fluxus_yt_details_sorted) + len({d["album"] for d in fluxus_yt_details_sorted})
+                cursors = compute_report_cursors(n_service_rows, len(fluxus_album_sum))
+                row_cursor_sum1 = cursors["sum1"]
+                row_cursor_album = cursors["album"]
+                row_cursor_sum2 = cursors["sum2"]
+                row_cursor_deduction = cursors["deduction"]
+                row_cursor_sum3 = cursors["sum3"]
+                row_cursor_rate = cursors["rate"]
+                row_cursor_sum4 = cursors["sum4"]
+                row_cursor_report_end = cursors["report_end"]
+
+                report_fluxus_matrix = [[""] * 7 for _ in range(row_cursor_report_end)]
 
                 # 1) 상단 공통정보
                 report_fluxus_matrix[1][5] = report_date   # 보고서 발행일
@@ -3777,9 +3188,6 @@ def generate_report(
 
                 row_cursor = header_row_1 + 1
 
-                import itertools
-                fluxus_yt_details_sorted = sorted(fluxus_yt_details, key=lambda d: album_sort_key(d["album"]))
-
                 # (2) groupby
                 for alb, grp_iter in itertools.groupby(fluxus_yt_details_sorted, key=lambda x: x["album"]):
                     track_list = list(grp_iter)
@@ -3806,58 +3214,45 @@ def generate_report(
 
                 distinct_albums = set(d["album"] for d in fluxus_fs_details_sorted)
                 album_count = len(distinct_albums)
-                
-                row_cursor += 2
-                # 합계
-                report_fluxus_matrix[row_cursor-1][1] = "합계"
-                report_fluxus_matrix[row_cursor-1][5] = to_currency(fluxus_sum_all)
-                row_cursor_sum1 = row_cursor
-                row_cursor += 1
+
+                # 합계 (본문 다음 빈 행 1개 뒤)
+                report_fluxus_matrix[row_cursor_sum1-1][1] = "합계"
+                report_fluxus_matrix[row_cursor_sum1-1][5] = to_currency(fluxus_sum_all)
 
                 # -----------------------------------------------------------------
                 # 2. 앨범 별 정산 내역
                 # -----------------------------------------------------------------
-                report_fluxus_matrix[row_cursor][0] = "2."
-                report_fluxus_matrix[row_cursor][1] = "앨범 별 정산 내역"
-                row_cursor += 1
-                row_cursor_album = row_cursor
-                report_fluxus_matrix[row_cursor][1] = "앨범"
-                report_fluxus_matrix[row_cursor][4] = "기간"
-                report_fluxus_matrix[row_cursor][5] = "매출액"
-                row_cursor += 1
-
-                start_album_data = row_cursor
-                for alb in sorted(fluxus_album_sum.keys(), key=album_sort_key):
+                report_fluxus_matrix[row_cursor_album-1][0] = "2."
+                report_fluxus_matrix[row_cursor_album-1][1] = "앨범 별 정산 내역"
+                report_fluxus_matrix[row_cursor_album][1] = "앨범"
+                report_fluxus_matrix[row_cursor_album][4] = "기간"
+                report_fluxus_matrix[row_cursor_album][5] = "매출액"
+
+                start_album_data = row_cursor_album + 1
+                end_album_data = row_cursor_sum2 - 1  # 데이터 마지막 +1
+                for row_idx, alb in enumerate(sorted(fluxus_album_sum.keys(), key=album_sort_key), start=start_album_data):
                     amt = fluxus_album_sum[alb]
-                    report_fluxus_matrix[row_cursor][1] = alb
-                    report_fluxus_matrix[row_cursor][4] = f"{year_val}년 {month_val}월"
-                    report_fluxus_matrix[row_cursor][5] = to_currency(amt)
-                    row_cursor += 1
+                    report_fluxus_matrix[row_idx][1] = alb
+                    report_fluxus_matrix[row_idx][4] = f"{year_val}년 {month_val}월"
+                    report_fluxus_matrix[row_idx][5] = to_currency(amt)
 
-                end_album_data = row_cursor  # 데이터 마지막 +1
-
-                row_cursor += 1
-                report_fluxus_matrix[row_cursor-1][1] = "합계"
-                report_fluxus_matrix[row_cursor-1][5] = to_currency(fluxus_sum_all)
-                row_cursor_sum2 = row_cursor
-                row_cursor += 1
+                report_fluxus_matrix[row_cursor_sum2-1][1] = "합계"
+                report_fluxus_matrix[row_cursor_sum2-1][5] = to_currency(fluxus_sum_all)
 
 
                 # -----------------------------------------------------------------
                 # 3. 공제 내역
                 #    (요청사항: '곡비' 칼럼 = (전월 잔액 + 당월 발생액))
                 # -----------------------------------------------------------------
-                report_fluxus_matrix[row_cursor][0] = "3."
-                report_fluxus_matrix[row_cursor][1] = "공제 내역"
-                row_cursor += 1
-                row_cursor_deduction = row_cursor
-
-                report_fluxus_matrix[row_cursor][1] = "앨범"
-                report_fluxus_matrix[row_cursor][2] = "곡비"
-                report_fluxus_matrix[row_cursor][3] = "공제 금액"
-                report_fluxus_matrix[row_cursor][4] = "공제 후 남은 곡비"
-                report_fluxus_matrix[row_cursor][5] = "공제 적용 금액"
-                row_cursor += 1
+                report_fluxus_matrix[row_cursor_deduction-1][0] = "3."
+                report_fluxus_matrix[row_cursor_deduction-1][1] = "공제 내역"
+
+                report_fluxus_matrix[row_cursor_deduction][1] = "앨범"
+                report_fluxus_matrix[row_cursor_deduction][2] = "곡비"
+                report_fluxus_matrix[row_cursor_deduction][3] = "공제 금액"
+                report_fluxus_matrix[row_cursor_deduction][4] = "공제 후 남은 곡비"
+                report_fluxus_matrix[row_cursor_deduction][5] = "공제 적용 금액"
+                row_cursor = row_cursor_deduction + 1
 
                 # 앨범(들)을 표기만 할지, 혹은 여러줄로 표현할지 등은 업무 규칙에 따라
                 alb_list = sorted(fluxus_album_sum.keys(), key=album_sort_key)
@@ -3872,39 +3267,29 @@ def generate_report(
                 report_fluxus_matrix[row_cursor][4] = to_currency(remain_val)
                 # 공제 적용 금액 (매출 - 공제금액)
                 report_fluxus_matrix[row_cursor][5] = to_currency(fluxus_sum_all - deduct_val)
-                row_cursor += 2
-                row_cursor_sum3 = row_cursor
 
                 # -----------------------------------------------------------------
                 # 4. 수익 배분
                 # -----------------------------------------------------------------
-                report_fluxus_matrix[row_cursor][0] = "4."
-                report_fluxus_matrix[row_cursor][1] = "수익 배분"
-                row_cursor += 1
-                row_cursor_rate = row_cursor
-                report_fluxus_matrix[row_cursor][1] = "앨범"
-                report_fluxus_matrix[row_cursor][2] = "항목"
-                report_fluxus_matrix[row_cursor][3] = "적용율"
-                report_fluxus_matrix[row_cursor][5] = "적용 금액"
-                row_cursor += 1
+                report_fluxus_matrix[row_cursor_sum3][0] = "4."
+                report_fluxus_matrix[row_cursor_sum3][1] = "수익 배분"
+                report_fluxus_matrix[row_cursor_rate][1] = "앨범"
+                report_fluxus_matrix[row_cursor_rate][2] = "항목"
+                report_fluxus_matrix[row_cursor_rate][3] = "적용율"
+                report_fluxus_matrix[row_cursor_rate][5] = "적용 금액"
 
-                report_fluxus_matrix[row_cursor][1] = alb_str
-                report_fluxus_matrix[row_cursor][2] = "수익 배분율"
-                report_fluxus_matrix[row_cursor][3] = f"{int(rate_val)}%"
-                report_fluxus_matrix[row_cursor][5] = to_currency(final_amount)
-                row_cursor += 1
+                report_fluxus_matrix[row_cursor_rate+1][1] = alb_str
+                report_fluxus_matrix[row_cursor_rate+1][2] = "수익 배분율"
+                report_fluxus_matrix[row_cursor_rate+1][3] = f"{int(rate_val)}%"
+                report_fluxus_matrix[row_cursor_rate+1][5] = to_currency(final_amount)
 
-                report_fluxus_matrix[row_cursor][1] = "총 정산금액"
-                report_fluxus_matrix[row_cursor][5] = to_currency(final_amount)
-                row_cursor_sum4 = row_cursor
-                row_cursor += 2
+                report_fluxus_matrix[row_cursor_sum4][1] = "총 정산금액"
+                report_fluxus_matrix[row_cursor_sum4][5] = to_currency(final_amount)
 
-                report_fluxus_matrix[row_cursor][5] = "* 부가세 별도"
-                row_cursor_report_end = row_cursor + 2
+                report_fluxus_matrix[row_cursor_sum4+2][5] = "* 부가세 별도"
 
                 # 시트에 실제 업로드
-                ws_fluxus_report.update(range_name="A1", values=report_fluxus_matrix)
-                time.sleep(1)
+                value_data.append({"range": sheet_range(ws_fluxus_report.title, "A1"), "values": report_fluxus_matrix})
 
                 # ------------------------------------
                 # (검증) check_dict에 비교결과 반영
@@ -3999,1145 +3384,59 @@ def generate_report(
                 }
                 check_dict["details_verification"]["정산서"].append(row_report_item_4)
 
-                time.sleep(1)   
 
                 # --------------------------------------------------
                 # 정산서 탭(디자인/서식) batchUpdate
                 # --------------------------------------------------
-                report_fluxus_requests = []
-
-                # (A) 시트 row/col 크기
-                report_fluxus_requests.append({
-                    "updateSheetProperties": {
-                        "properties": {
-                            "sheetId": ws_fluxus_report_id,
-                            "gridProperties": {
-                                "rowCount": row_cursor_report_end,
-                                "columnCount": 7
-                            }
-                        },
-                        "fields": "gridProperties(rowCount,columnCount)"
-                    }
-                })
-
-                # (B) 열너비 (A=0 ~ H=7)
-                report_fluxus_requests.extend([
-                    {
-                        "updateDimensionProperties": {
-                            "range": {
-                                "sheetId": ws_fluxus_report_id,
-                                "dimension": "COLUMNS",
-                                "startIndex": 0,
-                                "endIndex": 1
-                            },
-                            "properties": {"pixelSize": 40},
-                            "fields": "pixelSize"
-                        }
-                    },
-                    {
-                        "updateDimensionProperties": {
-                            "range": {
-                                "sheetId": ws_fluxus_report_id,
-                                "dimension": "COLUMNS",
-                                "startIndex": 1,
-                                "endIndex": 2
-                            },
-                            "properties": {"pixelSize": 180},
-                            "fields": "pixelSize"
-                        }
-                    },
-                    {
-                        "updateDimensionProperties": {
-                            "range": {
-                                "sheetId": ws_fluxus_report_id,
-                                "dimension": "COLUMNS",
-                                "startIndex": 2,
-                                "endIndex": 3
-                            },
-                            "properties": {"pixelSize": 160},
-                            "fields": "pixelSize"
-                        }
-                    },
-                    {
-                        "updateDimensionProperties": {
-                            "range": {
-                                "sheetId": ws_fluxus_report_id,
-                                "dimension": "COLUMNS",
-                                "startIndex": 3,
-                                "endIndex": 4
-                            },
-                            "properties": {"pixelSize": 140},
-                            "fields": "pixelSize"
-                        }
-                    },
-                    {
-                        "updateDimensionProperties": {
-                            "range": {
-                                "sheetId": ws_fluxus_report_id,
-                                "dimension": "COLUMNS",
-                                "startIndex": 4,
-                                "endIndex": 5
-                            },
-                            "properties": {"pixelSize": 150},
-                            "fields": "pixelSize"
-                        }
-                    },
-                    {
-                        "updateDimensionProperties": {
-                            "range": {
-                                "sheetId": ws_fluxus_report_id,
-                                "dimension": "COLUMNS",
-                                "startIndex": 5,
-                                "endIndex": 6
-                            },
-                            "properties": {"pixelSize": 160},
-                            "fields": "pixelSize"
-                        }
-                    },
-                    {
-                        "updateDimensionProperties": {
-                            "range": {
-                                "sheetId": ws_fluxus_report_id,
-                                "dimension": "COLUMNS",
-                                "startIndex": 6,
-                                "endIndex": 7
-                            },
-                            "properties": {"pixelSize": 40},
-                            "fields": "pixelSize"
-                        }
-                    },
-                ])
-
-                # (C) 특정행 높이
-                report_fluxus_requests.extend([
-                    {
-                        "updateDimensionProperties": {
-                            "range": {
-                                "sheetId": ws_fluxus_report_id,
-                                "dimension": "ROWS",
-                                "startIndex": 3,
-                                "endIndex": 4
-                            },
-                            "properties": {"pixelSize": 30},
-                            "fields": "pixelSize"
-                        }
-                    },
-                    {
-                        "updateDimensionProperties": {
-                            "range": {
-                                "sheetId": ws_fluxus_report_id,
-                                "dimension": "ROWS",
-                                "startIndex": 5,
-                                "endIndex": 6
-                            },
-                            "properties": {"pixelSize": 30},
-                            "fields": "pixelSize"
-                        }
-                    },
-                ])
-
-                # (D) 상단 고정 항목(발행 날짜, H2: row=1, col=6)
-                report_fluxus_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_fluxus_report_id,
-                            "startRowIndex": 1,
-                            "endRowIndex": 2,
-                            "startColumnIndex": 5,
-                            "endColumnIndex": 6
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "horizontalAlignment": "RIGHT",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "fontFamily": "Malgun Gothic",
-                                    "fontSize": 10,
-                                    "bold": False
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })        
-
-                # (E) 상단 고정 항목(판매분, B4:E4)
-                report_fluxus_requests.append({
-                    "mergeCells": {
-                        "range": {
-                            "sheetId": ws_fluxus_report_id,
-                            "startRowIndex": 3,  # (4-1)
-                            "endRowIndex": 4,
-                            "startColumnIndex": 1,  # (B=1)
-                            "endColumnIndex": 4     # (E=4 => endIndex=5)
-                        },
-                        "mergeType": "MERGE_ALL"
-                    }
-                })
-                report_fluxus_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_fluxus_report_id,
-                            "startRowIndex": 3,
-                            "endRowIndex": 4,
-                            "startColumnIndex": 1,
-                            "endColumnIndex": 4
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "horizontalAlignment": "LEFT",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "fontFamily": "Malgun Gothic",
-                                    "fontSize": 15,
-                                    "bold": True
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
-
-                # (F) 상단 고정 항목(아티스트 정산내역서, B6:G6)
-                report_fluxus_requests.append({
-                    "mergeCells": {
-                        "range": {
-                            "sheetId": ws_fluxus_report_id,
-                            "startRowIndex": 5,
-                            "endRowIndex": 6,
-                            "startColumnIndex": 1,
-                            "endColumnIndex": 6
-                        },
-                        "mergeType": "MERGE_ALL"
-                    }
-                })
-                report_fluxus_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_fluxus_report_id,
-                            "startRowIndex": 5,
-                            "endRowIndex": 6,
-                            "startColumnIndex": 1,
-                            "endColumnIndex": 6
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "backgroundColor": {"red": 0.896, "green": 0.988, "blue": 1},
-                                "horizontalAlignment": "CENTER",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "fontFamily": "Malgun Gothic",
-                                    "fontSize": 15,
-                                    "bold": True
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(backgroundColor,horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
-
-                # (G) 상단 고정 항목(안내문, B8:E8~B10:E10)
-                #8행
-                report_fluxus_requests.append({
-                    "mergeCells": {
-                        "range": {
-                            "sheetId": ws_fluxus_report_id,
-                            "startRowIndex": 7,  # (4-1)
-                            "endRowIndex": 8,
-                            "startColumnIndex": 1,  # (B=1)
-                            "endColumnIndex": 4     # (E=4 => endIndex=5)
-                        },
-                        "mergeType": "MERGE_ALL"
-                    }
-                })
-                report_fluxus_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_fluxus_report_id,
-                            "startRowIndex": 7,  # (4-1)
-                            "endRowIndex": 8,
-                            "startColumnIndex": 1,  # (B=1)
-                            "endColumnIndex": 4     # (E=4 => endIndex=5)
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "horizontalAlignment": "LEFT",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "bold": False
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
-                #9행
-                report_fluxus_requests.append({
-                    "mergeCells": {
-                        "range": {
-                            "sheetId": ws_fluxus_report_id,
-                            "startRowIndex": 8,  
-                            "endRowIndex": 9,
-                            "startColumnIndex": 1,
-                            "endColumnIndex": 4 
-                        },
-                        "mergeType": "MERGE_ALL"
-                    }
-                })
-                report_fluxus_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_fluxus_report_id,
-                            "startRowIndex": 8,  
-                            "endRowIndex": 9,
-                            "startColumnIndex": 1,
-                            "endColumnIndex": 4 
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "horizontalAlignment": "LEFT",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                "bold": False
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
-                #10행
-                report_fluxus_requests.append({
-                    "mergeCells": {
-                        "range": {
-                            "sheetId": ws_fluxus_report_id,
-                            "startRowIndex": 9,  
-                            "endRowIndex": 10,
-                            "startColumnIndex": 1,
-                            "endColumnIndex": 4 
-                        },
-                        "mergeType": "MERGE_ALL"
-                    }
-                })
-                report_fluxus_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_fluxus_report_id,
-                            "startRowIndex": 9,  
-                            "endRowIndex": 10,
-                            "startColumnIndex": 1,
-                            "endColumnIndex": 4 
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "horizontalAlignment": "LEFT",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "bold": False
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
-                # 10행 (E-Mail 칸)
-                report_fluxus_requests.append({
-                    "mergeCells": {
-                        "range": {
-                            "sheetId": ws_fluxus_report_id,
-                            "startRowIndex": 9,  
-                            "endRowIndex": 10,
-                            "startColumnIndex": 4,
-                            "endColumnIndex": 6 
-                        },
-                        "mergeType": "MERGE_ALL"
-                    }
-                })
-                report_fluxus_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_fluxus_report_id,
-                            "startRowIndex": 9,
-                            "endRowIndex": 10,
-                            "startColumnIndex": 4,
-                            "endColumnIndex": 6
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "horizontalAlignment": "RIGHT",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "foregroundColor": {"red": 0.29, "green": 0.53, "blue": 0.91},
-                                    "fontFamily": "Malgun Gothic",
-                                    "fontSize": 10,
-                                    "bold": True
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
-                
-                # (H) 1열 정렬 (번호 영역)
-                report_fluxus_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_fluxus_report_id,
-                            "startRowIndex": 1,
-                            "endRowIndex": row_cursor_rate+1,
-                            "startColumnIndex": 0,
-                            "endColumnIndex": 1
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "horizontalAlignment": "CENTER",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "fontFamily": "Malgun Gothic",
-                                    "fontSize": 10,
-                                    "bold": False
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
-
-                # (I) 하단 고정 항목(부가세, G)
-                report_fluxus_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_fluxus_report_id,
-                            "startRowIndex": row_cursor_report_end-2,
-                            "endRowIndex": row_cursor_report_end,
-                            "startColumnIndex": 5,
-                            "endColumnIndex": 6
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "horizontalAlignment": "RIGHT",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "fontFamily": "Malgun Gothic",
-                                    "fontSize": 10,
-                                    "bold": False
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                }) 
-            
-
-                # (J-1) "음원 서비스별 정산내역" 표 타이틀
-                report_fluxus_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_fluxus_report_id,
-                            "startRowIndex": 12,  # (4-1)
-                            "endRowIndex": 13,
-                            "startColumnIndex": 1,  # (B=1)
-                            "endColumnIndex": 2     # (E=4 => endIndex=5)
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "horizontalAlignment": "LEFT",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "bold": True
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
-                # (J-2) "음원 서비스별 정산내역" 표 헤더 (Row=13)
-                report_fluxus_requests.append({
-                    "mergeCells": {
-                        "range": {
-                            "sheetId": ws_fluxus_report_id,
-                            "startRowIndex": 13,
-                            "endRowIndex": 14,
-                            "startColumnIndex": 2,
-                            "endColumnIndex": 4
-                        },
-                        "mergeType": "MERGE_ALL"
-                    }
-                })
-                report_fluxus_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_fluxus_report_id,
-                            "startRowIndex": 13,
-                            "endRowIndex": 14,
-                            "startColumnIndex": 1,
-                            "endColumnIndex": 6
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "backgroundColor": {"red": 0.3, "green": 0.82, "blue": 0.88},
-                                "horizontalAlignment": "CENTER",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "fontFamily": "Malgun Gothic",
-                                    "fontSize": 10,
-                                    "bold": True
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(backgroundColor,horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
-                # (J-3) 합계행 전 병합
-                report_fluxus_requests.append({
-                    "mergeCells": {
-                        "range": {
-                            "sheetId": ws_fluxus_report_id,
-                            "startRowIndex": row_cursor_sum1-2,
-                            "endRowIndex": row_cursor_sum1-1,
-                            "startColumnIndex": 1,
-                            "endColumnIndex": 6
-                        },
-                        "mergeType": "MERGE_ALL"
-                    }
-                })
-                # (J-4) 합계행 병합
-                report_fluxus_requests.append({
-                    "mergeCells": {
-                        "range": {
-                            "sheetId": ws_fluxus_report_id,
-                            "startRowIndex": row_cursor_sum1-1,
-                            "endRowIndex": row_cursor_sum1,
-                            "startColumnIndex": 1,
-                            "endColumnIndex": 5
-                        },
-                        "mergeType": "MERGE_ALL"
-                    }
-                })
-                report_fluxus_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_fluxus_report_id,
-                            "startRowIndex": row_cursor_sum1-1,
-                            "endRowIndex": row_cursor_sum1,
-                            "startColumnIndex": 1,
-                            "endColumnIndex": 5
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "backgroundColor": {"red": 0.896, "green": 0.988, "blue": 1},
-                                "horizontalAlignment": "CENTER",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "fontFamily": "Malgun Gothic",
-                                    "fontSize": 10,
-                                    "bold": True
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(backgroundColor,horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
-                report_fluxus_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_fluxus_report_id,
-                            "startRowIndex": row_cursor_sum1-1,
-                            "endRowIndex": row_cursor_sum1,
-                            "startColumnIndex": 5,
-                            "endColumnIndex": 6
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "backgroundColor": {"red": 0.896, "green": 0.988, "blue": 1},
-                                "horizontalAlignment": "CENTER",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "fontFamily": "Malgun Gothic",
-                                    "fontSize": 10,
-                                    "bold": True
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(backgroundColor,horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
-                # (J-5) 표에 Banding (줄무늬 효과)
-                banding_start_row = 14
-                banding_end_row = row_cursor_sum1 - 2
-                banding_start_col = 1
-                banding_end_col = 6
-                if banding_end_row > banding_start_row:  # 유효범위 체크
-                    report_fluxus_requests.append({
-                        "addBanding": {
-                            "bandedRange": {
-                                "range": {
-                                    "sheetId": ws_fluxus_report_id,
-                                    "startRowIndex": banding_start_row,
-                                    "endRowIndex": banding_end_row,
-                                    "startColumnIndex": banding_start_col,
-                                    "endColumnIndex": banding_end_col
-                                },
-                                "rowProperties": {
-                                    "firstBandColor": {
-                                        "red": 1.0, "green": 1.0, "blue": 1.0
-                                    },
-                                    "secondBandColor": {
-                                        "red": 0.896, "green": 0.988, "blue": 1
-                                    }
-                                },
-                                
-                            }
-                        }
-                    })
-                    report_fluxus_requests.append({
-                        "repeatCell": {
-                            "range": {
-                                "sheetId": ws_fluxus_report_id,
-                                "startRowIndex": banding_start_row,
-                                "endRowIndex": banding_end_row,
-                                "startColumnIndex": banding_start_col,
-                                "endColumnIndex": banding_end_col
-                            },
-                            "cell": {
-                                "userEnteredFormat": {
-                                    "horizontalAlignment": "CENTER",
-                                    "verticalAlignment": "MIDDLE",
-                                    "textFormat": {
-                                        "fontFamily": "Malgun Gothic",
-                                        "fontSize": 10,
-                                        "bold": False
-                                    }
-                                }
-                            },
-                            "fields": "userEnteredFormat(horizontalAlignment,verticalAlignment,textFormat)"
-                        }
-                    })
-                # (J-6) 표에 C~D열 병합
-                start_service_row = 14
-                end_service_row   = row_cursor_sum1 - 2 
-                for r_idx in range(start_service_row, end_service_row):
-                    report_fluxus_requests.append({
-                        "mergeCells": {
-                            "range": {
-                                "sheetId": ws_fluxus_report_id,
-                                "startRowIndex": r_idx,
-                                "endRowIndex": r_idx+1,
-                                "startColumnIndex": 2,  # C열
-                                "endColumnIndex": 4     # D열+1
-                            },
-                            "mergeType": "MERGE_ALL"
-                        }
-                    })
-
-
-                # (K-1) 앨범별 정산내역 타이틀
-                report_fluxus_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_fluxus_report_id,
-                            "startRowIndex": row_cursor_album-1,
-                            "endRowIndex": row_cursor_album,
-                            "startColumnIndex": 1, 
-                            "endColumnIndex": 2    
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "horizontalAlignment": "LEFT",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "bold": True
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
-                # (K-2) 앨범별 정산내역 헤더
-                report_fluxus_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_fluxus_report_id,
-                            "startRowIndex": row_cursor_album,
-                            "endRowIndex": row_cursor_album+1,
-                            "startColumnIndex": 1,
-                            "endColumnIndex": 6
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "backgroundColor": {"red": 0.3, "green": 0.82, "blue": 0.88},
-                                "horizontalAlignment": "CENTER",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "fontFamily": "Malgun Gothic",
-                                    "fontSize": 10,
-                                    "bold": True
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(backgroundColor,horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
-                report_fluxus_requests.append({
-                    "mergeCells": {
-                        "range": {
-                            "sheetId": ws_fluxus_report_id,
-                            "startRowIndex": row_cursor_album,
-                            "endRowIndex": row_cursor_album+1,
-                            "startColumnIndex": 2,
-                            "endColumnIndex": 4
-                        },
-                        "mergeType": "MERGE_ALL"
-                    }
-                })
-                # (K-3_1) 앨범별 정산내역 표 본문
-                report_fluxus_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_fluxus_report_id,
-                            "startRowIndex": row_cursor_album+1,
-                            "endRowIndex": row_cursor_sum2-1,
-                            "startColumnIndex": 1,
-                            "endColumnIndex": 6
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "horizontalAlignment": "CENTER",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "fontFamily": "Malgun Gothic",
-                                    "fontSize": 10,
-                                    "bold": False
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
-                # (K-3_2) 병합 요청 누적
-                for r_idx in range(start_album_data, end_album_data):
-                    report_fluxus_requests.append({
-                        "mergeCells": {
-                            "range": {
-                                "sheetId": ws_fluxus_report_id,
-                                "startRowIndex": r_idx,
-                                "endRowIndex": r_idx+1,
-                                "startColumnIndex": 2,  # C열
-                                "endColumnIndex": 4     # D열+1
-                            },
-                            "mergeType": "MERGE_ALL"
-                        }
-                    })                
-                
-                # (K-4) 앨범별 정산내역 합계행
-                report_fluxus_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_fluxus_report_id,
-                            "startRowIndex": row_cursor_sum2-1,
-                            "endRowIndex": row_cursor_sum2,
-                            "startColumnIndex": 1,
-                            "endColumnIndex": 6
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "horizontalAlignment": "CENTER",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "fontFamily": "Malgun Gothic",
-                                    "fontSize": 10,
-                                    "bold": True
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
-                # (K-5) 합계행 병합
-                report_fluxus_requests.append({
-                    "mergeCells": {
-                        "range": {
-                            "sheetId": ws_fluxus_report_id,
-                            "startRowIndex": row_cursor_sum2-1,
-                            "endRowIndex": row_cursor_sum2,
-                            "startColumnIndex": 1,
-                            "endColumnIndex": 5
-                        },
-                        "mergeType": "MERGE_ALL"
-                    }
-                })
-                report_fluxus_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_fluxus_report_id,
-                            "startRowIndex": row_cursor_sum2-1,
-                            "endRowIndex": row_cursor_sum2,
-                            "startColumnIndex": 1,
-                            "endColumnIndex": 5
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "backgroundColor": {"red": 0.896, "green": 0.988, "blue": 1},
-                                "horizontalAlignment": "CENTER",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "fontFamily": "Malgun Gothic",
-                                    "fontSize": 10,
-                                    "bold": True
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(backgroundColor,horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
-                report_fluxus_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_fluxus_report_id,
-                            "startRowIndex": row_cursor_sum2-1,
-                            "endRowIndex": row_cursor_sum2,
-                            "startColumnIndex": 5,
-                            "endColumnIndex": 6
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "backgroundColor": {"red": 0.896, "green": 0.988, "blue": 1},
-                                "horizontalAlignment": "CENTER",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "fontFamily": "Malgun Gothic",
-                                    "fontSize": 10,
-                                    "bold": True
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(backgroundColor,horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
-
+                # (템플릿 복제가 아닌 기존 탭이면 고정 서식까지 지정)
+                report_fluxus_requests = build_report_dynamic_requests(
+                    ws_fluxus_report_id, "FLUXUS", cursors,
+                    with_static=f"{one_sosok}_{artist}(정산서)" not in created_titles
+                )
 
-                # (L-1) 공제 내역 타이틀
-                report_fluxus_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_fluxus_report_id,
-                            "startRowIndex": row_cursor_deduction-1,  # (4-1)
-                            "endRowIndex": row_cursor_deduction,
-                            "startColumnIndex": 1,  # (B=1)
-                            "endColumnIndex": 2     # (E=4 => endIndex=5)
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "horizontalAlignment": "LEFT",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "bold": True
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
-                # (L-2) 공제 내역 헤더
-                report_fluxus_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_fluxus_report_id,
-                            "startRowIndex": row_cursor_deduction,
-                            "endRowIndex": row_cursor_deduction+1,
-                            "startColumnIndex": 1,
-                            "endColumnIndex": 6
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "backgroundColor": {"red": 0.3, "green": 0.82, "blue": 0.88},
-                                "horizontalAlignment": "CENTER",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "fontFamily": "Malgun Gothic",
-                                    "fontSize": 10,
-                                    "bold": True
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(backgroundColor,horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
-                # (L-3) 공제 내역 표 본문 (데이터부분)
-                report_fluxus_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_fluxus_report_id,
-                            "startRowIndex": row_cursor_deduction+1,
-                            "endRowIndex": row_cursor_deduction+2,
-                            "startColumnIndex": 1,
-                            "endColumnIndex": 5
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "horizontalAlignment": "CENTER",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "fontFamily": "Malgun Gothic",
-                                    "fontSize": 10,
-                                    "bold": False
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
-                # (L-4) 공제 내역 표 본문 (합계 부분)
-                report_fluxus_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_fluxus_report_id,
-                            "startRowIndex": row_cursor_deduction+1,
-                            "endRowIndex": row_cursor_deduction+2,
-                            "startColumnIndex": 5,
-                            "endColumnIndex": 6
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "horizontalAlignment": "CENTER",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "fontFamily": "Malgun Gothic",
-                                    "fontSize": 10,
-                                    "bold": True
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
+                # 요청 누적 (전송은 루프가 끝난 뒤 한 번에)
+                all_requests.extend(compact_requests(report_fluxus_requests))
+            else:
+                print(f"소속 코드 오류: {one_sosok}")
 
 
-                # (M-1) 수익 배분 타이틀
-                report_fluxus_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_fluxus_report_id,
-                            "startRowIndex": row_cursor_rate-1,
-                            "endRowIndex": row_cursor_rate,
-                            "startColumnIndex": 1,  
-                            "endColumnIndex": 2    
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "horizontalAlignment": "LEFT",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "bold": True
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
-                # (M-2) 수익 배분 헤더
-                report_fluxus_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_fluxus_report_id,
-                            "startRowIndex": row_cursor_rate,
-                            "endRowIndex": row_cursor_rate+1,
-                            "startColumnIndex": 1,
-                            "endColumnIndex": 6
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "backgroundColor": {"red": 0.3, "green": 0.82, "blue": 0.88},
-                                "horizontalAlignment": "CENTER",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "fontFamily": "Malgun Gothic",
-                                    "fontSize": 10,
-                                    "bold": True
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(backgroundColor,horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
-                # (M-3) 수익 배분 표 본문 
-                report_fluxus_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_fluxus_report_id,
-                            "startRowIndex": row_cursor_rate+1,
-                            "endRowIndex": row_cursor_rate+2,
-                            "startColumnIndex": 1,
-                            "endColumnIndex": 6
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "horizontalAlignment": "CENTER",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "fontFamily": "Malgun Gothic",
-                                    "fontSize": 10,
-                                    "bold": False
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
-                # (M-4) 수익 배분 표 합계행 병합
-                report_fluxus_requests.append({
-                    "mergeCells": {
-                        "range": {
-                            "sheetId": ws_fluxus_report_id,
-                            "startRowIndex": row_cursor_sum4,
-                            "endRowIndex": row_cursor_sum4+1,
-                            "startColumnIndex": 1,
-                            "endColumnIndex": 5
-                        },
-                        "mergeType": "MERGE_ALL"
-                    }
-                })
-                report_fluxus_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_fluxus_report_id,
-                            "startRowIndex": row_cursor_sum4,
-                            "endRowIndex": row_cursor_sum4+1,
-                            "startColumnIndex": 1,
-                            "endColumnIndex": 5
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "backgroundColor": {"red": 0.896, "green": 0.988, "blue": 1},
-                                "horizontalAlignment": "CENTER",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "fontFamily": "Malgun Gothic",
-                                    "fontSize": 10,
-                                    "bold": True
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(backgroundColor,horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
-                report_fluxus_requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": ws_fluxus_report_id,
-                            "startRowIndex": row_cursor_sum4,
-                            "endRowIndex": row_cursor_sum4+1,
-                            "startColumnIndex": 5,
-                            "endColumnIndex": 6
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "backgroundColor": {"red": 0.896, "green": 0.988, "blue": 1},
-                                "horizontalAlignment": "CENTER",
-                                "verticalAlignment": "MIDDLE",
-                                "textFormat": {
-                                    "fontFamily": "Malgun Gothic",
-                                    "fontSize": 10,
-                                    "bold": True
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(backgroundColor,horizontalAlignment,verticalAlignment,textFormat)"
-                    }
-                })
+    # ----------------------
+    # 탭 값 쓰기: VALUE_BATCH_RANGES개 범위씩 values.batchUpdate (RAW, 묶음별로 스레드 병렬 전송)
+    # ----------------------
+    sheet_credentials = getattr(getattr(sheet_svc, "_http", None), "credentials", None)
 
+    def _thread_http():
+        # httplib2는 스레드 안전하지 않으므로 작업마다 별도 http 객체
+        return new_authorized_http(sheet_credentials) if sheet_credentials is not None else None
 
-                # (N) 전체 테두리 화이트
-                report_fluxus_requests.append({
-                    "updateBorders": {
-                        "range": {
-                            "sheetId": ws_fluxus_report_id,
-                            "startRowIndex": 0,
-                            "endRowIndex": row_cursor_report_end,
-                            "startColumnIndex": 0,
-                            "endColumnIndex": 7
-                        },
-                        "top":    {"style": "SOLID","width":1, "color":{"red":1,"green":1,"blue":1}},
-                        "bottom": {"style": "SOLID","width":1, "color":{"red":1,"green":1,"blue":1}},
-                        "left":   {"style": "SOLID","width":1, "color":{"red":1,"green":1,"blue":1}},
-                        "right":  {"style": "SOLID","width":1, "color":{"red":1,"green":1,"blue":1}},
-                        "innerHorizontal": {"style":"SOLID","width":1,"color":{"red":1,"green":1,"blue":1}},
-                        "innerVertical":   {"style":"SOLID","width":1,"color":{"red":1,"green":1,"blue":1}}
-                    }
-                })
-                
+    with ThreadPoolExecutor(max_workers=VALUE_WRITE_WORKERS) as value_pool:
+        value_futures = [
+            value_pool.submit(batch_update_values, sheet_svc, out_file_id,
+                              value_data[start:start + VALUE_BATCH_RANGES], "RAW", _thread_http())
+            for start in range(0, len(value_data), VALUE_BATCH_RANGES)
+        ]
 
-                # (O) 표 부분 점선 
-                def add_dotted_borders(r1, r2, c1, c2):
-                    """바깥+안쪽 모두 DOTTED"""
-                    report_fluxus_requests.append({
-                        "updateBorders": {
-                            "range": {
-                                "sheetId": ws_fluxus_report_id,
-                                "startRowIndex": r1,
-                                "endRowIndex": r2,
-                                "startColumnIndex": c1,
-                                "endColumnIndex": c2
-                            },
-                            "top":    {"style": "DOTTED", "width": 1, "color":{"red":0,"green":0,"blue":0}},
-                            "bottom": {"style": "DOTTED", "width": 1, "color":{"red":0,"green":0,"blue":0}},
-                            "left":   {"style": "DOTTED", "width": 1, "color":{"red":0,"green":0,"blue":0}},
-                            "right":  {"style": "DOTTED", "width": 1, "color":{"red":0,"green":0,"blue":0}},
-                            "innerHorizontal": {"style": "DOTTED", "width": 1, "color":{"red":0,"green":0,"blue":0}},
-                            "innerVertical":   {"style": "DOTTED", "width": 1, "color":{"red":0,"green":0,"blue":0}}
-                        }
-                    })
-                # 1번 섹션 A14:G30 => row=13..30, col=0..7
-                add_dotted_borders(13, row_cursor_sum1, 1, 6)
-                # 2번 섹션 
-                add_dotted_borders(row_cursor_album, row_cursor_sum2, 1, 6)
-                # 3번 섹션 
-                add_dotted_borders(row_cursor_deduction, row_cursor_sum3-1, 1, 6)
-                # 4번 섹션 
-                add_dotted_borders(row_cursor_rate, row_cursor_sum4+1, 1, 6)
-                
+        # 정산서 템플릿 탭 삭제 (남은 요청과 함께 전송)
+        for template_id in template_ids.values():
+            all_requests.append({"deleteSheet": {"sheetId": template_id}})
 
-                # (P) 시트 외곽 검정 SOLID 
-                report_fluxus_requests.append({
-                    "updateBorders": {
-                        "range": {
-                            "sheetId": ws_fluxus_report_id,
-                            "startRowIndex": 0,
-                            "endRowIndex": row_cursor_report_end,
-                            "startColumnIndex": 0,
-                            "endColumnIndex": 7
-                        },
-                        "top":    {"style": "SOLID","width":1, "color":{"red":0,"green":0,"blue":0}},
-                        "bottom": {"style": "SOLID","width":1, "color":{"red":0,"green":0,"blue":0}},
-                        "left":   {"style": "SOLID","width":1, "color":{"red":0,"green":0,"blue":0}},
-                        "right":  {"style": "SOLID","width":1, "color":{"red":0,"green":0,"blue":0}}
-                        # innerHorizontal, innerVertical는 생략 => 기존 값 유지
-                    }
-                })
-                
-                all_requests.extend(report_fluxus_requests)
-
-                # batchUpdate 분할 전송
-                if len(all_requests) >= 200:
-                    sheet_svc.spreadsheets().batchUpdate(
-                        spreadsheetId=out_file_id,
-                        body={"requests": all_requests}
-                    ).execute()
-                    all_requests.clear()
-                    time.sleep(1)            
-            else:
-                print(f"소속 코드 오류: {one_sosok}")
+        # ---------------------------
+        # 전체 탭 서식 요청을 한 번에 처리 (시트별로 나눠 병렬 전송, 값 쓰기와 동시에 진행)
+        # ---------------------------
+        if all_requests:
+            send_batch_update(sheet_svc, out_file_id, all_requests)
+            all_requests.clear()
 
+        # 값 쓰기 완료 대기 (실패가 있으면 여기서 예외 전달)
+        for f in value_futures:
+            f.result()
 
-    # ---------------------------
-    # 마지막으로 남은 요청들을 일괄 처리
-    # ---------------------------
-    if all_requests:
-        sheet_svc.spreadsheets().batchUpdate(
-            spreadsheetId=out_file_id,
-            body={"requests": all_requests}
-        ).execute()
-        all_requests.clear()
-    time.sleep(1)
+    # ----------------------
+    # 다음달 탭 복제 (옵션)
+    # ----------------------
+    # 출력 파일 쓰기가 모두 성공한 뒤에만 실행 (중간 실패 후 재실행 시 곡비 파일에 'YYYYMM (2)' 탭 중복 생성 방지)
+    # (곡비 ym 탭 값/탭 목록은 (A)에서 읽어 둔 것을 재사용 - 이번 실행 중 곡비 파일은 수정하지 않음)
+    update_next_month_tab(song_cost_sh, ym, sheet_svc, old_data=data_sc, ws_map=ws_map_sc)
 
     # 루프 끝나면 처리 완료 메시지 (원한다면)
     artist_placeholder.success("모든 아티스트 처리 완료!")
@@ -5145,12 +3444,6 @@ def generate_report(
     # (추가) artist_sosok_dict를 세션 상태에 저장
     st.session_state["artist_sosok_dict"] = artist_sosok_dict
 
-    # ----------------------
-    # 다음달 탭 복제 (옵션)
-    # ----------------------
-    update_next_month_tab(song_cost_sh, ym)
-    time.sleep(1)
-
     # 최종 결과 반환
     return out_file_id
 